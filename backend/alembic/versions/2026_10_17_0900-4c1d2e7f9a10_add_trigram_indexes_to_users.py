@@ -0,0 +1,30 @@
+"""add trigram indexes to users
+
+Revision ID: 4c1d2e7f9a10
+Revises: b3c5d7256c64
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4c1d2e7f9a10'
+down_revision = 'b3c5d7256c64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Trigram GIN indexes let ILIKE '%term%' user search use an index scan
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING gin (email gin_trgm_ops)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_first_name_trgm ON users USING gin (first_name gin_trgm_ops)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_last_name_trgm ON users USING gin (last_name gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_users_last_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_users_first_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_users_email_trgm")
@@ -0,0 +1,72 @@
+"""add denormalized job stats columns to campaigns
+
+Revision ID: 5d2e8f0a1b23
+Revises: 4c1d2e7f9a10
+Create Date: 2026-10-17 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2e8f0a1b23'
+down_revision = '4c1d2e7f9a10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('campaigns', sa.Column('last_activity_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('campaigns', sa.Column('running_jobs_count', sa.Integer(), nullable=False, server_default='0'))
+    op.create_index(op.f('ix_campaigns_last_activity_at'), 'campaigns', ['last_activity_at'], unique=False)
+    
+    # Backfill from existing jobs
+    op.execute("""
+        UPDATE campaigns c SET
+            last_activity_at = s.last_activity_at,
+            running_jobs_count = s.running_jobs_count
+        FROM (
+            SELECT campaign_id,
+                   MAX(COALESCE(completed_at, created_at)) AS last_activity_at,
+                   COUNT(*) FILTER (WHERE status IN ('pending', 'running')) AS running_jobs_count
+            FROM prediction_jobs
+            WHERE campaign_id IS NOT NULL
+            GROUP BY campaign_id
+        ) s
+        WHERE c.id = s.campaign_id
+    """)
+    
+    # Keep the columns in sync on every job insert/delete/state change
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_campaign_job_stats() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.campaign_id IS NOT NULL
+               AND OLD.status IN ('pending', 'running') THEN
+                UPDATE campaigns SET running_jobs_count = running_jobs_count - 1
+                WHERE id = OLD.campaign_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.campaign_id IS NOT NULL THEN
+                UPDATE campaigns SET
+                    running_jobs_count = running_jobs_count
+                        + CASE WHEN NEW.status IN ('pending', 'running') THEN 1 ELSE 0 END,
+                    last_activity_at = GREATEST(last_activity_at, COALESCE(NEW.completed_at, NEW.created_at))
+                WHERE id = NEW.campaign_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_prediction_jobs_campaign_stats
+        AFTER INSERT OR DELETE OR UPDATE OF campaign_id, status, completed_at ON prediction_jobs
+        FOR EACH ROW EXECUTE FUNCTION sync_campaign_job_stats()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_prediction_jobs_campaign_stats ON prediction_jobs")
+    op.execute("DROP FUNCTION IF EXISTS sync_campaign_job_stats()")
+    op.drop_index(op.f('ix_campaigns_last_activity_at'), table_name='campaigns')
+    op.drop_column('campaigns', 'running_jobs_count')
+    op.drop_column('campaigns', 'last_activity_at')
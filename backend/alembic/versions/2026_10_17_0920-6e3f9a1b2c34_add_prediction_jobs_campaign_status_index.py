@@ -0,0 +1,24 @@
+"""add prediction_jobs (campaign_id, status) index
+
+Revision ID: 6e3f9a1b2c34
+Revises: 5d2e8f0a1b23
+Create Date: 2026-10-17 09:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6e3f9a1b2c34'
+down_revision = '5d2e8f0a1b23'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_prediction_jobs_campaign_status', 'prediction_jobs', ['campaign_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_prediction_jobs_campaign_status', table_name='prediction_jobs')
@@ -0,0 +1,43 @@
+"""convert datasets.classes_json and models.metrics_json to jsonb
+
+Revision ID: 7f4a0b2c3d45
+Revises: 6e3f9a1b2c34
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '7f4a0b2c3d45'
+down_revision = '6e3f9a1b2c34'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table, column in (('datasets', 'classes_json'), ('models', 'metrics_json')):
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f"{column}::jsonb"
+        )
+        # Both SQL NULL and JSON null become an empty object before tightening the column
+        op.execute(f"UPDATE {table} SET {column} = '{{}}'::jsonb WHERE {column} IS NULL OR {column} = 'null'::jsonb")
+        op.alter_column(table, column, nullable=False, server_default=sa.text("'{}'::jsonb"))
+    
+    op.create_index('ix_models_metrics_json_gin', 'models', ['metrics_json'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_models_metrics_json_gin', table_name='models', postgresql_using='gin')
+    
+    for table, column in (('models', 'metrics_json'), ('datasets', 'classes_json')):
+        op.alter_column(table, column, nullable=True, server_default=None)
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json"
+        )
@@ -0,0 +1,109 @@
+"""maintain campaign summary counters with triggers
+
+Revision ID: 802b1c3d4e56
+Revises: 7f4a0b2c3d45
+Create Date: 2026-10-17 09:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '802b1c3d4e56'
+down_revision = '7f4a0b2c3d45'
+branch_labels = None
+depends_on = None
+
+
+SUMMARY_COUNTER_KEYS = (
+    'total_jobs', 'completed_jobs', 'running_jobs', 'failed_jobs',
+    'single_jobs', 'batch_jobs', 'video_jobs', 'rtsp_jobs',
+    'total_predictions', 'total_detections', 'total_classifications', 'total_segmentations',
+)
+
+
+def upgrade() -> None:
+    # Adds one job's contribution (delta = +1 / -1) to its campaign's summary_json counters
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_campaign_summary(
+            p_campaign_id integer, p_status text, p_mode text, p_model_id integer, p_summary json, p_delta integer
+        ) RETURNS void AS $$
+        DECLARE
+            status_key text := CASE p_status
+                WHEN 'completed' THEN 'completed_jobs'
+                WHEN 'running' THEN 'running_jobs'
+                WHEN 'pending' THEN 'running_jobs'
+                WHEN 'failed' THEN 'failed_jobs'
+            END;
+            task text;
+            predictions numeric := 0;
+            counters jsonb;
+        BEGIN
+            IF p_campaign_id IS NULL THEN
+                RETURN;
+            END IF;
+    
+            counters := jsonb_build_object('total_jobs', p_delta, p_mode || '_jobs', p_delta);
+            IF status_key IS NOT NULL THEN
+                counters := counters || jsonb_build_object(status_key, p_delta);
+            END IF;
+    
+            -- Completed jobs contribute their prediction totals (same rules as calculate_campaign_stats)
+            IF p_status = 'completed' THEN
+                SELECT task_type INTO task FROM models WHERE id = p_model_id;
+                IF task = 'segment' THEN
+                    predictions := CASE WHEN json_typeof(p_summary->'total_masks') = 'number' THEN (p_summary->>'total_masks')::numeric ELSE 0 END;
+                    counters := counters || jsonb_build_object('total_segmentations', p_delta * predictions);
+                ELSIF task IN ('detect', 'classify') THEN
+                    predictions := CASE WHEN json_typeof(p_summary->'total_predictions') = 'number' THEN (p_summary->>'total_predictions')::numeric ELSE 0 END
+                        + CASE WHEN json_typeof(p_summary->'total_detections') = 'number' THEN (p_summary->>'total_detections')::numeric ELSE 0 END;
+                    counters := counters || jsonb_build_object(
+                        CASE task WHEN 'detect' THEN 'total_detections' ELSE 'total_classifications' END,
+                        p_delta * predictions
+                    );
+                END IF;
+                counters := counters || jsonb_build_object('total_predictions', p_delta * predictions);
+            END IF;
+    
+            UPDATE campaigns c SET summary_json = c.summary_json || (
+                SELECT jsonb_object_agg(key, COALESCE((c.summary_json->>key)::numeric, 0) + value::numeric)
+                FROM jsonb_each_text(counters)
+            )
+            WHERE c.id = p_campaign_id;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_campaign_summary() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM bump_campaign_summary(OLD.campaign_id, OLD.status::text, OLD.mode::text, OLD.model_id, OLD.summary_json, -1);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM bump_campaign_summary(NEW.campaign_id, NEW.status::text, NEW.mode::text, NEW.model_id, NEW.summary_json, 1);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_prediction_jobs_campaign_summary
+        AFTER INSERT OR DELETE OR UPDATE OF campaign_id, status, mode ON prediction_jobs
+        FOR EACH ROW EXECUTE FUNCTION sync_campaign_summary()
+    """)
+    
+    # Rebuild the counters from existing jobs so the triggers start from a consistent state
+    keys = ", ".join(f"'{key}'" for key in SUMMARY_COUNTER_KEYS)
+    op.execute(f"UPDATE campaigns SET summary_json = summary_json - ARRAY[{keys}]")
+    op.execute("""
+        SELECT bump_campaign_summary(campaign_id, status::text, mode::text, model_id, summary_json, 1)
+        FROM prediction_jobs
+        WHERE campaign_id IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_prediction_jobs_campaign_summary ON prediction_jobs")
+    op.execute("DROP FUNCTION IF EXISTS sync_campaign_summary()")
+    op.execute("DROP FUNCTION IF EXISTS bump_campaign_summary(integer, text, text, integer, json, integer)")
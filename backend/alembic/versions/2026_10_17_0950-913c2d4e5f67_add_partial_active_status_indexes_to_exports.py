@@ -0,0 +1,35 @@
+"""add partial active-status indexes to export tables
+
+Revision ID: 913c2d4e5f67
+Revises: 802b1c3d4e56
+Create Date: 2026-10-17 09:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '913c2d4e5f67'
+down_revision = '802b1c3d4e56'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Workers only poll pending/processing rows; completed history stays out of the index
+    op.create_index(
+        'ix_export_jobs_active', 'export_jobs', ['status'], unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'processing')")
+    )
+    op.create_index(
+        'ix_campaign_exports_active', 'campaign_exports', ['status'], unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'processing')")
+    )
+    op.execute('DROP INDEX IF EXISTS ix_campaign_exports_status')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_campaign_exports_status'), 'campaign_exports', ['status'], unique=False)
+    op.drop_index('ix_campaign_exports_active', table_name='campaign_exports')
+    op.drop_index('ix_export_jobs_active', table_name='export_jobs')
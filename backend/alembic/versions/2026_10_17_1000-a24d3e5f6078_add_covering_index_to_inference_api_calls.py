@@ -0,0 +1,34 @@
+"""add covering (user_id, called_at) index to inference_api_calls
+
+Revision ID: a24d3e5f6078
+Revises: 913c2d4e5f67
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a24d3e5f6078'
+down_revision = '913c2d4e5f67'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rate-limit window queries are answered from this index alone
+    op.create_index(
+        'ix_inference_api_calls_user_called_at', 'inference_api_calls',
+        ['user_id', sa.text('called_at DESC')], unique=False,
+        postgresql_include=['status_code', 'response_time_ms']
+    )
+    # Superseded by the composite index
+    op.drop_index(op.f('ix_inference_api_calls_user_id'), table_name='inference_api_calls')
+    op.drop_index(op.f('ix_inference_api_calls_called_at'), table_name='inference_api_calls')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_inference_api_calls_called_at'), 'inference_api_calls', ['called_at'], unique=False)
+    op.create_index(op.f('ix_inference_api_calls_user_id'), 'inference_api_calls', ['user_id'], unique=False)
+    op.drop_index('ix_inference_api_calls_user_called_at', table_name='inference_api_calls')
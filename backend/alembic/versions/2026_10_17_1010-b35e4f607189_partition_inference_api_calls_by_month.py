@@ -0,0 +1,130 @@
+"""partition inference_api_calls by month on called_at
+
+Revision ID: b35e4f607189
+Revises: a24d3e5f6078
+Create Date: 2026-10-17 10:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b35e4f607189'
+down_revision = 'a24d3e5f6078'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = "id, user_id, model_id, prediction_job_id, called_at, response_time_ms, status_code, file_count, error_message"
+
+
+def _create_indexes() -> None:
+    op.create_index(op.f('ix_inference_api_calls_id'), 'inference_api_calls', ['id'], unique=False)
+    op.create_index(op.f('ix_inference_api_calls_model_id'), 'inference_api_calls', ['model_id'], unique=False)
+    op.create_index(
+        'ix_inference_api_calls_user_called_at', 'inference_api_calls',
+        ['user_id', sa.text('called_at DESC')], unique=False,
+        postgresql_include=['status_code', 'response_time_ms']
+    )
+
+
+def upgrade() -> None:
+    # Move the existing table aside (its pkey index name would clash with the new table's)
+    op.execute("ALTER TABLE inference_api_calls RENAME TO inference_api_calls_old")
+    op.execute("ALTER TABLE inference_api_calls_old RENAME CONSTRAINT inference_api_calls_pkey TO inference_api_calls_old_pkey")
+    for index_name in ('ix_inference_api_calls_id', 'ix_inference_api_calls_model_id', 'ix_inference_api_calls_user_called_at'):
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    
+    # Partitioned parent; the partition key must be part of the primary key
+    op.execute("""
+        CREATE TABLE inference_api_calls (
+            id integer NOT NULL DEFAULT nextval('inference_api_calls_id_seq'),
+            user_id integer NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            model_id integer NOT NULL REFERENCES models (id) ON DELETE CASCADE,
+            prediction_job_id integer REFERENCES prediction_jobs (id) ON DELETE SET NULL,
+            called_at timestamp with time zone NOT NULL DEFAULT now(),
+            response_time_ms double precision,
+            status_code integer NOT NULL,
+            file_count integer DEFAULT 1,
+            error_message varchar(512),
+            PRIMARY KEY (id, called_at)
+        ) PARTITION BY RANGE (called_at)
+    """)
+    op.execute("CREATE TABLE inference_api_calls_default PARTITION OF inference_api_calls DEFAULT")
+    
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_inference_api_calls_partition(month_start timestamp) RETURNS void AS $$
+        BEGIN
+            -- month_start is a UTC wall-clock month boundary
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF inference_api_calls FOR VALUES FROM (%L) TO (%L)',
+                'inference_api_calls_' || to_char(month_start, 'YYYY_MM'),
+                month_start::text || '+00',
+                (month_start + interval '1 month')::text || '+00'
+            );
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_inference_api_calls_partitions(months_ahead integer) RETURNS void AS $$
+        BEGIN
+            PERFORM create_inference_api_calls_partition(month_start)
+            FROM generate_series(
+                date_trunc('month', now() AT TIME ZONE 'UTC'),
+                date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => months_ahead),
+                interval '1 month'
+            ) AS month_start;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    
+    # One partition per month of existing history, plus the next three months
+    op.execute("""
+        SELECT create_inference_api_calls_partition(month_start)
+        FROM generate_series(
+            date_trunc('month', (SELECT min(called_at) FROM inference_api_calls_old) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC'),
+            interval '1 month'
+        ) AS month_start
+    """)
+    op.execute("SELECT ensure_inference_api_calls_partitions(3)")
+    
+    op.execute(f"""
+        INSERT INTO inference_api_calls ({COLUMNS})
+        SELECT id, user_id, model_id, prediction_job_id, COALESCE(called_at, now()),
+               response_time_ms, status_code, file_count, error_message
+        FROM inference_api_calls_old
+    """)
+    op.execute("ALTER SEQUENCE inference_api_calls_id_seq OWNED BY inference_api_calls.id")
+    op.execute("DROP TABLE inference_api_calls_old")
+    
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE inference_api_calls RENAME TO inference_api_calls_partitioned")
+    op.execute("ALTER TABLE inference_api_calls_partitioned RENAME CONSTRAINT inference_api_calls_pkey TO inference_api_calls_partitioned_pkey")
+    for index_name in ('ix_inference_api_calls_id', 'ix_inference_api_calls_model_id', 'ix_inference_api_calls_user_called_at'):
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    
+    op.execute("""
+        CREATE TABLE inference_api_calls (
+            id integer NOT NULL DEFAULT nextval('inference_api_calls_id_seq') PRIMARY KEY,
+            user_id integer NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            model_id integer NOT NULL REFERENCES models (id) ON DELETE CASCADE,
+            prediction_job_id integer REFERENCES prediction_jobs (id) ON DELETE SET NULL,
+            called_at timestamp with time zone NOT NULL DEFAULT now(),
+            response_time_ms double precision,
+            status_code integer NOT NULL,
+            file_count integer DEFAULT 1,
+            error_message varchar(512)
+        )
+    """)
+    op.execute(f"INSERT INTO inference_api_calls ({COLUMNS}) SELECT {COLUMNS} FROM inference_api_calls_partitioned")
+    op.execute("ALTER SEQUENCE inference_api_calls_id_seq OWNED BY inference_api_calls.id")
+    op.execute("DROP TABLE inference_api_calls_partitioned")  # Drops all partitions
+    op.execute("DROP FUNCTION IF EXISTS ensure_inference_api_calls_partitions(integer)")
+    op.execute("DROP FUNCTION IF EXISTS create_inference_api_calls_partition(timestamp)")
+    
+    _create_indexes()
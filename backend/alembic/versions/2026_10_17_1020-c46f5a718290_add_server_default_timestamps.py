@@ -0,0 +1,26 @@
+"""add server-side now() defaults to app_settings.updated_at and export_jobs.created_at
+
+Revision ID: c46f5a718290
+Revises: b35e4f607189
+Create Date: 2026-10-17 10:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c46f5a718290'
+down_revision = 'b35e4f607189'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('app_settings', 'updated_at', server_default=sa.text('now()'))
+    op.alter_column('export_jobs', 'created_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    op.alter_column('export_jobs', 'created_at', server_default=None)
+    op.alter_column('app_settings', 'updated_at', server_default=None)
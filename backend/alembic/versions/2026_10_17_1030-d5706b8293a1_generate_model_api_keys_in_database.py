@@ -0,0 +1,26 @@
+"""generate models.api_key with gen_random_uuid()
+
+Revision ID: d5706b8293a1
+Revises: c46f5a718290
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5706b8293a1'
+down_revision = 'c46f5a718290'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it before that
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    op.alter_column('models', 'api_key', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    op.alter_column('models', 'api_key', server_default=None)
@@ -0,0 +1,27 @@
+"""shrink api_keys.key_hash to an HMAC digest and index it
+
+Revision ID: e6817c9304b2
+Revises: d5706b8293a1
+Create Date: 2026-10-17 10:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6817c9304b2'
+down_revision = 'd5706b8293a1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing bcrypt hashes (60 chars) still fit; they are replaced on each key's next use
+    op.alter_column('api_keys', 'key_hash', type_=sa.String(length=64), existing_nullable=False)
+    op.create_index(op.f('ix_api_keys_key_hash'), 'api_keys', ['key_hash'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_api_keys_key_hash'), table_name='api_keys')
+    op.alter_column('api_keys', 'key_hash', type_=sa.String(length=255), existing_nullable=False)
@@ -0,0 +1,39 @@
+"""store export_jobs.progress as a checked smallint percent
+
+Revision ID: f7928d0a15c3
+Revises: e6817c9304b2
+Create Date: 2026-10-17 10:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7928d0a15c3'
+down_revision = 'e6817c9304b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE export_jobs SET progress = 0 WHERE progress IS NULL")
+    op.alter_column(
+        'export_jobs', 'progress',
+        type_=sa.SmallInteger(),
+        nullable=False,
+        server_default='0',
+        postgresql_using='LEAST(GREATEST(floor(progress), 0), 100)::smallint'
+    )
+    op.create_check_constraint('ck_export_jobs_progress', 'export_jobs', 'progress >= 0 AND progress <= 100')
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_export_jobs_progress', 'export_jobs', type_='check')
+    op.alter_column(
+        'export_jobs', 'progress',
+        type_=sa.Float(),
+        nullable=True,
+        server_default=None,
+        postgresql_using='progress::double precision'
+    )
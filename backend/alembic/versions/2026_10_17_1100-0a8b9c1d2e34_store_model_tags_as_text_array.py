@@ -0,0 +1,42 @@
+"""store models.tags as text[] with a GIN index
+
+Revision ID: 0a8b9c1d2e34
+Revises: f7928d0a15c3
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0a8b9c1d2e34'
+down_revision = 'f7928d0a15c3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Subqueries are not allowed in USING, so empty elements are stripped afterwards
+    op.alter_column(
+        'models', 'tags',
+        type_=postgresql.ARRAY(sa.Text()),
+        postgresql_using=(
+            "CASE WHEN coalesce(btrim(tags), '') = '' THEN '{}'::text[] "
+            "ELSE string_to_array(regexp_replace(btrim(tags), '\\s*,\\s*', ',', 'g'), ',') END"
+        )
+    )
+    op.execute("UPDATE models SET tags = array_remove(tags, '') WHERE '' = ANY(tags)")
+    op.alter_column('models', 'tags', nullable=False, server_default='{}')
+    op.create_index('ix_models_tags_gin', 'models', ['tags'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_models_tags_gin', table_name='models', postgresql_using='gin')
+    op.alter_column('models', 'tags', nullable=True, server_default=None)
+    op.alter_column(
+        'models', 'tags',
+        type_=sa.String(length=500),
+        postgresql_using="nullif(array_to_string(tags, ','), '')"
+    )
@@ -0,0 +1,38 @@
+"""drop redundant indexes on api_keys and playbook_session_forms
+
+Revision ID: 1b9c0d2e3f45
+Revises: 0a8b9c1d2e34
+Create Date: 2026-10-17 11:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b9c0d2e3f45'
+down_revision = '0a8b9c1d2e34'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The primary key already indexes id
+    op.drop_index('ix_api_keys_id', table_name='api_keys')
+    op.drop_index('ix_playbook_session_forms_id', table_name='playbook_session_forms')
+
+    # Uniqueness is carried by a single constraint whose backing index serves lookups
+    op.drop_index('ix_api_keys_user_id', table_name='api_keys')
+    op.create_unique_constraint('api_keys_user_id_key', 'api_keys', ['user_id'])
+    op.drop_index('ix_playbook_session_forms_playbook_id', table_name='playbook_session_forms')
+    op.create_unique_constraint('playbook_session_forms_playbook_id_key', 'playbook_session_forms', ['playbook_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('playbook_session_forms_playbook_id_key', 'playbook_session_forms', type_='unique')
+    op.create_index('ix_playbook_session_forms_playbook_id', 'playbook_session_forms', ['playbook_id'], unique=True)
+    op.drop_constraint('api_keys_user_id_key', 'api_keys', type_='unique')
+    op.create_index('ix_api_keys_user_id', 'api_keys', ['user_id'], unique=True)
+
+    op.create_index('ix_playbook_session_forms_id', 'playbook_session_forms', ['id'])
+    op.create_index('ix_api_keys_id', 'api_keys', ['id'], unique=False)
@@ -0,0 +1,113 @@
+"""convert prediction_jobs.summary_json and training_jobs.metrics_json to jsonb
+
+Revision ID: 2c0d1e3f4a56
+Revises: 1b9c0d2e3f45
+Create Date: 2026-10-17 11:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '2c0d1e3f4a56'
+down_revision = '1b9c0d2e3f45'
+branch_labels = None
+depends_on = None
+
+
+def _bump_campaign_summary(json_type: str) -> str:
+    """bump_campaign_summary() from 802b1c3d4e56, taking the job summary as json_type."""
+    return f"""
+        CREATE OR REPLACE FUNCTION bump_campaign_summary(
+            p_campaign_id integer, p_status text, p_mode text, p_model_id integer, p_summary {json_type}, p_delta integer
+        ) RETURNS void AS $$
+        DECLARE
+            status_key text := CASE p_status
+                WHEN 'completed' THEN 'completed_jobs'
+                WHEN 'running' THEN 'running_jobs'
+                WHEN 'pending' THEN 'running_jobs'
+                WHEN 'failed' THEN 'failed_jobs'
+            END;
+            task text;
+            predictions numeric := 0;
+            counters jsonb;
+        BEGIN
+            IF p_campaign_id IS NULL THEN
+                RETURN;
+            END IF;
+    
+            counters := jsonb_build_object('total_jobs', p_delta, p_mode || '_jobs', p_delta);
+            IF status_key IS NOT NULL THEN
+                counters := counters || jsonb_build_object(status_key, p_delta);
+            END IF;
+    
+            -- Completed jobs contribute their prediction totals (same rules as calculate_campaign_stats)
+            IF p_status = 'completed' THEN
+                SELECT task_type INTO task FROM models WHERE id = p_model_id;
+                IF task = 'segment' THEN
+                    predictions := CASE WHEN {json_type}_typeof(p_summary->'total_masks') = 'number' THEN (p_summary->>'total_masks')::numeric ELSE 0 END;
+                    counters := counters || jsonb_build_object('total_segmentations', p_delta * predictions);
+                ELSIF task IN ('detect', 'classify') THEN
+                    predictions := CASE WHEN {json_type}_typeof(p_summary->'total_predictions') = 'number' THEN (p_summary->>'total_predictions')::numeric ELSE 0 END
+                        + CASE WHEN {json_type}_typeof(p_summary->'total_detections') = 'number' THEN (p_summary->>'total_detections')::numeric ELSE 0 END;
+                    counters := counters || jsonb_build_object(
+                        CASE task WHEN 'detect' THEN 'total_detections' ELSE 'total_classifications' END,
+                        p_delta * predictions
+                    );
+                END IF;
+                counters := counters || jsonb_build_object('total_predictions', p_delta * predictions);
+            END IF;
+    
+            UPDATE campaigns c SET summary_json = c.summary_json || (
+                SELECT jsonb_object_agg(key, COALESCE((c.summary_json->>key)::numeric, 0) + value::numeric)
+                FROM jsonb_each_text(counters)
+            )
+            WHERE c.id = p_campaign_id;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'prediction_jobs', 'summary_json',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='summary_json::jsonb'
+    )
+    op.alter_column(
+        'training_jobs', 'metrics_json',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='metrics_json::jsonb'
+    )
+    
+    # The campaign summary trigger passes summary_json through; jsonb does not implicitly cast to json
+    op.execute("DROP FUNCTION IF EXISTS bump_campaign_summary(integer, text, text, integer, json, integer)")
+    op.execute(_bump_campaign_summary('jsonb'))
+    
+    op.create_index(
+        'ix_prediction_jobs_running_last_activity',
+        'prediction_jobs',
+        [sa.text("(summary_json->'metadata'->>'last_activity')")],
+        unique=False,
+        postgresql_where=sa.text("status = 'running'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_prediction_jobs_running_last_activity', table_name='prediction_jobs')
+    
+    op.execute("DROP FUNCTION IF EXISTS bump_campaign_summary(integer, text, text, integer, jsonb, integer)")
+    op.execute(_bump_campaign_summary('json'))
+    
+    op.alter_column(
+        'training_jobs', 'metrics_json',
+        type_=sa.JSON(),
+        postgresql_using='metrics_json::json'
+    )
+    op.alter_column(
+        'prediction_jobs', 'summary_json',
+        type_=sa.JSON(),
+        postgresql_using='summary_json::json'
+    )
@@ -0,0 +1,45 @@
+"""store recognition_images.embedding as halfvec(512)
+
+Revision ID: 3d1e2f4a5b67
+Revises: 2c0d1e3f4a56
+Create Date: 2026-10-17 11:30:00.000000
+
+Requires the pgvector extension >= 0.7 (halfvec type).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3d1e2f4a5b67'
+down_revision = '2c0d1e3f4a56'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_recognition_images_embedding")
+    op.execute("""
+        ALTER TABLE recognition_images
+        ALTER COLUMN embedding TYPE halfvec(512) USING embedding::halfvec(512)
+    """)
+    op.execute("""
+        CREATE INDEX ix_recognition_images_embedding
+        ON recognition_images
+        USING ivfflat (embedding halfvec_cosine_ops)
+        WITH (lists = 100)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_recognition_images_embedding")
+    op.execute("""
+        ALTER TABLE recognition_images
+        ALTER COLUMN embedding TYPE vector(512) USING embedding::vector(512)
+    """)
+    op.execute("""
+        CREATE INDEX ix_recognition_images_embedding
+        ON recognition_images
+        USING ivfflat (embedding vector_cosine_ops)
+        WITH (lists = 100)
+    """)
@@ -0,0 +1,36 @@
+"""use an HNSW index for recognition_images.embedding
+
+Revision ID: 4e2f3a5b6c78
+Revises: 3d1e2f4a5b67
+Create Date: 2026-10-17 11:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e2f3a5b6c78'
+down_revision = '3d1e2f4a5b67'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_recognition_images_embedding")
+    op.execute("""
+        CREATE INDEX ix_recognition_images_embedding
+        ON recognition_images
+        USING hnsw (embedding halfvec_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_recognition_images_embedding")
+    op.execute("""
+        CREATE INDEX ix_recognition_images_embedding
+        ON recognition_images
+        USING ivfflat (embedding halfvec_cosine_ops)
+        WITH (lists = 100)
+    """)
@@ -0,0 +1,51 @@
+"""add composite indexes for prediction and training job listings
+
+Revision ID: 5f3a4b6c7d89
+Revises: 4e2f3a5b6c78
+Create Date: 2026-10-17 11:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f3a4b6c7d89'
+down_revision = '4e2f3a5b6c78'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_prediction_jobs_creator_status_created',
+            'prediction_jobs',
+            ['creator_id', 'status', 'created_at'],
+            unique=False,
+            postgresql_include=['mode'],
+            postgresql_concurrently=True
+        )
+        # The composite index leads with creator_id
+        op.drop_index('ix_prediction_jobs_creator_id', table_name='prediction_jobs', postgresql_concurrently=True)
+        op.create_index(
+            'ix_training_jobs_project_created',
+            'training_jobs',
+            ['project_id', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_training_jobs_project_created', table_name='training_jobs', postgresql_concurrently=True)
+        op.create_index(
+            'ix_prediction_jobs_creator_id',
+            'prediction_jobs',
+            ['creator_id'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.drop_index('ix_prediction_jobs_creator_status_created', table_name='prediction_jobs', postgresql_concurrently=True)
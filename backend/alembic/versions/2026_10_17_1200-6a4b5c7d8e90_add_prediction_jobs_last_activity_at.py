@@ -0,0 +1,63 @@
+"""add prediction_jobs.last_activity_at generated from summary_json
+
+Revision ID: 6a4b5c7d8e90
+Revises: 5f3a4b6c7d89
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6a4b5c7d8e90'
+down_revision = '5f3a4b6c7d89'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Generated columns need an IMMUTABLE expression; text::timestamptz is only STABLE,
+    # so the cast runs with a pinned TimeZone and bad values become NULL
+    op.execute("""
+        CREATE OR REPLACE FUNCTION prediction_job_last_activity(summary jsonb) RETURNS timestamptz AS $$
+        BEGIN
+            RETURN (summary->'metadata'->>'last_activity')::timestamptz;
+        EXCEPTION WHEN others THEN
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE SET TimeZone = 'UTC'
+    """)
+    op.add_column(
+        'prediction_jobs',
+        sa.Column(
+            'last_activity_at',
+            sa.DateTime(timezone=True),
+            sa.Computed('prediction_job_last_activity(summary_json)', persisted=True),
+            nullable=True
+        )
+    )
+    
+    # Replaces the text expression index from 2c0d1e3f4a56
+    op.drop_index('ix_prediction_jobs_running_last_activity', table_name='prediction_jobs')
+    op.create_index(
+        'ix_prediction_jobs_running_last_activity',
+        'prediction_jobs',
+        ['last_activity_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'running'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_prediction_jobs_running_last_activity', table_name='prediction_jobs')
+    op.create_index(
+        'ix_prediction_jobs_running_last_activity',
+        'prediction_jobs',
+        [sa.text("(summary_json->'metadata'->>'last_activity')")],
+        unique=False,
+        postgresql_where=sa.text("status = 'running'")
+    )
+    
+    op.drop_column('prediction_jobs', 'last_activity_at')
+    op.execute("DROP FUNCTION IF EXISTS prediction_job_last_activity(jsonb)")
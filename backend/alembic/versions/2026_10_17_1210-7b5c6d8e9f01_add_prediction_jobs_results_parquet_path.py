@@ -0,0 +1,24 @@
+"""add prediction_jobs.results_parquet_path
+
+Revision ID: 7b5c6d8e9f01
+Revises: 6a4b5c7d8e90
+Create Date: 2026-10-17 12:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b5c6d8e9f01'
+down_revision = '6a4b5c7d8e90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('prediction_jobs', sa.Column('results_parquet_path', sa.String(length=512), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('prediction_jobs', 'results_parquet_path')
@@ -0,0 +1,96 @@
+"""maintain recognition catalog counters with triggers
+
+Revision ID: 8c6d7e9f0a12
+Revises: 7b5c6d8e9f01
+Create Date: 2026-10-17 12:20:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8c6d7e9f0a12'
+down_revision = '7b5c6d8e9f01'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Backfill from existing rows (the app-side counters drift)
+    op.execute("""
+        UPDATE recognition_labels l SET image_count = (
+            SELECT COUNT(*) FROM recognition_images i WHERE i.label_id = l.id
+        )
+    """)
+    op.execute("""
+        UPDATE recognition_catalogs c SET
+            label_count = (SELECT COUNT(*) FROM recognition_labels l WHERE l.catalog_id = c.id),
+            image_count = (
+                SELECT COALESCE(SUM(l.image_count), 0) FROM recognition_labels l WHERE l.catalog_id = c.id
+            )
+    """)
+    
+    # Keep the counters in sync on every image/label insert/delete
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_catalog_counters() RETURNS trigger AS $$
+        DECLARE
+            delta integer;
+            target_label integer;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                delta := 1;
+                target_label := NEW.label_id;
+            ELSE
+                delta := -1;
+                target_label := OLD.label_id;
+            END IF;
+        
+            -- A label deleted together with its images is gone already; its catalog is
+            -- adjusted by update_catalog_label_counters() instead.
+            WITH label AS (
+                UPDATE recognition_labels SET image_count = COALESCE(image_count, 0) + delta
+                WHERE id = target_label
+                RETURNING catalog_id
+            )
+            UPDATE recognition_catalogs c SET image_count = COALESCE(c.image_count, 0) + delta
+            FROM label
+            WHERE c.id = label.catalog_id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_recognition_images_counters
+        AFTER INSERT OR DELETE ON recognition_images
+        FOR EACH ROW EXECUTE FUNCTION update_catalog_counters()
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_catalog_label_counters() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE recognition_catalogs SET
+                    label_count = COALESCE(label_count, 0) + 1,
+                    image_count = COALESCE(image_count, 0) + COALESCE(NEW.image_count, 0)
+                WHERE id = NEW.catalog_id;
+            ELSE
+                UPDATE recognition_catalogs SET
+                    label_count = COALESCE(label_count, 0) - 1,
+                    image_count = COALESCE(image_count, 0) - COALESCE(OLD.image_count, 0)
+                WHERE id = OLD.catalog_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_recognition_labels_counters
+        AFTER INSERT OR DELETE ON recognition_labels
+        FOR EACH ROW EXECUTE FUNCTION update_catalog_label_counters()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_recognition_labels_counters ON recognition_labels")
+    op.execute("DROP FUNCTION IF EXISTS update_catalog_label_counters()")
+    op.execute("DROP TRIGGER IF EXISTS trg_recognition_images_counters ON recognition_images")
+    op.execute("DROP FUNCTION IF EXISTS update_catalog_counters()")
@@ -0,0 +1,43 @@
+"""add partial indexes on active prediction and training jobs
+
+Revision ID: 9d7e8f0a1b23
+Revises: 8c6d7e9f0a12
+Create Date: 2026-10-17 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d7e8f0a1b23'
+down_revision = '8c6d7e9f0a12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_prediction_jobs_active_created',
+            'prediction_jobs',
+            ['created_at'],
+            unique=False,
+            postgresql_where=sa.text("status IN ('pending', 'running')"),
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_training_jobs_active_created',
+            'training_jobs',
+            ['created_at'],
+            unique=False,
+            postgresql_where=sa.text("status IN ('pending', 'running')"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_training_jobs_active_created', table_name='training_jobs', postgresql_concurrently=True)
+        op.drop_index('ix_prediction_jobs_active_created', table_name='prediction_jobs', postgresql_concurrently=True)
@@ -0,0 +1,32 @@
+"""add generated prediction_jobs.processing_time_ms
+
+Revision ID: ae8f9a1b2c34
+Revises: 9d7e8f0a1b23
+Create Date: 2026-10-17 12:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ae8f9a1b2c34'
+down_revision = '9d7e8f0a1b23'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'prediction_jobs',
+        sa.Column(
+            'processing_time_ms',
+            sa.Float(),
+            sa.Computed("(EXTRACT(EPOCH FROM (completed_at - created_at)) * 1000)::double precision", persisted=True),
+            nullable=True
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('prediction_jobs', 'processing_time_ms')
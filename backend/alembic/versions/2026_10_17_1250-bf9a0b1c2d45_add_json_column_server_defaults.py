@@ -0,0 +1,36 @@
+"""add server defaults to prediction result and job json columns
+
+Revision ID: bf9a0b1c2d45
+Revises: ae8f9a1b2c34
+Create Date: 2026-10-17 12:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'bf9a0b1c2d45'
+down_revision = 'ae8f9a1b2c34'
+branch_labels = None
+depends_on = None
+
+
+RESULT_LIST_COLUMNS = [
+    'boxes_json', 'scores_json', 'classes_json', 'class_names_json',
+    'top_classes_json', 'probabilities_json', 'masks_json',
+]
+
+
+def upgrade() -> None:
+    for column in RESULT_LIST_COLUMNS:
+        op.alter_column('prediction_results', column, server_default=sa.text("'[]'"))
+    op.alter_column('prediction_jobs', 'summary_json', server_default=sa.text("'{}'"))
+    op.alter_column('training_jobs', 'metrics_json', server_default=sa.text("'{}'"))
+
+
+def downgrade() -> None:
+    op.alter_column('training_jobs', 'metrics_json', server_default=None)
+    op.alter_column('prediction_jobs', 'summary_json', server_default=None)
+    for column in RESULT_LIST_COLUMNS:
+        op.alter_column('prediction_results', column, server_default=None)
@@ -0,0 +1,44 @@
+"""add jsonb_path_ops gin indexes on workflows.nodes and trigger_config
+
+Revision ID: c0a1b2c3d456
+Revises: bf9a0b1c2d45
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c0a1b2c3d456'
+down_revision = 'bf9a0b1c2d45'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workflows_nodes_gin',
+            'workflows',
+            ['nodes'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'nodes': 'jsonb_path_ops'},
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_workflows_trigger_config_gin',
+            'workflows',
+            ['trigger_config'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'trigger_config': 'jsonb_path_ops'},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_workflows_trigger_config_gin', table_name='workflows', postgresql_concurrently=True)
+        op.drop_index('ix_workflows_nodes_gin', table_name='workflows', postgresql_concurrently=True)
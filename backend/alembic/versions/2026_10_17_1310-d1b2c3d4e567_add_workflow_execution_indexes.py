@@ -0,0 +1,44 @@
+"""add trigger_data gin and active partial indexes on workflow_executions
+
+Revision ID: d1b2c3d4e567
+Revises: c0a1b2c3d456
+Create Date: 2026-10-17 13:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd1b2c3d4e567'
+down_revision = 'c0a1b2c3d456'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workflow_executions_trigger_data_gin',
+            'workflow_executions',
+            ['trigger_data'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'trigger_data': 'jsonb_path_ops'},
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_workflow_executions_active_created',
+            'workflow_executions',
+            ['created_at'],
+            unique=False,
+            postgresql_where=sa.text("status IN ('pending', 'running')"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_workflow_executions_active_created', table_name='workflow_executions', postgresql_concurrently=True)
+        op.drop_index('ix_workflow_executions_trigger_data_gin', table_name='workflow_executions', postgresql_concurrently=True)
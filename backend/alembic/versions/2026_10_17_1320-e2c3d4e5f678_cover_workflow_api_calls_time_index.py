@@ -0,0 +1,51 @@
+"""make the workflow_api_calls workflow/time index descending and covering
+
+Revision ID: e2c3d4e5f678
+Revises: d1b2c3d4e567
+Create Date: 2026-10-17 13:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2c3d4e5f678'
+down_revision = 'd1b2c3d4e567'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_workflow_api_calls_workflow_time', table_name='workflow_api_calls', postgresql_concurrently=True)
+        op.create_index(
+            'ix_workflow_api_calls_workflow_time',
+            'workflow_api_calls',
+            ['workflow_id', sa.text('called_at DESC')],
+            unique=False,
+            postgresql_include=['status_code', 'response_time_ms'],
+            postgresql_concurrently=True
+        )
+        # The composite index leads with workflow_id
+        op.drop_index('ix_workflow_api_calls_workflow_id', table_name='workflow_api_calls', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workflow_api_calls_workflow_id',
+            'workflow_api_calls',
+            ['workflow_id'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.drop_index('ix_workflow_api_calls_workflow_time', table_name='workflow_api_calls', postgresql_concurrently=True)
+        op.create_index(
+            'ix_workflow_api_calls_workflow_time',
+            'workflow_api_calls',
+            ['workflow_id', 'called_at'],
+            unique=False,
+            postgresql_concurrently=True
+        )
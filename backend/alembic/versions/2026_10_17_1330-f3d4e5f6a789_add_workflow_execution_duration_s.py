@@ -0,0 +1,32 @@
+"""add generated duration_s to workflow executions and step executions
+
+Revision ID: f3d4e5f6a789
+Revises: e2c3d4e5f678
+Create Date: 2026-10-17 13:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3d4e5f6a789'
+down_revision = 'e2c3d4e5f678'
+branch_labels = None
+depends_on = None
+
+
+DURATION_EXPRESSION = "(EXTRACT(EPOCH FROM (completed_at - started_at)))::double precision"
+
+
+def upgrade() -> None:
+    for table in ('workflow_executions', 'workflow_step_executions'):
+        op.add_column(
+            table,
+            sa.Column('duration_s', sa.Float(), sa.Computed(DURATION_EXPRESSION, persisted=True), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    for table in ('workflow_step_executions', 'workflow_executions'):
+        op.drop_column(table, 'duration_s')
@@ -0,0 +1,72 @@
+"""store user role and workflow statuses as text with check constraints
+
+Revision ID: a4e5f6a7b890
+Revises: f3d4e5f6a789
+Create Date: 2026-10-17 13:40:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4e5f6a7b890'
+down_revision = 'f3d4e5f6a789'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, enum type, values, constraint, server default)
+COLUMNS = [
+    ('users', 'role', 'userrole', ('admin', 'project_admin', 'operator'), 'ck_users_role', None),
+    (
+        'workflow_executions', 'status', 'workflowstatus',
+        ('pending', 'running', 'paused', 'completed', 'failed', 'cancelled'),
+        'ck_workflow_executions_status', 'pending'
+    ),
+    (
+        'workflow_step_executions', 'status', 'stepstatus',
+        ('pending', 'running', 'completed', 'failed', 'skipped'),
+        'ck_workflow_step_executions_status', 'pending'
+    ),
+]
+
+
+def _quoted(values) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    # The partial index predicate compares against enum literals; rebuild it on text
+    op.drop_index('ix_workflow_executions_active_created', table_name='workflow_executions')
+    
+    for table, column, type_name, values, constraint, default in COLUMNS:
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(16) USING {column}::text")
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {constraint} CHECK ({column} IN ({_quoted(values)}))")
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+    
+    op.execute("""
+        CREATE INDEX ix_workflow_executions_active_created ON workflow_executions (created_at)
+        WHERE status IN ('pending', 'running')
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workflow_executions_active_created', table_name='workflow_executions')
+    
+    for table, column, type_name, values, constraint, default in reversed(COLUMNS):
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {constraint}")
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({_quoted(values)})")
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}")
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+    
+    op.execute("""
+        CREATE INDEX ix_workflow_executions_active_created ON workflow_executions (created_at)
+        WHERE status IN ('pending', 'running')
+    """)
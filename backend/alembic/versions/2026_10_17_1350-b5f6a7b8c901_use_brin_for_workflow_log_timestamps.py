@@ -0,0 +1,53 @@
+"""use brin indexes for workflow execution and api call timestamps
+
+Revision ID: b5f6a7b8c901
+Revises: a4e5f6a7b890
+Create Date: 2026-10-17 13:50:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5f6a7b8c901'
+down_revision = 'a4e5f6a7b890'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workflow_executions_created_brin',
+            'workflow_executions',
+            ['created_at'],
+            unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_workflow_api_calls_called_brin',
+            'workflow_api_calls',
+            ['called_at'],
+            unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True
+        )
+        # Superseded by the BRIN index
+        op.drop_index('ix_workflow_executions_created_at', table_name='workflow_executions', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workflow_executions_created_at',
+            'workflow_executions',
+            ['created_at'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.drop_index('ix_workflow_api_calls_called_brin', table_name='workflow_api_calls', postgresql_concurrently=True)
+        op.drop_index('ix_workflow_executions_created_brin', table_name='workflow_executions', postgresql_concurrently=True)
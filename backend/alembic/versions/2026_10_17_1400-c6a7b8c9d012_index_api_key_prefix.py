@@ -0,0 +1,26 @@
+"""index api_keys.key_prefix
+
+Revision ID: c6a7b8c9d012
+Revises: b5f6a7b8c901
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6a7b8c9d012'
+down_revision = 'b5f6a7b8c901'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_api_keys_key_prefix'), 'api_keys', ['key_prefix'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_api_keys_key_prefix'), table_name='api_keys', postgresql_concurrently=True)
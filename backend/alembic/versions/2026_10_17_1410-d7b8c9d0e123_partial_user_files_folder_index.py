@@ -0,0 +1,39 @@
+"""index only live user files for folder listings
+
+Revision ID: d7b8c9d0e123
+Revises: c6a7b8c9d012
+Create Date: 2026-10-17 14:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7b8c9d0e123'
+down_revision = 'c6a7b8c9d012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # user_files may have been created by metadata.create_all with the new index already
+    if 'user_files' not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_files_user_folder_live "
+            "ON user_files (user_id, folder_path) WHERE is_deleted = false"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_user_files_user_folder")
+
+
+def downgrade() -> None:
+    if 'user_files' not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_files_user_folder ON user_files (user_id, folder_path)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_user_files_user_folder_live")
@@ -0,0 +1,66 @@
+"""set user_files upload/update timestamps in the database
+
+Revision ID: e8c9d0e1f234
+Revises: d7b8c9d0e123
+Create Date: 2026-10-17 14:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8c9d0e1f234'
+down_revision = 'd7b8c9d0e123'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # user_files may have been created by metadata.create_all with these columns already
+    if 'user_files' not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    
+    # Existing values were written with datetime.utcnow()
+    for column in ('uploaded_at', 'updated_at'):
+        op.alter_column(
+            'user_files', column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text('now()'),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+        )
+    
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_user_files_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_user_files_updated_at ON user_files")
+    op.execute("""
+        CREATE TRIGGER trg_user_files_updated_at
+        BEFORE UPDATE ON user_files
+        FOR EACH ROW EXECUTE FUNCTION set_user_files_updated_at()
+    """)
+
+
+def downgrade() -> None:
+    if 'user_files' not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    
+    op.execute("DROP TRIGGER IF EXISTS trg_user_files_updated_at ON user_files")
+    op.execute("DROP FUNCTION IF EXISTS set_user_files_updated_at()")
+    
+    for column in ('uploaded_at', 'updated_at'):
+        op.alter_column(
+            'user_files', column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=sa.text('now()'),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+        )
@@ -0,0 +1,34 @@
+"""index user_files.user_id for queries that include trashed files
+
+Revision ID: f9d0e1f2a345
+Revises: e8c9d0e1f234
+Create Date: 2026-10-17 14:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f9d0e1f2a345'
+down_revision = 'e8c9d0e1f234'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # user_files may have been created by metadata.create_all with the index already
+    if 'user_files' not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_files_user_id ON user_files (user_id)")
+
+
+def downgrade() -> None:
+    if 'user_files' not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_user_files_user_id")
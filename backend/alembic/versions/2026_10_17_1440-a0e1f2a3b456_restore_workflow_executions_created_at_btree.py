@@ -0,0 +1,44 @@
+"""restore the created_at b-tree on workflow_executions
+
+Revision ID: a0e1f2a3b456
+Revises: f9d0e1f2a345
+Create Date: 2026-10-17 14:40:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a0e1f2a3b456'
+down_revision = 'f9d0e1f2a345'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Executions are updated on every step, so heap order drifts from created_at and BRIN
+    # loses selectivity; the B-tree also serves ORDER BY created_at DESC LIMIT n.
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workflow_executions_created_at',
+            'workflow_executions',
+            ['created_at'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.drop_index('ix_workflow_executions_created_brin', table_name='workflow_executions', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workflow_executions_created_brin',
+            'workflow_executions',
+            ['created_at'],
+            unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True
+        )
+        op.drop_index('ix_workflow_executions_created_at', table_name='workflow_executions', postgresql_concurrently=True)
@@ -0,0 +1,81 @@
+"""fire the campaign summary trigger on job summary_json and model_id changes
+
+Revision ID: b1f2a3b4c567
+Revises: a0e1f2a3b456
+Create Date: 2026-10-17 14:50:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b1f2a3b4c567'
+down_revision = 'a0e1f2a3b456'
+branch_labels = None
+depends_on = None
+
+
+SUMMARY_COUNTER_KEYS = (
+    'total_jobs', 'completed_jobs', 'running_jobs', 'failed_jobs',
+    'single_jobs', 'batch_jobs', 'video_jobs', 'rtsp_jobs',
+    'total_predictions', 'total_detections', 'total_classifications', 'total_segmentations',
+)
+
+
+def _sync_campaign_summary(skip_unchanged: bool) -> str:
+    """sync_campaign_summary(), optionally returning early on updates that cannot change the counters."""
+    guard = """
+            -- summary_json and model_id only feed the counters of completed jobs; skip progress updates
+            IF TG_OP = 'UPDATE'
+                AND OLD.campaign_id IS NOT DISTINCT FROM NEW.campaign_id
+                AND OLD.status IS NOT DISTINCT FROM NEW.status
+                AND OLD.mode IS NOT DISTINCT FROM NEW.mode
+                AND (
+                    OLD.status::text <> 'completed'
+                    OR (OLD.model_id IS NOT DISTINCT FROM NEW.model_id AND OLD.summary_json IS NOT DISTINCT FROM NEW.summary_json)
+                ) THEN
+                RETURN NULL;
+            END IF;
+            """ if skip_unchanged else ""
+    return f"""
+        CREATE OR REPLACE FUNCTION sync_campaign_summary() RETURNS trigger AS $$
+        BEGIN{guard}
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM bump_campaign_summary(OLD.campaign_id, OLD.status::text, OLD.mode::text, OLD.model_id, OLD.summary_json, -1);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM bump_campaign_summary(NEW.campaign_id, NEW.status::text, NEW.mode::text, NEW.model_id, NEW.summary_json, 1);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+
+
+def _create_trigger(columns: str) -> str:
+    return f"""
+        CREATE TRIGGER trg_prediction_jobs_campaign_summary
+        AFTER INSERT OR DELETE OR UPDATE OF {columns} ON prediction_jobs
+        FOR EACH ROW EXECUTE FUNCTION sync_campaign_summary()
+    """
+
+
+def upgrade() -> None:
+    op.execute(_sync_campaign_summary(skip_unchanged=True))
+    op.execute("DROP TRIGGER IF EXISTS trg_prediction_jobs_campaign_summary ON prediction_jobs")
+    op.execute(_create_trigger("campaign_id, status, mode, model_id, summary_json"))
+    
+    # Counters may have drifted while summary_json/model_id changes went untracked; rebuild them
+    keys = ", ".join(f"'{key}'" for key in SUMMARY_COUNTER_KEYS)
+    op.execute(f"UPDATE campaigns SET summary_json = summary_json - ARRAY[{keys}]")
+    op.execute("""
+        SELECT bump_campaign_summary(campaign_id, status::text, mode::text, model_id, summary_json, 1)
+        FROM prediction_jobs
+        WHERE campaign_id IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_prediction_jobs_campaign_summary ON prediction_jobs")
+    op.execute(_create_trigger("campaign_id, status, mode"))
+    op.execute(_sync_campaign_summary(skip_unchanged=False))
@@ -0,0 +1,45 @@
+"""drop the unused jsonb_path_ops gin indexes on workflows.nodes and trigger_config
+
+Revision ID: c2a3b4c5d678
+Revises: b1f2a3b4c567
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2a3b4c5d678'
+down_revision = 'b1f2a3b4c567'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # No query filters workflows by JSON containment, so the indexes only add write cost
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_workflows_trigger_config_gin', table_name='workflows', postgresql_concurrently=True)
+        op.drop_index('ix_workflows_nodes_gin', table_name='workflows', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workflows_nodes_gin',
+            'workflows',
+            ['nodes'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'nodes': 'jsonb_path_ops'},
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_workflows_trigger_config_gin',
+            'workflows',
+            ['trigger_config'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'trigger_config': 'jsonb_path_ops'},
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,35 @@
+"""drop the unused trigger_data gin index on workflow_executions
+
+Revision ID: d3b4c5d6e789
+Revises: c2a3b4c5d678
+Create Date: 2026-10-17 15:10:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3b4c5d6e789'
+down_revision = 'c2a3b4c5d678'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # No query filters executions by trigger_data containment; every insert paid for the index
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_workflow_executions_trigger_data_gin', table_name='workflow_executions', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workflow_executions_trigger_data_gin',
+            'workflow_executions',
+            ['trigger_data'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'trigger_data': 'jsonb_path_ops'},
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,41 @@
+"""add models.updated_at and a partial index over ready models
+
+Revision ID: e4c5d6e7f890
+Revises: d3b4c5d6e789
+Create Date: 2026-10-17 15:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4c5d6e7f890'
+down_revision = 'd3b4c5d6e789'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # now() is stable, so existing rows take the default without a table rewrite
+    op.add_column(
+        'models',
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False)
+    )
+    
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_models_ready_updated_at',
+            'models',
+            ['updated_at'],
+            unique=False,
+            postgresql_where=sa.text("status = 'ready'"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_models_ready_updated_at', table_name='models', postgresql_concurrently=True)
+    op.drop_column('models', 'updated_at')
@@ -0,0 +1,141 @@
+"""gate the campaign summary update trigger with WHEN and coalesce a NULL campaign summary
+
+Revision ID: f5d6e7f8a901
+Revises: e4c5d6e7f890
+Create Date: 2026-10-17 15:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5d6e7f8a901'
+down_revision = 'e4c5d6e7f890'
+branch_labels = None
+depends_on = None
+
+
+def _bump_campaign_summary(coalesce_summary: bool) -> str:
+    """bump_campaign_summary() from 2c0d1e3f4a56, optionally treating a NULL campaign summary as {}."""
+    target = "COALESCE(c.summary_json, '{}'::jsonb)" if coalesce_summary else "c.summary_json"
+    return f"""
+        CREATE OR REPLACE FUNCTION bump_campaign_summary(
+            p_campaign_id integer, p_status text, p_mode text, p_model_id integer, p_summary jsonb, p_delta integer
+        ) RETURNS void AS $$
+        DECLARE
+            status_key text := CASE p_status
+                WHEN 'completed' THEN 'completed_jobs'
+                WHEN 'running' THEN 'running_jobs'
+                WHEN 'pending' THEN 'running_jobs'
+                WHEN 'failed' THEN 'failed_jobs'
+            END;
+            task text;
+            predictions numeric := 0;
+            counters jsonb;
+        BEGIN
+            IF p_campaign_id IS NULL THEN
+                RETURN;
+            END IF;
+    
+            counters := jsonb_build_object('total_jobs', p_delta, p_mode || '_jobs', p_delta);
+            IF status_key IS NOT NULL THEN
+                counters := counters || jsonb_build_object(status_key, p_delta);
+            END IF;
+    
+            -- Completed jobs contribute their prediction totals (same rules as calculate_campaign_stats)
+            IF p_status = 'completed' THEN
+                SELECT task_type INTO task FROM models WHERE id = p_model_id;
+                IF task = 'segment' THEN
+                    predictions := CASE WHEN jsonb_typeof(p_summary->'total_masks') = 'number' THEN (p_summary->>'total_masks')::numeric ELSE 0 END;
+                    counters := counters || jsonb_build_object('total_segmentations', p_delta * predictions);
+                ELSIF task IN ('detect', 'classify') THEN
+                    predictions := CASE WHEN jsonb_typeof(p_summary->'total_predictions') = 'number' THEN (p_summary->>'total_predictions')::numeric ELSE 0 END
+                        + CASE WHEN jsonb_typeof(p_summary->'total_detections') = 'number' THEN (p_summary->>'total_detections')::numeric ELSE 0 END;
+                    counters := counters || jsonb_build_object(
+                        CASE task WHEN 'detect' THEN 'total_detections' ELSE 'total_classifications' END,
+                        p_delta * predictions
+                    );
+                END IF;
+                counters := counters || jsonb_build_object('total_predictions', p_delta * predictions);
+            END IF;
+    
+            UPDATE campaigns c SET summary_json = {target} || (
+                SELECT jsonb_object_agg(key, COALESCE((c.summary_json->>key)::numeric, 0) + value::numeric)
+                FROM jsonb_each_text(counters)
+            )
+            WHERE c.id = p_campaign_id;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+
+
+def _sync_campaign_summary(skip_unchanged: bool) -> str:
+    """sync_campaign_summary(), optionally returning early on updates that cannot change the counters."""
+    guard = """
+            -- summary_json and model_id only feed the counters of completed jobs; skip progress updates
+            IF TG_OP = 'UPDATE'
+                AND OLD.campaign_id IS NOT DISTINCT FROM NEW.campaign_id
+                AND OLD.status IS NOT DISTINCT FROM NEW.status
+                AND OLD.mode IS NOT DISTINCT FROM NEW.mode
+                AND (
+                    OLD.status::text <> 'completed'
+                    OR (OLD.model_id IS NOT DISTINCT FROM NEW.model_id AND OLD.summary_json IS NOT DISTINCT FROM NEW.summary_json)
+                ) THEN
+                RETURN NULL;
+            END IF;
+            """ if skip_unchanged else ""
+    return f"""
+        CREATE OR REPLACE FUNCTION sync_campaign_summary() RETURNS trigger AS $$
+        BEGIN{guard}
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM bump_campaign_summary(OLD.campaign_id, OLD.status::text, OLD.mode::text, OLD.model_id, OLD.summary_json, -1);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM bump_campaign_summary(NEW.campaign_id, NEW.status::text, NEW.mode::text, NEW.model_id, NEW.summary_json, 1);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+
+
+def upgrade() -> None:
+    op.execute(_bump_campaign_summary(coalesce_summary=True))
+    
+    # WHEN cannot reference OLD on INSERT or NEW on DELETE, so updates get their own trigger.
+    # The WHEN clause is evaluated before the function is called: progress writes to running
+    # jobs no longer enter plpgsql or lock the campaign row.
+    op.execute("DROP TRIGGER IF EXISTS trg_prediction_jobs_campaign_summary ON prediction_jobs")
+    op.execute("""
+        CREATE TRIGGER trg_prediction_jobs_campaign_summary
+        AFTER INSERT OR DELETE ON prediction_jobs
+        FOR EACH ROW EXECUTE FUNCTION sync_campaign_summary()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_prediction_jobs_campaign_summary_update
+        AFTER UPDATE OF campaign_id, status, mode, model_id, summary_json ON prediction_jobs
+        FOR EACH ROW
+        WHEN (
+            OLD.status IS DISTINCT FROM NEW.status
+            OR OLD.campaign_id IS DISTINCT FROM NEW.campaign_id
+            OR OLD.mode IS DISTINCT FROM NEW.mode
+            OR (
+                NEW.status::text = 'completed'
+                AND (OLD.model_id IS DISTINCT FROM NEW.model_id OR OLD.summary_json IS DISTINCT FROM NEW.summary_json)
+            )
+        )
+        EXECUTE FUNCTION sync_campaign_summary()
+    """)
+    op.execute(_sync_campaign_summary(skip_unchanged=False))
+
+
+def downgrade() -> None:
+    op.execute(_sync_campaign_summary(skip_unchanged=True))
+    op.execute("DROP TRIGGER IF EXISTS trg_prediction_jobs_campaign_summary_update ON prediction_jobs")
+    op.execute("DROP TRIGGER IF EXISTS trg_prediction_jobs_campaign_summary ON prediction_jobs")
+    op.execute("""
+        CREATE TRIGGER trg_prediction_jobs_campaign_summary
+        AFTER INSERT OR DELETE OR UPDATE OF campaign_id, status, mode, model_id, summary_json ON prediction_jobs
+        FOR EACH ROW EXECUTE FUNCTION sync_campaign_summary()
+    """)
+    op.execute(_bump_campaign_summary(coalesce_summary=False))
@@ -13,7 +13,7 @@ from app.schemas.api_key import (
     ApiKeyCreateResponse
 )
 from app.utils.auth import get_current_active_user
-from app.utils.security import get_password_hash
+from app.utils.security import hash_api_key
 from app.utils.api_key_auth import generate_api_key
 
 router = APIRouter(prefix="/api/api-keys", tags=["API Keys"])
@@ -54,8 +54,8 @@ async def create_api_key(
     # Generate new API key
     full_key, key_prefix = generate_api_key()
     
-    # Hash the key for storage (same as password hashing)
-    key_hash = get_password_hash(full_key)
+    # Hash the key for storage (HMAC-SHA256, looked up directly on auth)
+    key_hash = hash_api_key(full_key)
     
     # Create API key record
     api_key = ApiKey(
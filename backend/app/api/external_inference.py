@@ -12,8 +12,8 @@ import time
 from datetime import datetime, timezone, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified
 
 from app.db import get_db
 from app.models.user import User
@@ -41,21 +41,20 @@ def check_rate_limit(user_id: int, db: Session) -> None:
     Raises HTTPException 429 if limit exceeded.
     """
     # Count calls in the last hour
+    # (count, oldest call) in one index-only scan of ix_inference_api_calls_user_called_at
     one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
-    call_count = db.query(InferenceApiCall).filter(
+    call_count, oldest_called_at = db.query(
+        func.count(),
+        func.min(InferenceApiCall.called_at)
+    ).filter(
         InferenceApiCall.user_id == user_id,
         InferenceApiCall.called_at >= one_hour_ago
-    ).count()
+    ).one()
     
     if call_count >= RATE_LIMIT_PER_HOUR:
         # Calculate retry-after (time until oldest call expires)
-        oldest_call = db.query(InferenceApiCall).filter(
-            InferenceApiCall.user_id == user_id,
-            InferenceApiCall.called_at >= one_hour_ago
-        ).order_by(InferenceApiCall.called_at).first()
-        
-        if oldest_call:
-            retry_after_seconds = int(3600 - (datetime.now(timezone.utc) - oldest_call.called_at).total_seconds())
+        if oldest_called_at:
+            retry_after_seconds = int(3600 - (datetime.now(timezone.utc) - oldest_called_at).total_seconds())
         else:
             retry_after_seconds = 3600
         
@@ -71,7 +70,7 @@ def get_model_by_api_key(model_key: str, user_id: int, db: Session) -> Model:
     
     All models are private - user must own the model to use it.
     """
-    model = db.query(Model).filter(Model.api_key == model_key).first()
+    model = Model.by_api_key(db, model_key)
     
     if not model:
         raise HTTPException(
@@ -301,8 +300,7 @@ async def infer_single_image(
                 total_masks=len(result.masks) if result.masks else 0,
                 mask_count_per_class={},
                 average_confidence=sum(result.scores) / len(result.scores) if result.scores else 0.0,
-                inference_time_ms=result.inference_time_ms or 0.0,
-                processing_time_ms=0.0
+                inference_time_ms=result.inference_time_ms or 0.0
             )
         elif model.task_type == "classify":
             job.update_stats(
@@ -311,8 +309,7 @@ async def infer_single_image(
                 top_class_distribution={result.top_class: 1} if result.top_class else {},
                 average_top_confidence=result.top_confidence or 0.0,
                 top_classes_summary=[{"class": result.top_class, "confidence": result.top_confidence}] if result.top_class else [],
-                inference_time_ms=result.inference_time_ms or 0.0,
-                processing_time_ms=0.0
+                inference_time_ms=result.inference_time_ms or 0.0
             )
         elif model.task_type == "detect":  # detect
             class_counts = {}
@@ -325,8 +322,7 @@ async def infer_single_image(
                 total_detections=len(result.boxes) if result.boxes else 0,
                 class_counts=class_counts,
                 average_confidence=sum(result.scores) / len(result.scores) if result.scores else 0.0,
-                inference_time_ms=result.inference_time_ms or 0.0,
-                processing_time_ms=0.0
+                inference_time_ms=result.inference_time_ms or 0.0
             )
         else:
             logger.warning(f"Unknown task_type '{model.task_type}' for job {job.id}") # reminder for new task types, transformer models, etc.
@@ -648,7 +644,6 @@ async def infer_batch_images(
         
         # Update job summary
         job.summary_json.update(summary_update)
-        flag_modified(job, "summary_json")
 
         # Update job status
         job.status = PredictionStatus.COMPLETED
@@ -716,25 +711,22 @@ async def get_usage_stats(
     one_hour_ago = now - timedelta(hours=1)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     
-    # Count calls in last hour
-    calls_last_hour = db.query(InferenceApiCall).filter(
+    # Count calls in last hour and find the oldest one for the reset time
+    calls_last_hour, oldest_called_at = db.query(
+        func.count(),
+        func.min(InferenceApiCall.called_at)
+    ).filter(
         InferenceApiCall.user_id == current_user.id,
         InferenceApiCall.called_at >= one_hour_ago
-    ).count()
+    ).one()
     
     # Count calls today
-    calls_today = db.query(InferenceApiCall).filter(
+    calls_today = db.query(func.count()).select_from(InferenceApiCall).filter(
         InferenceApiCall.user_id == current_user.id,
         InferenceApiCall.called_at >= today_start
-    ).count()
-    
-    # Find oldest call in current window for reset time
-    oldest_call = db.query(InferenceApiCall).filter(
-        InferenceApiCall.user_id == current_user.id,
-        InferenceApiCall.called_at >= one_hour_ago
-    ).order_by(InferenceApiCall.called_at).first()
+    ).scalar()
     
-    quota_resets_at = (oldest_call.called_at + timedelta(hours=1)) if oldest_call else now + timedelta(hours=1)
+    quota_resets_at = (oldest_called_at + timedelta(hours=1)) if oldest_called_at else now + timedelta(hours=1)
     
     return {
         "calls_last_hour": calls_last_hour,
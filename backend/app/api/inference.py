@@ -13,6 +13,7 @@ import json
 import uuid
 import cv2
 import base64
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -189,8 +190,7 @@ async def infer_single_image(
                 total_masks=len(result.masks) if result.masks else 0,
                 mask_count_per_class={},
                 average_confidence=sum(result.scores) / len(result.scores) if result.scores else 0.0,
-                inference_time_ms=result.inference_time_ms or 0.0,
-                processing_time_ms=0.0
+                inference_time_ms=result.inference_time_ms or 0.0
             )
         elif model.task_type == "classify":
             job.update_stats(
@@ -199,8 +199,7 @@ async def infer_single_image(
                 top_class_distribution={result.top_class: 1} if result.top_class else {},
                 average_top_confidence=result.top_confidence or 0.0,
                 top_classes_summary=[{"class": result.top_class, "confidence": result.top_confidence}] if result.top_class else [],
-                inference_time_ms=result.inference_time_ms or 0.0,
-                processing_time_ms=0.0
+                inference_time_ms=result.inference_time_ms or 0.0
             )
         elif model.task_type == "detect":  # detect
             class_counts = {}
@@ -213,8 +212,7 @@ async def infer_single_image(
                 total_detections=len(result.boxes) if result.boxes else 0,
                 class_counts=class_counts,
                 average_confidence=sum(result.scores) / len(result.scores) if result.scores else 0.0,
-                inference_time_ms=result.inference_time_ms or 0.0,
-                processing_time_ms=0.0
+                inference_time_ms=result.inference_time_ms or 0.0
             )
         else:
             logger.warning(f"Unknown task_type '{model.task_type}' for job {job.id}") # reminder for new task types, transformer models, etc.
@@ -1400,7 +1398,7 @@ async def capture_rtsp_frame(
             )
     
     # Check permissions
-    if job.creator_id != current_user.id and current_user.role.value != 'admin':
+    if job.creator_id != current_user.id and current_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access this job"
@@ -1917,40 +1915,32 @@ def __finalize_job_with_stats(
     # Stop the inference worker job
     prediction_worker.stop_job(job_id=job.id)
 
-    # Get all results for final summary
-    results = db.query(PredictionResult).filter(
+    # Counted in SQL; job.results would lazy-load every full result row
+    results_count = db.query(PredictionResult).filter(
         PredictionResult.prediction_job_id == job.id
-    ).all()
-    
-    # Get task type from job config or model
-    task_type = "detect"  # Default
-    try:
-        if job.config and hasattr(job.config, 'task_type'):
-            task_type = getattr(job.config, 'task_type', 'detect')
-        elif job.model:
-            task_type = job.model.task_type
-    except Exception as e:
-        logger.warning(f"Could not determine task_type for job {job.id}, defaulting to 'detect': {e}")
+    ).count()
     
-    # Use finalize_stats method to calculate and update stats with task-specific schema
+    # Load results and model eagerly and calculate stats with task-specific schema
     try:
-        job.finalize_stats(task_type=task_type, results=results)
+        PredictionJob.finalize_from_db(db, job.id)
     except Exception as e:
         logger.error(f"Failed to finalize stats for job {job.id}: {e}")
         # Fallback to basic stats update
+        total_detections = db.query(
+            func.coalesce(func.sum(func.json_array_length(PredictionResult.boxes_json)), 0)
+        ).filter(PredictionResult.prediction_job_id == job.id).scalar()
         job.update_stats(
             replace=True,
-            total_detections=sum(len(r.boxes_json or []) for r in results),
+            total_detections=int(total_detections),
             class_counts={},
             average_confidence=0.0,
-            inference_time_ms=0.0,
-            processing_time_ms=0.0
+            inference_time_ms=0.0
         )
     
     # Update metadata with final session info
     try:
         job.update_metadata(
-            frames_captured=len(results),
+            frames_captured=results_count,
             inactive_since=datetime.now(timezone.utc).isoformat() if final_status == PredictionStatus.CANCELLED else None
         )
     except Exception as e:
@@ -2132,16 +2122,15 @@ async def video_session_heartbeat(
             detail="You can only send heartbeat to your own sessions"
         )
     
-    # Update last activity
-    if job.summary_json:
-        job.summary_json["last_activity"] = datetime.now(timezone.utc).isoformat()
-        job.summary_json["inactive_warning_shown"] = False  # Reset warning flag
-        db.commit()
+    # Update last activity (feeds the last_activity_at generated column)
+    job.update_metadata(last_activity=datetime.now(timezone.utc).isoformat())
+    job.summary_json["inactive_warning_shown"] = False  # Reset warning flag
+    db.commit()
     
     return {
         "status": "ok",
         "job_id": job_id,
-        "last_activity": job.summary_json.get("last_activity") if job.summary_json else None
+        "last_activity": job.summary_json.get("metadata", {}).get("last_activity")
     }
 
 @router.get("/jobs/{job_id}/results", response_model=List[PredictionResponse])
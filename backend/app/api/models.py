@@ -6,7 +6,7 @@ from pathlib import Path
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload
 
 from app.db import get_db
 from app.models.user import User, UserRole
@@ -14,7 +14,7 @@ from app.models.model import Model, ModelStatus
 from app.models.project import Project
 from app.schemas.model import ModelCreate, ModelUpdate, ModelResponse, ModelDetail, BaseModelInfo
 from app.utils.auth import get_current_active_user
-from app.utils.permissions import require_project_admin_or_admin, check_project_ownership, get_user_accessible_project_ids
+from app.utils.permissions import require_project_admin_or_admin, check_project_ownership, get_user_accessible_project_ids_query
 from app.services.yolo_service import yolo_service
 from app.workers.model_validation_worker import model_validation_worker
 from app.config import settings
@@ -46,6 +46,7 @@ async def list_models(
     limit: int = 100,
     project_id: int = None,
     task_type: str = None,
+    tag: str = None,
     accessible: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -59,6 +60,7 @@ async def list_models(
         limit: Maximum number of records to return
         project_id: Optional filter by project ID
         task_type: Optional filter by task type (detect/classify/segment)
+        tag: Optional filter by tag (exact match)
         accessible: If true, filter by accessible projects (for operators)
         db: Database session
         current_user: Current authenticated user
@@ -66,12 +68,12 @@ async def list_models(
     Returns:
         List of models
     """
-    query = db.query(Model).options(joinedload(Model.project))
+    # One extra SELECT for all projects; anything else touched during serialization raises
+    query = db.query(Model).options(selectinload(Model.project), raiseload("*"))
     
     # Filter by accessible projects if requested (for operators)
     if accessible:
-        accessible_ids = get_user_accessible_project_ids(current_user, db)
-        query = query.filter(Model.project_id.in_(accessible_ids))
+        query = query.filter(Model.project_id.in_(get_user_accessible_project_ids_query(current_user)))
     
     if project_id:
         query = query.filter(Model.project_id == project_id)
@@ -79,8 +81,13 @@ async def list_models(
     if task_type:
         query = query.filter(Model.task_type == task_type)
     
+    if tag:
+        # tags @> ARRAY[tag], served by ix_models_tags_gin
+        query = query.filter(Model.tags.contains([tag]))
+    
     models = query.offset(skip).limit(limit).all()
-    return models
+    # Rows are trusted; skip per-row validation (FastAPI passes model instances through)
+    return [ModelResponse.from_db(model) for model in models]
 
 
 @router.post("", response_model=ModelResponse, status_code=status.HTTP_201_CREATED)
@@ -204,7 +211,7 @@ async def update_model(
     if model_data.description is not None:
         model.description = model_data.description
     if model_data.tags is not None:
-        model.tags = model_data.tags
+        model.tags = [tag.strip() for tag in model_data.tags.split(",") if tag.strip()]
     
     db.commit()
     db.refresh(model)
@@ -6,6 +6,7 @@ import os
 import shutil
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status, Body
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from PIL import Image
 from typing import Optional
 
@@ -67,7 +68,7 @@ async def change_password(
 ):
     """Change current user's password."""
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await run_in_threadpool(verify_password, password_data.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
@@ -82,7 +83,7 @@ async def change_password(
         )
     
     # Hash and update password
-    current_user.hashed_password = get_password_hash(password_data.new_password)
+    current_user.hashed_password = await run_in_threadpool(get_password_hash, password_data.new_password)
     db.commit()
     
     return {"message": "Password changed successfully"}
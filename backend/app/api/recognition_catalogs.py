@@ -4,7 +4,7 @@ Recognition Catalog API Router
 import time
 import shutil
 import zipfile
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
 from fastapi.responses import FileResponse
@@ -41,6 +41,7 @@ from datetime import datetime, timezone
 
 router = APIRouter(prefix="/api/recognition-catalogs", tags=["Recognition Catalogs"])
 
+
 # ===== Catalog Endpoints =====
 @router.get("", response_model=List[RecognitionCatalogResponse])
 async def list_catalogs(
@@ -225,8 +226,7 @@ async def create_label(
     
     db.add(new_label)
     
-    # Update catalog label count
-    catalog.label_count += 1
+    # label_count is maintained by trg_recognition_labels_counters
     catalog.updated_at = datetime.now(timezone.utc)
     
     db.commit()
@@ -320,9 +320,7 @@ async def delete_label(
     catalog = db.query(RecognitionCatalog).filter(RecognitionCatalog.id == catalog_id).first()
     check_catalog_ownership(catalog, current_user)
     
-    # Update catalog counts
-    catalog.label_count -= 1
-    catalog.image_count -= label.image_count
+    # Catalog counts are maintained by trg_recognition_labels_counters
     catalog.updated_at = datetime.now(timezone.utc)
     
     # Delete from database (cascades to images)
@@ -422,15 +420,6 @@ async def upload_images(
             except Exception as e:
                 print(f"❌ Failed to process {img.image_path}: {e}")
         
-        # Update counts
-        label.image_count = db.query(RecognitionImage).filter(
-            RecognitionImage.label_id == label_id
-        ).count()
-        
-        catalog.image_count = db.query(RecognitionImage).join(RecognitionLabel).filter(
-            RecognitionLabel.catalog_id == catalog_id
-        ).count()
-        
         db.commit()
         
     else:
@@ -561,7 +550,7 @@ async def search_similar(
         db_images = [
             {
                 "id": row.id,
-                "embedding": row.embedding,
+                "embedding": row.embedding.to_numpy() if row.embedding is not None else None,
                 "image_path": row.image_path,
                 "thumbnail_path": row.thumbnail_path,
                 "label_id": row.label_id,
@@ -669,7 +658,7 @@ async def search_by_text(
         db_images = [
             {
                 "id": row.id,
-                "embedding": row.embedding,
+                "embedding": row.embedding.to_numpy() if row.embedding is not None else None,
                 "image_path": row.image_path,
                 "thumbnail_path": row.thumbnail_path,
                 "label_id": row.label_id,
@@ -747,10 +736,8 @@ async def get_catalog_stats(
     
     check_catalog_ownership(catalog, current_user)
     
-    # Calculate stats
-    total_images = db.query(RecognitionImage).join(RecognitionLabel).filter(
-        RecognitionLabel.catalog_id == catalog_id
-    ).count()
+    # Calculate stats (image_count is kept current by the recognition_images trigger)
+    total_images = catalog.image_count or 0
     
     processed_images = db.query(RecognitionImage).join(RecognitionLabel).filter(
         RecognitionLabel.catalog_id == catalog_id,
@@ -797,38 +784,40 @@ async def upload_zip(
     if not file.filename or not file.filename.endswith('.zip'):
         raise HTTPException(status_code=400, detail="File must be a ZIP archive")
     
-    # Create temp directory for extraction
-    temp_dir = Path(settings.DATA_DIR) / "temp" / f"zip_upload_{int(time.time() * 1000)}"
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save uploaded ZIP
-    zip_path = temp_dir / file.filename
-    with open(zip_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
-    
+    zip_ref = None
     try:
-        # Extract ZIP
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir / "extracted")
-        
-        extracted_root = temp_dir / "extracted"
-        
-        # Process folder structure
-        labels_created = 0
-        images_uploaded = 0
-        recognition_service = get_recognition_service()
-        
-        # Find all directories (each is a label)
-        for label_dir in extracted_root.iterdir():
-            if not label_dir.is_dir():
+        # Read the archive directly from the uploaded file; members are streamed
+        # to their destination instead of being extracted to a temp directory
+        zip_ref = zipfile.ZipFile(file.file, 'r')
+        
+        # Group image members by their top-level folder (each is a label)
+        members_by_label = {}
+        for info in zip_ref.infolist():
+            if info.is_dir():
                 continue
             
+            parts = PurePosixPath(info.filename).parts
+            if len(parts) != 2:
+                continue
+            
+            label_name, image_name = parts
+            
             # Skip hidden/system folders
-            if label_dir.name.startswith('.') or label_dir.name.startswith('__'):
+            if label_name.startswith('.') or label_name.startswith('__'):
                 continue
             
-            label_name = label_dir.name
+            # Check if it's an image
+            if PurePosixPath(image_name).suffix.lower() not in ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp']:
+                continue
             
+            members_by_label.setdefault(label_name, []).append(info)
+        
+        # Process folder structure
+        labels_created = 0
+        images_uploaded = 0
+        recognition_service = get_recognition_service()
+        
+        for label_name, members in members_by_label.items():
             # Check if label already exists
             existing_label = db.query(RecognitionLabel).filter(
                 RecognitionLabel.catalog_id == catalog_id,
@@ -856,23 +845,20 @@ async def upload_zip(
             
             # Process images in this label folder
             image_files = []
-            for img_file in label_dir.iterdir():
-                if not img_file.is_file():
-                    continue
-                
-                # Check if it's an image
-                if img_file.suffix.lower() not in ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp']:
-                    continue
+            for info in members:
+                image_name = PurePosixPath(info.filename).name
                 
                 # Generate unique filename
                 timestamp = int(time.time() * 1000)
-                new_filename = f"{timestamp}_{img_file.name}"
+                new_filename = f"{timestamp}_{image_name}"
                 dest_path = label_storage_dir / new_filename
                 
-                # Copy image
-                shutil.copy2(img_file, dest_path)
+                # Stream image bytes as-is (no re-encode)
+                with zip_ref.open(info) as src, open(dest_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
                 
-                # Create thumbnail
+                # One thumbnail per image, named like the image itself, so deleting an image
+                # never removes a thumbnail another image still points to
                 thumbnail_dir = label_storage_dir / "thumbnails"
                 thumbnail_dir.mkdir(exist_ok=True)
                 thumbnail_path = thumbnail_dir / new_filename
@@ -937,21 +923,6 @@ async def upload_zip(
                     image_ids=image_ids
                 )
         
-        # Update catalog counts
-        catalog.label_count = db.query(RecognitionLabel).filter(
-            RecognitionLabel.catalog_id == catalog_id
-        ).count()
-        
-        catalog.image_count = db.query(RecognitionImage).join(RecognitionLabel).filter(
-            RecognitionLabel.catalog_id == catalog_id
-        ).count()
-        
-        # Update each label's image count
-        for label_obj in db.query(RecognitionLabel).filter(RecognitionLabel.catalog_id == catalog_id).all():
-            label_obj.image_count = db.query(RecognitionImage).filter(
-                RecognitionImage.label_id == label_obj.id
-            ).count()
-        
         db.commit()
         
         return {
@@ -967,6 +938,5 @@ async def upload_zip(
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to process ZIP: {str(e)}")
     finally:
-        # Cleanup temp directory
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+        if zip_ref is not None:
+            zip_ref.close()
@@ -1,9 +1,11 @@
 """
 Reports API Router
 """
+import hashlib
 from typing import Optional
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.db import get_db
@@ -18,8 +20,18 @@ from app.utils.auth import get_current_active_user
 router = APIRouter(prefix="/api/reports", tags=["Reports"])
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check: accepts '*', comma-separated lists and weak (W/) validators."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
 @router.get("/training/summary", response_model=TrainingSummary)
 async def get_training_summary(
+    request: Request,
+    response: Response,
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
     db: Session = Depends(get_db),
@@ -28,7 +40,12 @@ async def get_training_summary(
     """
     Get training summary report.
     
+    Responds with 304 Not Modified when the client's If-None-Match matches the
+    current ETag, skipping the best-model scan and the recent/metrics queries.
+    
     Args:
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag/Cache-Control headers)
         start_date: Optional start date filter
         end_date: Optional end date filter
         db: Database session
@@ -45,15 +62,43 @@ async def get_training_summary(
     if end_date:
         query = query.filter(TrainingJob.created_at <= end_date)
     
-    # Get counts by status
-    total_jobs = query.count()
-    completed_jobs = query.filter(TrainingJob.status == TrainingStatus.COMPLETED).count()
-    failed_jobs = query.filter(TrainingJob.status == TrainingStatus.FAILED).count()
-    running_jobs = query.filter(TrainingJob.status == TrainingStatus.RUNNING).count()
+    # Get counts, progress and average epochs per status in one aggregate
+    status_rows = query.with_entities(
+        TrainingJob.status,
+        func.count(TrainingJob.id),
+        func.sum(TrainingJob.progress),
+        func.max(TrainingJob.completed_at),
+        func.avg(TrainingJob.total_epochs)
+    ).group_by(TrainingJob.status).all()
+    status_counts = {row[0]: row[1] for row in status_rows}
+    
+    # ETag fingerprints job state and the ready models (best_model inputs); updated_at moves
+    # on every model write, so count + max(updated_at) covers name/metrics/status changes
+    ready_count, ready_updated_at = db.query(
+        func.count(Model.id),
+        func.max(Model.updated_at)
+    ).filter(Model.status == "ready").one()
+    fingerprint = (
+        f"{start_date}-{end_date}-{sorted((str(r[0]), r[1], r[2], str(r[3])) for r in status_rows)}"
+        f"-{ready_count}-{ready_updated_at}"
+    )
+    etag = f'"{hashlib.md5(fingerprint.encode()).hexdigest()}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=10"}
     
-    # Calculate average epochs
-    completed = query.filter(TrainingJob.status == TrainingStatus.COMPLETED).all()
-    average_epochs = sum(j.total_epochs for j in completed) / len(completed) if completed else 0
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+    response.headers.update(cache_headers)
+    
+    total_jobs = sum(status_counts.values())
+    completed_jobs = status_counts.get(TrainingStatus.COMPLETED, 0)
+    failed_jobs = status_counts.get(TrainingStatus.FAILED, 0)
+    running_jobs = status_counts.get(TrainingStatus.RUNNING, 0)
+    
+    # Average epochs of completed jobs, computed in SQL
+    average_epochs = next(
+        (float(row[4] or 0) for row in status_rows if row[0] == TrainingStatus.COMPLETED),
+        0
+    )
     
     # Get best model (highest mAP)
     best_model = None
@@ -86,9 +131,15 @@ async def get_training_summary(
         for j in recent
     ]
     
-    # Get metrics over time
+    # Get metrics over time (last 20 completed jobs, oldest first)
+    completed = query.filter(TrainingJob.status == TrainingStatus.COMPLETED).with_entities(
+        TrainingJob.id,
+        TrainingJob.created_at,
+        TrainingJob.metrics_json
+    ).order_by(TrainingJob.created_at.desc()).limit(20).all()
+    
     metrics_over_time = []
-    for job in completed[:20]:  # Last 20 completed jobs
+    for job in reversed(completed):
         if job.metrics_json:
             metrics_over_time.append({
                 "job_id": job.id,
@@ -196,13 +247,21 @@ async def get_Prediction_summary(
     if start_date is None:
         start_date = datetime.now() - timedelta(days=30)
     
-    completed = query.filter(PredictionJob.status == PredictionStatus.COMPLETED).all()
-    for job in completed[-30:]:
-        if job.summary_json:
-            Prediction_frequency.append({
-                "date": job.created_at.date().isoformat(),
-                "count": job.summary_json.get("total_Predictions", 0)
-            })
+    # Aggregate per day in SQL instead of decoding each job's summary_json
+    job_date = func.date(PredictionJob.created_at)
+    daily_counts = query.with_entities(
+        job_date,
+        func.sum(PredictionJob.summary_json["total_Predictions"].as_integer())
+    ).filter(
+        PredictionJob.status == PredictionStatus.COMPLETED,
+        PredictionJob.created_at >= start_date
+    ).group_by(job_date).order_by(job_date).all()
+    
+    for day, count in daily_counts:
+        Prediction_frequency.append({
+            "date": day.isoformat(),
+            "count": int(count or 0)
+        })
     
     # Task type breakdown
     task_type_breakdown = {}
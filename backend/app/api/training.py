@@ -94,32 +94,35 @@ async def start_training(
         task_type=dataset.task_type,
         project_id=training_data.project_id
     )
-    db.add(new_model)
-    db.commit()
-    db.refresh(new_model)
     
-    # Create training job
+    # Create training job in the same transaction; the flush issues both
+    # INSERT ... RETURNING statements so no refresh round-trips are needed
     new_job = TrainingJob(
         project_id=training_data.project_id,
-        model_id=new_model.id,
+        model=new_model,
         total_epochs=training_data.epochs
     )
     db.add(new_job)
+    db.flush()
+    
+    # Read everything needed before commit, which would expire the instances
+    response = TrainingJobResponse.model_validate(new_job)
+    dataset_path = str(dataset.get_dataset_path())
+    task_type = dataset.task_type
     db.commit()
-    db.refresh(new_job)
     
     # Prepare output directory
-    output_dir = Path(settings.models_dir) / str(new_model.id)
+    output_dir = Path(settings.models_dir) / str(response.model_id)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Start training in background with full path to base model
     training_worker.start_training(
-        job_id=new_job.id,
-        project_id=project.id,
-        model_id=new_model.id,
-        dataset_path=str(dataset.get_dataset_path()),
+        job_id=response.id,
+        project_id=response.project_id,
+        model_id=response.model_id,
+        dataset_path=dataset_path,
         output_dir=str(output_dir),
-        task_type=dataset.task_type,
+        task_type=task_type,
         base_model=str(base_model_path),
         epochs=training_data.epochs,
         batch_size=training_data.batch_size,
@@ -127,7 +130,7 @@ async def start_training(
         learning_rate=training_data.learning_rate
     )
     
-    return new_job
+    return response
 
 @router.get("/{job_id}", response_model=TrainingJobResponse)
 async def get_training_job(
@@ -229,13 +232,12 @@ async def list_training_jobs(
     Returns:
         List of training jobs
     """
-    from app.utils.permissions import get_user_accessible_project_ids
+    from app.utils.permissions import get_user_accessible_project_ids_query
     
     query = db.query(TrainingJob)
     
-    # Filter by accessible projects
-    accessible_project_ids = get_user_accessible_project_ids(current_user, db)
-    query = query.filter(TrainingJob.project_id.in_(accessible_project_ids))
+    # Filter by accessible projects (semi-join, not a bound ID list)
+    query = query.filter(TrainingJob.project_id.in_(get_user_accessible_project_ids_query(current_user)))
     
     if project_id:
         query = query.filter(TrainingJob.project_id == project_id)
@@ -2,17 +2,18 @@
 Uploads API Router
 Handles file uploads for workflows with File Management integration
 """
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 import os
 
 from app.db import get_db
 from app.models.user import User
 from app.models.workflow import Workflow
-from app.models.project import Project
 from app.schemas.uploads import FileUploadResponse, FileDeleteResponse
 from app.utils.auth import get_current_active_user
 from app.services.file_storage_service import FileStorageService
+from app.utils.file_manager import delete_workflow_uploads
+from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,9 +21,20 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/uploads", tags=["uploads"])
 
 
+def _workflow_accessible(db: Session, workflow_id: int, user: User) -> bool:
+    """Return True if the workflow exists and is owned by the user (EXISTS, no row load)."""
+    return db.query(
+        db.query(Workflow.id).filter(
+            Workflow.id == workflow_id,
+            Workflow.creator_id == user.id
+        ).exists()
+    ).scalar()
+
+
 @router.post("/workflows/{workflow_id}/upload", response_model=FileUploadResponse)
 async def upload_workflow_file(
     workflow_id: int,
+    request: Request,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -34,23 +46,36 @@ async def upload_workflow_file(
     Enforces 50GB storage quota and creates UserFile database record.
     """
     # Verify workflow exists and user has access
-    workflow = db.query(Workflow).join(Project).filter(
-        Workflow.id == workflow_id,
-        Project.creator_id == current_user.id
-    ).first()
-    
-    if not workflow:
+    if not _workflow_accessible(db, workflow_id, current_user):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workflow {workflow_id} not found or access denied"
         )
     
+    file_storage = FileStorageService(db)
+    
+    # Cheap quota pre-check from the declared request size so over-quota
+    # uploads are rejected before anything is written to disk
+    try:
+        declared_size = int(request.headers.get("content-length") or 0)
+    except ValueError:
+        declared_size = -1
+    if declared_size < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid Content-Length header"
+        )
+    if file_storage.calculate_user_storage(current_user.id) + declared_size > settings.MAX_USER_STORAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Storage quota exceeded"
+        )
+    
     # Use FileStorageService for upload (enforces quota, creates DB record)
     try:
-        file_storage = FileStorageService(db)
         folder_path = f"workflows/{workflow_id}"
         
-        user_file = file_storage.upload_file(
+        user_file = await file_storage.upload_file_async(
             user_id=current_user.id,
             file=file,
             folder_path=folder_path
@@ -86,12 +111,7 @@ async def delete_workflow_file(
     Delete specific uploaded file.
     """
     # Verify workflow exists and user has access
-    workflow = db.query(Workflow).join(Project).filter(
-        Workflow.id == workflow_id,
-        Project.creator_id == current_user.id
-    ).first()
-    
-    if not workflow:
+    if not _workflow_accessible(db, workflow_id, current_user):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workflow {workflow_id} not found or access denied"
@@ -105,19 +125,18 @@ async def delete_workflow_file(
             detail="Cannot delete file from different workflow"
         )
     
-    # Delete file
+    # Delete file (single unlink; a missing file is reported, not an error)
     try:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            return FileDeleteResponse(
-                success=True,
-                message="File deleted successfully"
-            )
-        else:
-            return FileDeleteResponse(
-                success=False,
-                message="File not found"
-            )
+        os.unlink(file_path)
+        return FileDeleteResponse(
+            success=True,
+            message="File deleted successfully"
+        )
+    except FileNotFoundError:
+        return FileDeleteResponse(
+            success=False,
+            message="File not found"
+        )
     except Exception as e:
         logger.error(f"Error deleting file: {e}")
         raise HTTPException(
@@ -136,12 +155,7 @@ async def delete_all_workflow_files(
     Delete all uploaded files for workflow.
     """
     # Verify workflow exists and user has access
-    workflow = db.query(Workflow).join(Project).filter(
-        Workflow.id == workflow_id,
-        Project.creator_id == current_user.id
-    ).first()
-    
-    if not workflow:
+    if not _workflow_accessible(db, workflow_id, current_user):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workflow {workflow_id} not found or access denied"
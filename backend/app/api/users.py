@@ -4,8 +4,9 @@ Admin-only endpoints for managing users, roles, and permissions.
 """
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, aliased, load_only, raiseload
+from sqlalchemy import func, select, exists, literal, union_all
 
 from app.db import get_db
 from app.models.user import User, UserRole
@@ -25,6 +26,64 @@ from app.utils.permissions import require_admin
 router = APIRouter(prefix="/api/users", tags=["User Management"])
 
 
+def _query_users_with_resource_counts(db: Session):
+    """
+    Build a query yielding (User, datasets_count, projects_count, prediction_jobs_count).
+    
+    All owned resources are combined into one UNION ALL of (creator_id, kind)
+    rows and counted per creator in a single CTE using FILTER aggregates, so
+    the planner does one hash aggregate and any page of users is fetched in a
+    single round-trip.
+    """
+    resources = union_all(
+        select(Dataset.creator_id.label("creator_id"), literal("dataset").label("kind")),
+        select(Project.creator_id.label("creator_id"), literal("project").label("kind")),
+        select(PredictionJob.creator_id.label("creator_id"), literal("prediction_job").label("kind"))
+    ).subquery()
+    
+    counts = select(
+        resources.c.creator_id,
+        func.count().filter(resources.c.kind == "dataset").label("datasets_count"),
+        func.count().filter(resources.c.kind == "project").label("projects_count"),
+        func.count().filter(resources.c.kind == "prediction_job").label("prediction_jobs_count")
+    ).group_by(resources.c.creator_id).cte("resource_counts")
+    
+    # The response schema reads plain columns only: skip the password hash and
+    # forbid relationship lazy loads so a schema change can't reintroduce N+1
+    return db.query(
+        User,
+        func.coalesce(counts.c.datasets_count, 0),
+        func.coalesce(counts.c.projects_count, 0),
+        func.coalesce(counts.c.prediction_jobs_count, 0)
+    ).outerjoin(
+        counts, counts.c.creator_id == User.id
+    ).options(
+        load_only(
+            User.id, User.email, User.role, User.is_active, User.created_at,
+            User.first_name, User.last_name, User.profile_image
+        ),
+        raiseload("*")
+    )
+
+
+def _with_resource_counts(user: User, datasets_count: int, projects_count: int, prediction_jobs_count: int) -> UserWithResourceCounts:
+    """
+    Build a UserWithResourceCounts response from a user row and its counts.
+    
+    Rows come straight from the database, so the model is constructed without
+    per-row validation; FastAPI still serializes it through the response model.
+    role is stored as a plain string, so it is converted to UserRole here.
+    """
+    fields = {name: getattr(user, name) for name in UserResponse.model_fields}
+    fields['role'] = UserRole(fields['role'])
+    return UserWithResourceCounts.model_construct(
+        **fields,
+        datasets_count=datasets_count,
+        projects_count=projects_count,
+        prediction_jobs_count=prediction_jobs_count
+    )
+
+
 @router.get("", response_model=List[UserWithResourceCounts])
 async def list_users(
     skip: int = Query(0, ge=0),
@@ -48,7 +107,7 @@ async def list_users(
         limit: Maximum number of records to return
         role: Filter by user role (ADMIN, PROJECT_ADMIN, OPERATOR)
         is_active: Filter by active status (True/False)
-        search: Search by username or email (case-insensitive)
+        search: Search by email or name (case-insensitive; terms under 3 characters match as prefixes)
         db: Database session
         current_user: Current authenticated user
         
@@ -69,7 +128,7 @@ async def list_users(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin or Project Admin access required"
         )
-    query = db.query(User)
+    query = _query_users_with_resource_counts(db)
     
     # Apply filters
     if role:
@@ -79,38 +138,19 @@ async def list_users(
         query = query.filter(User.is_active == is_active)
     
     if search:
-        search_term = f"%{search}%"
+        # Infix terms need 3+ characters to yield a trigram the GIN indexes can use;
+        # shorter terms match as prefixes, which still extract word-start trigrams
+        search_term = f"%{search}%" if len(search) >= 3 else f"{search}%"
         query = query.filter(
-            (User.username.ilike(search_term)) | 
-            (User.email.ilike(search_term))
+            (User.email.ilike(search_term)) |
+            (User.first_name.ilike(search_term)) |
+            (User.last_name.ilike(search_term))
         )
     
-    # Get users
-    users = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
+    # Get users with resource counts in one query
+    rows = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
     
-    # Attach resource counts
-    result = []
-    for user in users:
-        datasets_count = db.query(func.count(Dataset.id)).filter(
-            Dataset.creator_id == user.id
-        ).scalar()
-        
-        projects_count = db.query(func.count(Project.id)).filter(
-            Project.creator_id == user.id
-        ).scalar()
-        
-        prediction_jobs_count = db.query(func.count(PredictionJob.id)).filter(
-            PredictionJob.creator_id == user.id
-        ).scalar()
-        
-        user_dict = UserWithResourceCounts.model_validate(user)
-        user_dict.datasets_count = datasets_count
-        user_dict.projects_count = projects_count
-        user_dict.prediction_jobs_count = prediction_jobs_count
-        
-        result.append(user_dict)
-    
-    return result
+    return [_with_resource_counts(*row) for row in rows]
 
 
 @router.get("/{user_id}", response_model=UserWithResourceCounts)
@@ -131,33 +171,15 @@ async def get_user(
     Returns:
         User details with resource counts
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    row = _query_users_with_resource_counts(db).filter(User.id == user_id).first()
     
-    if not user:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    # Get resource counts
-    datasets_count = db.query(func.count(Dataset.id)).filter(
-        Dataset.creator_id == user.id
-    ).scalar()
-    
-    projects_count = db.query(func.count(Project.id)).filter(
-        Project.creator_id == user.id
-    ).scalar()
-    
-    prediction_jobs_count = db.query(func.count(PredictionJob.id)).filter(
-        PredictionJob.creator_id == user.id
-    ).scalar()
-    
-    user_dict = UserWithResourceCounts.model_validate(user)
-    user_dict.datasets_count = datasets_count
-    user_dict.projects_count = projects_count
-    user_dict.prediction_jobs_count = prediction_jobs_count
-    
-    return user_dict
+    return _with_resource_counts(*row)
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -189,7 +211,7 @@ async def create_user(
     # Create new user
     new_user = User(
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await run_in_threadpool(get_password_hash, user_data.password),
         role=user_data.role,
         is_active=True,
         first_name=user_data.first_name,
@@ -197,10 +219,13 @@ async def create_user(
     )
     
     db.add(new_user)
+    db.flush()  # INSERT ... RETURNING populates id and created_at
+    
+    # Serialize before commit so the expired instance needn't be reloaded
+    response = UserResponse.model_validate(new_user)
     db.commit()
-    db.refresh(new_user)
     
-    return new_user
+    return response
 
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -228,14 +253,24 @@ async def update_user(
     Returns:
         Updated user
     """
-    user = db.query(User).filter(User.id == user_id).first()
-    
-    if not user:
+    # Fetch the user together with everything the validations below need
+    # (owned resource counts and email availability) in one round-trip
+    other_user = aliased(User)
+    row = db.query(
+        User,
+        select(func.count(Dataset.id)).where(Dataset.creator_id == user_id).scalar_subquery(),
+        select(func.count(Project.id)).where(Project.creator_id == user_id).scalar_subquery(),
+        exists().where(other_user.email == user_data.email, other_user.id != user_id)
+    ).filter(User.id == user_id).first()
+    
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
+    user, datasets_count, projects_count, email_taken = row
+    
     # Self-demotion protection: cannot change own role
     if user.id == current_user.id and user_data.role and user_data.role != user.role:
         raise HTTPException(
@@ -246,14 +281,6 @@ async def update_user(
     # Role downgrade validation: PROJECT_ADMIN -> OPERATOR
     if user_data.role and user_data.role == UserRole.OPERATOR and user.role == UserRole.PROJECT_ADMIN:
         # Check if user owns resources
-        datasets_count = db.query(func.count(Dataset.id)).filter(
-            Dataset.creator_id == user.id
-        ).scalar()
-        
-        projects_count = db.query(func.count(Project.id)).filter(
-            Project.creator_id == user.id
-        ).scalar()
-        
         if datasets_count > 0 or projects_count > 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -263,11 +290,7 @@ async def update_user(
     # Update email if provided and different
     if user_data.email and user_data.email != user.email:
         # Check email uniqueness
-        existing_email = db.query(User).filter(
-            User.email == user_data.email,
-            User.id != user_id
-        ).first()
-        if existing_email:
+        if email_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already in use by another user"
@@ -284,7 +307,7 @@ async def update_user(
     
     # Update password if provided
     if user_data.password:
-        user.hashed_password = get_password_hash(user_data.password)
+        user.hashed_password = await run_in_threadpool(get_password_hash, user_data.password)
     
     # Update first_name if provided
     if user_data.first_name is not None:
@@ -294,10 +317,11 @@ async def update_user(
     if user_data.last_name is not None:
         user.last_name = user_data.last_name
     
+    # The in-memory user is already current; serialize before commit expires it
+    response = UserResponse.model_validate(user)
     db.commit()
-    db.refresh(user)
     
-    return user
+    return response
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -403,7 +427,9 @@ async def reactivate_user(
         )
     
     user.is_active = True
+    
+    # The in-memory user is already current; serialize before commit expires it
+    response = UserResponse.model_validate(user)
     db.commit()
-    db.refresh(user)
     
-    return user
+    return response
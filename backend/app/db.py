@@ -1,16 +1,44 @@
 """
 ATVISION Database Configuration
 """
-from sqlalchemy import create_engine
+from functools import lru_cache
+from typing import List, Type
+import enum
+
+import numpy as np
+import orjson
+from sqlalchemy import create_engine, CheckConstraint
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.config import settings
 
-# Create database engine
+
+def _json_default(value):
+    """Fallback for types orjson cannot serialize natively (numpy scalars such as float64)."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(value) -> str:
+    """JSON/JSONB bind serializer; orjson returns bytes and the driver expects str."""
+    return orjson.dumps(
+        value,
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+
+# Create database engine (one pool per process, shared by requests and worker threads).
+# Pre-ping drops connections left stale by a server restart or failover; recycling
+# hourly keeps idle connections from being cut by proxies/firewalls.
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_recycle=3600,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
 )
 
 # Create session factory
@@ -20,6 +48,28 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+@lru_cache(maxsize=None)
+def enum_values(enum_cls: Type[enum.Enum]) -> List[str]:
+    """
+    values_callable for Enum columns: persist members by value, not name.
+
+    Cached per enum class so every column sharing an enum reuses one list.
+    """
+    return [member.value for member in enum_cls]
+
+
+def enum_check(column: str, enum_cls: Type[enum.Enum], name: str) -> CheckConstraint:
+    """
+    CHECK constraint limiting a plain String column to enum_cls values.
+
+    Used instead of a native Enum column where rows are read in bulk: the
+    driver returns str values directly, and str-based enums still compare
+    equal to them.
+    """
+    values = ", ".join(f"'{value}'" for value in enum_values(enum_cls))
+    return CheckConstraint(f"{column} IN ({values})", name=name)
+
+
 def get_db():
     """
     Dependency to get database session.
@@ -38,6 +88,6 @@ def init_db():
     Called on application startup.
     """
     # Import all models to register them with Base
-    
+
     # Create all tables
     Base.metadata.create_all(bind=engine)
@@ -2,13 +2,17 @@
 ATVISION Main Application
 FastAPI + Svelte Monolithic App
 """
+import inspect
 import os
 from pathlib import Path
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.routing import serialize_response
 from contextlib import asynccontextmanager
+from sqlalchemy import select
 
 from app.config import settings
 from app.db import init_db, SessionLocal
@@ -18,6 +22,7 @@ from app.utils.security import get_password_hash
 from app.api import auth, datasets, projects, models, training, reports, system, users
 from app.workers.campaign_cleanup_worker import campaign_cleanup_worker
 from app.workers.trash_cleanup_worker import trash_cleanup_worker
+from app.workers.partition_maintenance_worker import partition_maintenance_worker
 from app.services.scheduler_service import scheduler_service
 
 
@@ -36,46 +41,39 @@ async def lifespan(app: FastAPI):
     # Create default admin user if not exists
     db = SessionLocal()
     try:
-        # Ensure admin user exists
-        admin = db.query(User).filter(User.email == "admin@atvision.com").first()
-        if not admin:
-            admin = User(
-                email="admin@atvision.com",
-                hashed_password=get_password_hash("admin"),
-                role=UserRole.ADMIN
-            )
-            db.add(admin)
-            db.commit()
-            print("✅ Default admin user created (email: admin@atvision.com, password: admin)")
+        # Look up the default admin and the "Based" system project in one query
+        admin_id, based_project_id = db.query(
+            select(User.id).where(User.email == "admin@atvision.com").scalar_subquery(),
+            select(Project.id).where(Project.name == "Based").limit(1).scalar_subquery()
+        ).one()
         
-        # Keep regular admin for backward compatibility
-        admin = db.query(User).filter(User.email == "admin@atvision.com").first()
-        if not admin:
+        # Ensure admin user exists
+        if admin_id is None:
             admin = User(
                 email="admin@atvision.com",
                 hashed_password=get_password_hash("admin"),
                 role=UserRole.ADMIN
             )
             db.add(admin)
-            db.commit()
+            db.flush()  # Assign admin.id for the system project below
+            admin_id = admin.id
             print("✅ Default admin user created (email: admin@atvision.com, password: admin)")
         
         # Create "Based" system project if not exists
-        based_project = db.query(Project).filter(Project.name == "Based").first()
-        if not based_project:
+        if based_project_id is None:
             # Use admin as creator
-            creator = admin
             based_project = Project(
                 name="Based",
                 dataset_id=None,
                 task_type="classify, detect, segment",
                 status=ProjectStatus.CREATED.value,
                 is_system=True,
-                creator_id=creator.id
+                creator_id=admin_id
             )
             db.add(based_project)
-            db.commit()
             print("✅ System project 'Based' created for hosting predefined models")
+        
+        db.commit()
     finally:
         db.close()
     
@@ -92,6 +90,9 @@ async def lifespan(app: FastAPI):
     # Start trash cleanup worker
     trash_cleanup_worker.start()
     
+    # Start partition maintenance worker
+    partition_maintenance_worker.start()
+    
     # Start scheduler service
     scheduler_service.start()
     scheduler_service.restore_schedules()
@@ -104,15 +105,22 @@ async def lifespan(app: FastAPI):
     print("👋 Shutting down ATVISION...")
     campaign_cleanup_worker.stop()
     trash_cleanup_worker.stop()
+    partition_maintenance_worker.stop()
     scheduler_service.stop()
 
 
+# Newer FastAPI serializes response models straight to JSON bytes with pydantic-core,
+# but only for routes on the default response class; older versions go through a
+# Python dict + json.dumps, where orjson is the faster encoder.
+_PYDANTIC_JSON_RESPONSES = "dump_json" in inspect.signature(serialize_response).parameters
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="ATVision Hub - Monolithic FastAPI + Svelte Application",
-    lifespan=lifespan
+    lifespan=lifespan,
+    **({} if _PYDANTIC_JSON_RESPONSES else {"default_response_class": ORJSONResponse})
 )
 
 # Configure CORS (for development)
@@ -160,34 +168,58 @@ app.include_router(inference.router)
 from app.api import external_inference
 app.include_router(external_inference.router)
 
+class DataStaticFiles(StaticFiles):
+    """
+    Static file app for uploaded data (profile images, prediction outputs, ...).
+    
+    FileResponse already supports Range requests and hands the file to the
+    server via pathsend when available; otherwise it streams the body through
+    ASGI in 64 KiB chunks. Large outputs are sent in bigger chunks so each
+    download costs far fewer event-loop round-trips.
+    """
+    
+    CHUNK_SIZE = 1024 * 1024  # 1 MiB
+    
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if isinstance(response, FileResponse):
+            response.chunk_size = self.CHUNK_SIZE
+        return response
+
+
 # Mount data directory for serving uploaded files (profile images, etc.)
 DATA_DIR = Path(__file__).parent.parent / "data"
 if DATA_DIR.exists():
-    app.mount("/api/data", StaticFiles(directory=DATA_DIR), name="data")
+    app.mount("/api/data", DataStaticFiles(directory=DATA_DIR), name="data")
 
 # Mount static files for Svelte frontend (production)
 FRONTEND_DIST = Path(__file__).parent.parent.parent / "frontend" / "dist"
 
+
+class SPAStaticFiles(StaticFiles):
+    """
+    Static file app for the Svelte SPA.
+    
+    Serves built files directly and falls back to index.html for unknown
+    non-API paths so client-side routes resolve.
+    """
+    
+    async def get_response(self, path: str, scope):
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as exc:
+            # Don't serve SPA for API routes
+            if exc.status_code != 404 or path.startswith("api/"):
+                raise
+            return await super().get_response("index.html", scope)
+
+
 if FRONTEND_DIST.exists():
     # Mount static assets
     app.mount("/assets", StaticFiles(directory=FRONTEND_DIST / "assets"), name="assets")
     
-    # Serve index.html for all non-API routes (SPA fallback)
-    @app.get("/{full_path:path}")
-    async def serve_spa(request: Request, full_path: str):
-        """
-        Serve Svelte SPA for all non-API routes.
-        """
-        # Don't serve SPA for API routes
-        if full_path.startswith("api/"):
-            return {"detail": "Not Found"}
-        
-        # Serve index.html
-        index_file = FRONTEND_DIST / "index.html"
-        if index_file.exists():
-            return FileResponse(index_file)
-        
-        return {"detail": "Frontend not built"}
+    # Serve the SPA for all remaining routes; mounted last so API routes win
+    app.mount("/", SPAStaticFiles(directory=FRONTEND_DIST, html=True), name="spa")
 else:
     @app.get("/")
     async def root():
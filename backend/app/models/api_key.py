@@ -1,9 +1,10 @@
 """
 API Key Model
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from typing import Optional
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, lambda_stmt, select
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, Session
 from app.db import Base
 
 
@@ -12,15 +13,22 @@ class ApiKey(Base):
     
     __tablename__ = "api_keys"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False, index=True)
-    key_hash = Column(String(255), nullable=False)  # Bcrypt hash of the API key
-    key_prefix = Column(String(12), nullable=False)  # First 8 chars after 'atv_' for display
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
+    key_hash = Column(String(64), nullable=False, unique=True, index=True)  # HMAC-SHA256 hex digest (legacy rows: bcrypt, re-hashed on next use)
+    key_prefix = Column(String(12), nullable=False, index=True)  # First 8 chars after 'atv_' for display and legacy-key lookup
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     last_used_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     user = relationship("User", back_populates="api_key")
     
+    @classmethod
+    def by_key_hash(cls, db: Session, key_hash: str) -> Optional["ApiKey"]:
+        """Look up an API key by its HMAC digest (runs on every API-key authenticated request)."""
+        # lambda_stmt caches the built statement by code location; key_hash becomes a bound parameter
+        stmt = lambda_stmt(lambda: select(ApiKey).where(ApiKey.key_hash == key_hash))
+        return db.execute(stmt).scalars().first()
+    
     def __repr__(self):
         return f"<ApiKey(id={self.id}, user_id={self.user_id}, prefix={self.key_prefix})>"
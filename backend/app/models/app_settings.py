@@ -1,7 +1,7 @@
 """Application Settings Model"""
 
 from sqlalchemy import Column, Integer, String, Text, DateTime
-from datetime import datetime, timezone
+from sqlalchemy.sql import func
 from app.db import Base
 
 
@@ -14,7 +14,7 @@ class AppSettings(Base):
     key = Column(String(100), unique=True, nullable=False, index=True)
     value = Column(Text, nullable=True)
     description = Column(Text, nullable=True)
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     def __repr__(self):
         return f"<AppSettings(key='{self.key}', value='{self.value}')>"
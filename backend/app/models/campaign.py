@@ -1,11 +1,13 @@
 """
 Campaign and CampaignExport Models
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Text, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-from app.db import Base
+from sqlalchemy.orm import relationship, Session
+from sqlalchemy.ext.hybrid import hybrid_property
+from app.db import Base, enum_values
+from typing import Any, Dict
 import enum
 
 
@@ -40,7 +42,7 @@ class Campaign(Base):
     playbook_id = Column(Integer, ForeignKey("playbooks.id", ondelete="CASCADE"), nullable=False, index=True)
     creator_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     status = Column(
-        Enum(CampaignStatus, values_callable=lambda obj: [e.value for e in obj]), 
+        Enum(CampaignStatus, values_callable=enum_values), 
         nullable=False, 
         default=CampaignStatus.ACTIVE,
         server_default="active",
@@ -50,6 +52,10 @@ class Campaign(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     ended_at = Column(DateTime(timezone=True), nullable=True)
     
+    # Denormalized job stats, maintained by the prediction_jobs trigger (see prediction_job.py)
+    last_activity_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    running_jobs_count = Column(Integer, nullable=False, default=0, server_default='0')
+    
     # Relationships
     creator = relationship("User", foreign_keys=[creator_id])
     playbook = relationship("Playbook", back_populates="campaigns", foreign_keys=[playbook_id])
@@ -66,33 +72,35 @@ class Campaign(Base):
     
     @property
     def team(self):
-        """Inherit team access from playbook."""
+        """
+        Inherit team access from playbook.
+        
+        When listing campaigns, load with
+        selectinload(Campaign.playbook).selectinload(Playbook.team_members)
+        to avoid two lazy loads per campaign.
+        """
         return self.playbook.team_members if self.playbook else []
     
-    @property
+    @hybrid_property
     def last_activity(self):
-        """Calculate last activity timestamp from jobs."""
-        if not self.prediction_jobs:
-            return self.created_at
-        
-        latest_job = max(
-            self.prediction_jobs,
-            key=lambda j: j.completed_at or j.created_at,
-            default=None
-        )
-        
-        if latest_job:
-            return latest_job.completed_at or latest_job.created_at
-        return self.created_at
+        """Last activity timestamp (latest job completion/creation, else campaign creation)."""
+        return self.last_activity_at or self.created_at
     
-    @property
-    def running_jobs_count(self):
-        """Count jobs currently running or pending."""
-        from app.models.prediction_job import PredictionStatus
-        return sum(
-            1 for job in self.prediction_jobs 
-            if job.status in (PredictionStatus.PENDING, PredictionStatus.RUNNING)
-        )
+    @last_activity.expression
+    def last_activity(cls):
+        return func.coalesce(cls.last_activity_at, cls.created_at)
+    
+    @classmethod
+    def refresh_summary(cls, campaign_id: int, db: Session) -> Dict[str, Any]:
+        """
+        Fully recompute summary_json from the campaign's jobs.
+        
+        Job and prediction counters are kept current by the prediction_jobs
+        trigger; use this for backfills and for the derived fields the
+        trigger does not maintain (class counts, confidence, time bounds).
+        """
+        from app.services.campaign_stats import cache_campaign_stats
+        return cache_campaign_stats(campaign_id, db)
 
 
 class CampaignExport(Base):
@@ -103,15 +111,14 @@ class CampaignExport(Base):
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False, index=True)
     export_type = Column(
-        Enum(CampaignExportType, values_callable=lambda obj: [e.value for e in obj]), 
+        Enum(CampaignExportType, values_callable=enum_values), 
         nullable=False
     )
     status = Column(
-        Enum(CampaignExportStatus, values_callable=lambda obj: [e.value for e in obj]), 
+        Enum(CampaignExportStatus, values_callable=enum_values), 
         nullable=False,
         default=CampaignExportStatus.PENDING,
-        server_default="pending",
-        index=True
+        server_default="pending"
     )
     file_path = Column(String(500), nullable=True)
     progress = Column(Integer, nullable=False, default=0, server_default='0')  # 0-100
@@ -122,3 +129,8 @@ class CampaignExport(Base):
     
     # Relationships
     campaign = relationship("Campaign", back_populates="campaign_exports")
+    
+    __table_args__ = (
+        # Partial index: only the small set of exports workers still have to pick up
+        Index('ix_campaign_exports_active', 'status', postgresql_where=text("status IN ('pending', 'processing')")),
+    )
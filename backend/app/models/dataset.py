@@ -1,12 +1,17 @@
 """
 Dataset Model
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
 from pathlib import Path
-from app.db import Base
+from app.db import Base, enum_values
+from app.config import settings
+
+# Resolved once; DATA_DIR does not change at runtime
+_DATASETS_DIR = Path(settings.datasets_dir)
 
 
 class DatasetStatus(str, enum.Enum):
@@ -25,11 +30,11 @@ class Dataset(Base):
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     task_type = Column(String(50), default="detect", nullable=False)  # detect, segment, classify
-    status = Column(Enum(DatasetStatus, values_callable=lambda obj: [e.value for e in obj]), default=DatasetStatus.EMPTY.value, nullable=False)
+    status = Column(Enum(DatasetStatus, values_callable=enum_values), default=DatasetStatus.EMPTY.value, nullable=False)
     yaml_path = Column(String(512), nullable=True)  # Path to data.yaml file
     images_count = Column(Integer, default=0)
     labels_count = Column(Integer, default=0)
-    classes_json = Column(JSON, default=dict)  # Dict mapping class IDs to names: {'0': 'helmet', '1': 'vest'}
+    classes_json = Column(JSONB, nullable=False, default=dict, server_default='{}')  # Dict mapping class IDs to names: {'0': 'helmet', '1': 'vest'}
     creator_id = Column(Integer, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
@@ -45,8 +50,7 @@ class Dataset(Base):
         Returns:
             Path object to the dataset directory
         """
-        from app.config import settings
-        return Path(settings.DATA_DIR) / "datasets" / str(self.id)
+        return _DATASETS_DIR / str(self.id)
     
     def __repr__(self):
-        return f"<Dataset(id={self.id}, name={self.name}, images={self.images_count})>"
+        return f"<Dataset(id={self.id})>"
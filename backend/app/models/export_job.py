@@ -1,12 +1,12 @@
 """
 Export Job Model
 """
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, JSON, Enum as SQLEnum
+from sqlalchemy import Column, Integer, SmallInteger, String, ForeignKey, DateTime, JSON, Index, CheckConstraint, text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
+from sqlalchemy.sql import func
 import enum
 
-from app.db import Base
+from app.db import Base, enum_values
 
 
 class ExportType(str, enum.Enum):
@@ -32,19 +32,19 @@ class ExportJob(Base):
     id = Column(Integer, primary_key=True, index=True)
     prediction_job_id = Column(Integer, ForeignKey("prediction_jobs.id"), nullable=False)
     export_type = Column(
-        SQLEnum(ExportType, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(ExportType, values_callable=enum_values),
         nullable=False
     )
     status = Column(
-        SQLEnum(ExportStatus, values_callable=lambda obj: [e.value for e in obj]),
+        SQLEnum(ExportStatus, values_callable=enum_values),
         default=ExportStatus.PENDING,
         nullable=False
     )
-    progress = Column(Float, default=0.0)  # 0.0 to 100.0
+    progress = Column(SmallInteger, nullable=False, default=0, server_default='0')  # 0 to 100 (percent)
     file_path = Column(String, nullable=True)  # Path to generated export file
     options_json = Column(JSON, nullable=True)  # Export options (annotated, result_ids, etc.)
     creator_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
     error_message = Column(String, nullable=True)
 
@@ -52,5 +52,11 @@ class ExportJob(Base):
     prediction_job = relationship("PredictionJob", back_populates="export_jobs")
     creator = relationship("User")
 
+    __table_args__ = (
+        # Partial index: only the small set of jobs workers still have to pick up
+        Index('ix_export_jobs_active', 'status', postgresql_where=text("status IN ('pending', 'processing')")),
+        CheckConstraint('progress >= 0 AND progress <= 100', name='ck_export_jobs_progress'),
+    )
+
     def __repr__(self):
-        return f"<ExportJob(id={self.id}, type={self.export_type}, status={self.status})>"
+        return f"<ExportJob(id={self.id})>"
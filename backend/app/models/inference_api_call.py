@@ -2,24 +2,30 @@
 InferenceApiCall Model
 Tracks external API inference calls for usage monitoring and rate limiting
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Index, DDL, event, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db import Base
 
 
 class InferenceApiCall(Base):
-    """Track external inference API calls."""
+    """
+    Track external inference API calls.
+    
+    Range-partitioned by month on called_at; the primary key therefore
+    includes called_at. Partitions are created ahead of time by
+    ensure_inference_api_calls_partitions() (see partition_maintenance_worker).
+    """
     
     __tablename__ = "inference_api_calls"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     model_id = Column(Integer, ForeignKey("models.id", ondelete="CASCADE"), nullable=False, index=True)
     prediction_job_id = Column(Integer, ForeignKey("prediction_jobs.id", ondelete="SET NULL"), nullable=True)
     
     # Call metadata
-    called_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    called_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, server_default=func.now())
     response_time_ms = Column(Float, nullable=True)  # Response time in milliseconds
     status_code = Column(Integer, nullable=False)  # HTTP status code (200, 400, 429, etc.)
     file_count = Column(Integer, default=1)  # Number of files processed (1 for single, N for batch)
@@ -29,3 +35,54 @@ class InferenceApiCall(Base):
     user = relationship("User")
     model = relationship("Model")
     prediction_job = relationship("PredictionJob")
+    
+    __table_args__ = (
+        # Covers the per-user rate-limit window queries (count / oldest call) from the index alone
+        Index(
+            'ix_inference_api_calls_user_called_at',
+            'user_id', text('called_at DESC'),
+            postgresql_include=['status_code', 'response_time_ms']
+        ),
+        {'postgresql_partition_by': 'RANGE (called_at)'},
+    )
+
+
+# Monthly partition helpers (mirrors migration b35e4f607189 for metadata.create_all databases).
+# '%%' is DDL escaping for format()'s '%' placeholders.
+CREATE_PARTITION_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION create_inference_api_calls_partition(month_start timestamp) RETURNS void AS $$
+BEGIN
+    -- month_start is a UTC wall-clock month boundary
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %%I PARTITION OF inference_api_calls FOR VALUES FROM (%%L) TO (%%L)',
+        'inference_api_calls_' || to_char(month_start, 'YYYY_MM'),
+        month_start::text || '+00',
+        (month_start + interval '1 month')::text || '+00'
+    );
+END;
+$$ LANGUAGE plpgsql
+""")
+
+ENSURE_PARTITIONS_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION ensure_inference_api_calls_partitions(months_ahead integer) RETURNS void AS $$
+BEGIN
+    PERFORM create_inference_api_calls_partition(month_start)
+    FROM generate_series(
+        date_trunc('month', now() AT TIME ZONE 'UTC'),
+        date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => months_ahead),
+        interval '1 month'
+    ) AS month_start;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+# Catch-all so inserts never fail if maintenance falls behind
+DEFAULT_PARTITION = DDL("CREATE TABLE IF NOT EXISTS inference_api_calls_default PARTITION OF inference_api_calls DEFAULT")
+
+for ddl in (
+    DEFAULT_PARTITION,
+    CREATE_PARTITION_FUNCTION,
+    ENSURE_PARTITIONS_FUNCTION,
+    DDL("SELECT ensure_inference_api_calls_partitions(3)"),
+):
+    event.listen(InferenceApiCall.__table__, "after_create", ddl.execute_if(dialect="postgresql"))
@@ -1,13 +1,13 @@
 """
 Model Model (Trained YOLO models)
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, JSON, Boolean
+from typing import Optional
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Boolean, Index, DDL, event, lambda_stmt, select
 from sqlalchemy.sql import func, text
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
-from app.db import Base
+from sqlalchemy.orm import relationship, Session
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from app.db import Base, enum_values
 import enum
-import uuid
 
 
 class ModelStatus(str, enum.Enum):
@@ -26,23 +26,33 @@ class Model(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False, index=True)
     description = Column(String(1000), nullable=True)  # Model description
-    tags = Column(String(500), nullable=True)  # Comma-separated tags
-    api_key = Column(UUID(as_uuid=True), unique=True, nullable=False, default=uuid.uuid4, index=True)  # Secure identifier for external API access
+    tags = Column(ARRAY(Text), nullable=False, default=list, server_default='{}')  # API exposes these comma-separated
+    api_key = Column(UUID(as_uuid=True), unique=True, nullable=False, server_default=text('gen_random_uuid()'), index=True)  # Secure identifier for external API access
     base_type = Column(String(50), nullable=False)  # yolov8n, yolov8s, etc. (for training)
     inference_type = Column(String(50), nullable=False, default="yolo")  # yolo, sam3, etc. (for inference routing)
     task_type = Column(String(50), nullable=False)  # detect, classify, segment
     requires_prompts = Column(Boolean, nullable=False, server_default=text('false'))  # Whether model requires prompts (SAM3, future prompt-capable models)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
-    status = Column(Enum(ModelStatus, values_callable=lambda obj: [e.value for e in obj]), default=ModelStatus.PENDING, nullable=False)
+    status = Column(Enum(ModelStatus, values_callable=enum_values), default=ModelStatus.PENDING, nullable=False)
     artifact_path = Column(String(512), nullable=True)  # Path to best.pt
-    metrics_json = Column(JSON, default=dict)  # mAP, precision, recall, etc.
+    metrics_json = Column(JSONB, nullable=False, default=dict, server_default='{}')  # mAP, precision, recall, etc.
     validation_error = Column(String(512), nullable=True)  # Error message if validation fails
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)  # Reports ETag validator
     
     # Relationships
-    project = relationship("Project", back_populates="models")
-    training_jobs = relationship("TrainingJob", back_populates="model")
-    prediction_jobs = relationship("PredictionJob", back_populates="model")
+    project = relationship("Project", back_populates="models", lazy="joined")  # is_system / project_name read it on every model
+    # Never auto-loaded: routes that need jobs must selectinload() them explicitly.
+    # passive_deletes leaves child rows to the database instead of loading them on delete.
+    training_jobs = relationship("TrainingJob", back_populates="model", lazy="raise_on_sql", passive_deletes=True)
+    prediction_jobs = relationship("PredictionJob", back_populates="model", lazy="raise_on_sql", passive_deletes=True)
+    
+    __table_args__ = (
+        Index('ix_models_metrics_json_gin', 'metrics_json', postgresql_using='gin'),
+        Index('ix_models_tags_gin', 'tags', postgresql_using='gin'),
+        # count/max(updated_at) over ready models for the training summary ETag
+        Index('ix_models_ready_updated_at', 'updated_at', postgresql_where=text("status = 'ready'")),
+    )
     
     @property
     def is_system(self) -> bool:
@@ -59,5 +69,20 @@ class Model(Base):
         """Return the version of the model."""
         return "0.1"  # Placeholder for actual versioning logic
     
+    @classmethod
+    def by_api_key(cls, db: Session, api_key: str) -> Optional["Model"]:
+        """Look up a model by its inference API key (hot path for external inference)."""
+        # lambda_stmt caches the built statement by code location; api_key becomes a bound parameter
+        stmt = lambda_stmt(lambda: select(Model).where(Model.api_key == api_key))
+        return db.execute(stmt).scalars().first()
+    
     def __repr__(self):
-        return f"<Model(id={self.id}, name={self.name}, status={self.status})>"
+        return f"<Model(id={self.id})>"
+
+
+# gen_random_uuid() needs pgcrypto on PostgreSQL < 13 when the table is created via metadata.create_all
+event.listen(
+    Model.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pgcrypto").execute_if(dialect="postgresql")
+)
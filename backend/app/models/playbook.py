@@ -21,10 +21,10 @@ class Playbook(Base):
     
     # Relationships
     creator = relationship("User", back_populates="owned_playbooks", foreign_keys=[creator_id])
-    team_members = relationship("PlaybookMember", back_populates="playbook", cascade="all, delete-orphan")
+    team_members = relationship("PlaybookMember", back_populates="playbook", cascade="all, delete-orphan", lazy="selectin")
     campaign_form = relationship("PlaybookCampaignForm", back_populates="playbook", uselist=False, cascade="all, delete-orphan")
     playbook_models = relationship("PlaybookModel", back_populates="playbook", cascade="all, delete-orphan")
-    campaigns = relationship("Campaign", back_populates="playbook")
+    campaigns = relationship("Campaign", back_populates="playbook", lazy="raise_on_sql", passive_deletes=True)
     
     def __repr__(self):
         return f"<Playbook(id={self.id}, name={self.name})>"
@@ -54,8 +54,8 @@ class PlaybookCampaignForm(Base):
     
     __tablename__ = "playbook_session_forms"
     
-    id = Column(Integer, primary_key=True, index=True)
-    playbook_id = Column(Integer, ForeignKey("playbooks.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
+    id = Column(Integer, primary_key=True)
+    playbook_id = Column(Integer, ForeignKey("playbooks.id", ondelete="CASCADE"), nullable=False, unique=True)
     form_config_json = Column("form_config_json", Text, nullable=False, server_default='[]')
     created_by = Column(Integer, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -1,13 +1,17 @@
 """
 PredictionJob Model
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, JSON
-from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-from sqlalchemy.orm.attributes import flag_modified
-from app.db import Base
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Index, DDL, Computed, event, select
+from sqlalchemy.sql import func, text
+from sqlalchemy.orm import relationship, Session, joinedload
+from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.dialects.postgresql import JSONB
+from app.db import Base, enum_values
+from app.config import settings
+from collections import Counter, namedtuple
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Callable, TYPE_CHECKING
 import enum
 import logging
 
@@ -36,6 +40,128 @@ class PredictionStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
+_schemas_module = None
+
+
+def _prediction_schemas():
+    """app.schemas.prediction, imported once on first use (it imports this module's enums)."""
+    global _schemas_module
+    if _schemas_module is None:
+        import app.schemas.prediction as schemas
+        _schemas_module = schemas
+    return _schemas_module
+
+
+def _stats_schema(task_type: str):
+    """Stats schema class for a task type (detect is the default)."""
+    schemas = _prediction_schemas()
+    if task_type == "classify":
+        return schemas.ClassificationStats
+    if task_type == "segment":
+        return schemas.SegmentationStats
+    return schemas.DetectionStats
+
+
+@lru_cache(maxsize=None)
+def _empty_section_template(schema_cls) -> Dict[str, Any]:
+    return schema_cls().model_dump()
+
+
+def _empty_section(schema_cls) -> Dict[str, Any]:
+    """Default-valued summary section, built once per schema; containers are copied so jobs never share them."""
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in _empty_section_template(schema_cls).items()
+    }
+
+
+# ==================== FINAL STATS AGGREGATORS ====================
+# One single-pass function per task type; each returns the task-specific
+# stats fields (without timing) for PredictionJob.finalize_stats().
+# They only read the ResultRow fields, so they accept PredictionResult
+# instances as well as plain ResultRow tuples.
+# Note: inference_time_ms is not stored per result, so it is 0 for historical results.
+
+ResultRow = namedtuple('ResultRow', [
+    'boxes_json', 'scores_json', 'class_names_json', 'top_class', 'top_confidence', 'masks_json'
+])
+
+
+def _aggregate_detect(results: List['PredictionResult']) -> Dict[str, Any]:
+    total_detections = 0
+    class_counts = Counter()
+    total_confidence = 0.0
+    confidence_count = 0
+    
+    for result in results:
+        if result.boxes_json:
+            total_detections += len(result.boxes_json)
+        if result.class_names_json:
+            class_counts.update(result.class_names_json)
+        if result.scores_json:
+            total_confidence += sum(result.scores_json)
+            confidence_count += len(result.scores_json)
+    
+    return {
+        "total_detections": total_detections,
+        "class_counts": dict(class_counts),
+        "average_confidence": total_confidence / confidence_count if confidence_count > 0 else 0.0,
+    }
+
+
+def _aggregate_classify(results: List['PredictionResult']) -> Dict[str, Any]:
+    top_class_distribution = Counter()
+    total_confidence = 0.0
+    confidence_count = 0
+    
+    for result in results:
+        if result.top_class:
+            top_class_distribution[result.top_class] += 1
+        if result.top_confidence:
+            total_confidence += result.top_confidence
+            confidence_count += 1
+    
+    avg_confidence = total_confidence / confidence_count if confidence_count > 0 else 0.0
+    return {
+        "total_classifications": len(results),
+        "top_class_distribution": dict(top_class_distribution),
+        "average_top_confidence": avg_confidence,
+        # Top 10 classes by frequency
+        "top_classes_summary": [
+            {"class": cls, "confidence": avg_confidence}
+            for cls, _ in top_class_distribution.most_common(10)
+        ],
+    }
+
+
+def _aggregate_segment(results: List['PredictionResult']) -> Dict[str, Any]:
+    total_masks = 0
+    class_counts = Counter()
+    total_confidence = 0.0
+    confidence_count = 0
+    
+    for result in results:
+        if result.masks_json:
+            total_masks += len(result.masks_json)
+            class_counts.update(mask['class_name'] for mask in result.masks_json if 'class_name' in mask)
+        if result.scores_json:
+            total_confidence += sum(result.scores_json)
+            confidence_count += len(result.scores_json)
+    
+    return {
+        "total_masks": total_masks,
+        "mask_count_per_class": dict(class_counts),
+        "average_confidence": total_confidence / confidence_count if confidence_count > 0 else 0.0,
+    }
+
+
+_AGGREGATORS: Dict[str, Callable[[List['PredictionResult']], Dict[str, Any]]] = {
+    "detect": _aggregate_detect,
+    "classify": _aggregate_classify,
+    "segment": _aggregate_segment,
+}
+
+
 class PredictionJob(Base):
     """Prediction job for tracking inference tasks."""
     
@@ -44,16 +170,29 @@ class PredictionJob(Base):
     id = Column(Integer, primary_key=True, index=True)
     model_id = Column(Integer, ForeignKey("models.id"), nullable=False)
     campaign_id = Column(Integer, ForeignKey("campaigns.id", ondelete="SET NULL"), nullable=True, index=True)
-    mode = Column(Enum(PredictionMode, values_callable=lambda obj: [e.value for e in obj]), nullable=False)
+    mode = Column(Enum(PredictionMode, values_callable=enum_values), nullable=False)
     source_type = Column(String(50), nullable=False)  # image, video, rtsp
     source_ref = Column(String(512), nullable=False)  # File path or URL
-    status = Column(Enum(PredictionStatus, values_callable=lambda obj: [e.value for e in obj]), default=PredictionStatus.PENDING.value, nullable=False)
-    summary_json = Column(JSON, default=dict)  # Prediction summary stats
+    status = Column(Enum(PredictionStatus, values_callable=enum_values), default=PredictionStatus.PENDING.value, nullable=False)
+    summary_json = Column(MutableDict.as_mutable(JSONB), default=dict, server_default='{}')  # Prediction summary stats
+    # Generated from summary_json.metadata.last_activity so inactivity checks need no JSON parsing
+    last_activity_at = Column(
+        DateTime(timezone=True),
+        Computed("prediction_job_last_activity(summary_json)", persisted=True),
+        nullable=True
+    )
     error_message = Column(String(1024), nullable=True)
+    results_parquet_path = Column(String(512), nullable=True)  # Columnar archive of every detection (video jobs)
     progress = Column(Integer, nullable=True, default=0)  # 0-100 for batch/video, frame count for RTSP
-    creator_id = Column(Integer, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
+    creator_id = Column(Integer, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)  # indexed by ix_prediction_jobs_creator_status_created
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    # Wall-clock duration, generated from the timestamps so analytics can aggregate it in SQL
+    processing_time_ms = Column(
+        Float,
+        Computed("(EXTRACT(EPOCH FROM (completed_at - created_at)) * 1000)::double precision", persisted=True),
+        nullable=True
+    )
     
     # Relationships
     creator = relationship("User", back_populates="prediction_jobs", foreign_keys=[creator_id])
@@ -62,6 +201,28 @@ class PredictionJob(Base):
     results = relationship("PredictionResult", back_populates="prediction_job", cascade="all, delete-orphan")
     export_jobs = relationship("ExportJob", back_populates="prediction_job", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        Index('ix_prediction_jobs_campaign_status', 'campaign_id', 'status'),
+        # Per-user job lists and status/mode counts; mode is carried for index-only counts
+        Index(
+            'ix_prediction_jobs_creator_status_created',
+            'creator_id', 'status', 'created_at',
+            postgresql_include=['mode']
+        ),
+        # Inactivity checks only look at running sessions
+        Index(
+            'ix_prediction_jobs_running_last_activity',
+            'last_activity_at',
+            postgresql_where=text("status = 'running'")
+        ),
+        # Pollers looking for jobs to advance; completed history stays out of the index
+        Index(
+            'ix_prediction_jobs_active_created',
+            'created_at',
+            postgresql_where=text("status IN ('pending', 'running')")
+        ),
+    )
+    
     @property
     def model_name(self) -> str:
         """Get model name from relationship."""
@@ -74,14 +235,32 @@ class PredictionJob(Base):
     
     # ==================== SUMMARY JSON MANAGEMENT METHODS ====================
     
+    def _parse_section(self, key: str, section: str, parse: Callable[[Dict[str, Any]], Any]) -> Any:
+        """
+        Parse a summary_json section, reusing the last result while the section dict is unchanged.
+        
+        The cache keeps the section dict itself and compares by identity, so a
+        reloaded summary_json or a reassigned section is always re-parsed.
+        """
+        if not self.summary_json or not isinstance(self.summary_json, dict) or section not in self.summary_json:
+            return None
+        
+        data = self.summary_json[section]
+        cache = self.__dict__.setdefault('_parsed_sections', {})
+        cached = cache.get(key)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        
+        parsed = parse(data)
+        cache[key] = (data, parsed)
+        return parsed
+    
     @property
     def config(self) -> Optional['InitialConfig']:
         """Parse and return config section from summary_json."""
-        from app.schemas.prediction import InitialConfig
+        InitialConfig = _prediction_schemas().InitialConfig
         try:
-            if self.summary_json and isinstance(self.summary_json, dict) and 'config' in self.summary_json:
-                return InitialConfig(**self.summary_json['config'])
-            return None
+            return self._parse_section('config', 'config', lambda data: InitialConfig(**data))
         except Exception as e:
             logger.warning(f"Failed to parse summary_json config for job {self.id}: {e}")
             return None
@@ -89,20 +268,18 @@ class PredictionJob(Base):
     @property
     def stats(self) -> Optional['SummaryStats']:
         """Parse and return stats section from summary_json (task-specific)."""
-        from app.schemas.prediction import DetectionStats, ClassificationStats, SegmentationStats
         try:
-            if not self.summary_json or not isinstance(self.summary_json, dict) or 'stats' not in self.summary_json:
-                return None
-            
-            stats_data = self.summary_json['stats']
             task_type = self.model.task_type if self.model else "detect"
+            stats_cls = _stats_schema(task_type)
+            # Wall-clock time is the generated column, not a stored stats key
+            processing_time_ms = self.processing_time_ms
             
-            if task_type == "classify":
-                return ClassificationStats(**stats_data)
-            elif task_type == "segment":
-                return SegmentationStats(**stats_data)
-            else:  # detect
-                return DetectionStats(**stats_data)
+            def parse(data: Dict[str, Any]):
+                if processing_time_ms is not None:
+                    data = {**data, 'processing_time_ms': processing_time_ms}
+                return stats_cls(**data)
+            
+            return self._parse_section(f'stats:{task_type}:{processing_time_ms}', 'stats', parse)
         except Exception as e:
             logger.warning(f"Failed to parse summary_json stats for job {self.id}: {e}")
             return None
@@ -110,15 +287,29 @@ class PredictionJob(Base):
     @property
     def source_metadata(self) -> Optional['SourceMetadata']:
         """Parse and return metadata section from summary_json."""
-        from app.schemas.prediction import SourceMetadata
+        SourceMetadata = _prediction_schemas().SourceMetadata
         try:
-            if self.summary_json and isinstance(self.summary_json, dict) and 'metadata' in self.summary_json:
-                return SourceMetadata(**self.summary_json['metadata'])
-            return None
+            return self._parse_section('metadata', 'metadata', lambda data: SourceMetadata(**data))
         except Exception as e:
             logger.warning(f"Failed to parse summary_json metadata for job {self.id}: {e}")
             return None
-    
+
+    def get_stat(self, key: str, default: Any = None) -> Any:
+        """
+        Read a single raw value from the stats section without schema validation.
+
+        Use .stats when the validated model is needed; use get_stat() for
+        reads of individual fields (e.g. total_detections in job listings).
+
+        Args:
+            key: Stats field name
+            default: Value returned when the field or section is missing
+        """
+        summary = self.summary_json
+        if not isinstance(summary, dict):
+            return default
+        return summary.get('stats', {}).get(key, default)
+
     def initialize_summary(
         self,
         task_type: str,
@@ -131,33 +322,18 @@ class PredictionJob(Base):
             task_type: Task type (detect, classify, segment)
             **config_kwargs: Configuration parameters (confidence, prompts, etc.)
         """
-        from app.schemas.prediction import (
-            InitialConfig, DetectionStats, ClassificationStats, 
-            SegmentationStats, SourceMetadata
-        )
+        schemas = _prediction_schemas()
         
         try:
-            # Create config
-            config = InitialConfig(**config_kwargs)
+            # Only the config carries caller input worth validating
+            config = schemas.InitialConfig(**config_kwargs)
             
-            # Create empty stats based on task type
-            if task_type == "classify":
-                stats = ClassificationStats()
-            elif task_type == "segment":
-                stats = SegmentationStats()
-            else:  # detect
-                stats = DetectionStats()
-            
-            # Create empty metadata
-            metadata = SourceMetadata()
-            
-            # Set summary_json
+            # Empty stats based on task type and empty metadata come from cached defaults
             self.summary_json = {
                 "config": config.model_dump(),
-                "stats": stats.model_dump(),
-                "metadata": metadata.model_dump()
+                "stats": _empty_section(_stats_schema(task_type)),
+                "metadata": _empty_section(schemas.SourceMetadata)
             }
-            flag_modified(self, "summary_json")
             
         except Exception as e:
             logger.error(f"Failed to initialize summary_json for job {self.id}: {e}")
@@ -167,7 +343,6 @@ class PredictionJob(Base):
                 "stats": {},
                 "metadata": {}
             }
-            flag_modified(self, "summary_json")
     
     def update_stats(self, replace: bool = False, **stats_kwargs) -> None:
         """
@@ -185,22 +360,15 @@ class PredictionJob(Base):
                 # Replace entire stats section
                 self.summary_json["stats"] = stats_kwargs
             else:
-                # Merge with existing stats
-                if "stats" not in self.summary_json:
-                    self.summary_json["stats"] = {}
-                self.summary_json["stats"].update(stats_kwargs)
-            
-            flag_modified(self, "summary_json")
+                # Merge into a new section dict; assigning the key marks summary_json as changed
+                self.summary_json["stats"] = {**self.summary_json.get("stats", {}), **stats_kwargs}
             
         except Exception as e:
             logger.error(f"Failed to update stats for job {self.id}: {e}")
             # Graceful fallback - direct dict update
             if not self.summary_json:
                 self.summary_json = {}
-            if "stats" not in self.summary_json:
-                self.summary_json["stats"] = {}
-            self.summary_json["stats"].update(stats_kwargs)
-            flag_modified(self, "summary_json")
+            self.summary_json["stats"] = {**self.summary_json.get("stats", {}), **stats_kwargs}
     
     def update_metadata(self, **metadata_kwargs) -> None:
         """
@@ -213,112 +381,73 @@ class PredictionJob(Base):
             if not self.summary_json or not isinstance(self.summary_json, dict):
                 self.summary_json = {"config": {}, "stats": {}, "metadata": {}}
             
-            if "metadata" not in self.summary_json:
-                self.summary_json["metadata"] = {}
-            
-            self.summary_json["metadata"].update(metadata_kwargs)
-            flag_modified(self, "summary_json")
+            self.summary_json["metadata"] = {**self.summary_json.get("metadata", {}), **metadata_kwargs}
             
         except Exception as e:
             logger.error(f"Failed to update metadata for job {self.id}: {e}")
     
+    @classmethod
+    def finalize_from_db(cls, db: Session, job_id: int, task_type: Optional[str] = None) -> Optional['PredictionJob']:
+        """
+        Load a job and the result columns needed for aggregation, then finalize its stats.
+        
+        Results are read as ResultRow tuples rather than PredictionResult
+        instances, which keeps ORM identity/state overhead out of large jobs.
+        
+        Args:
+            db: Database session
+            job_id: PredictionJob ID
+            task_type: Task type; defaults to the model's task type
+            
+        Returns:
+            The finalized job, or None if it does not exist
+        """
+        from app.models.prediction_result import PredictionResult
+        
+        job = db.execute(
+            select(cls).options(joinedload(cls.model)).where(cls.id == job_id)
+        ).scalar_one_or_none()
+        if job is None:
+            return None
+        
+        rows = db.execute(
+            select(*(getattr(PredictionResult, field) for field in ResultRow._fields))
+            .where(PredictionResult.prediction_job_id == job_id)
+        )
+        results = [ResultRow._make(row) for row in rows]
+        
+        if task_type is None:
+            task_type = job.model.task_type if job.model else "detect"
+        job.finalize_stats(task_type=task_type, results=results)
+        return job
+    
     def finalize_stats(self, task_type: str, results: List['PredictionResult']) -> None:
         """
         Calculate and set final aggregated statistics from all results.
         
+        results must already be loaded; use finalize_from_db() to fetch the
+        job and its result columns in two queries.
+        
         Args:
             task_type: Task type (detect, classify, segment)
-            results: List of PredictionResult records
+            results: PredictionResult records or ResultRow tuples
         """
         try:
-            total_detections = 0
-            total_masks = 0
-            total_classifications = 0
-            class_counts = {}
-            top_class_distribution = {}
-            total_confidence = 0.0
-            confidence_count = 0
-            total_inference_time = 0.0
-            
-            for result in results:
-                # Accumulate inference time
-                # Note: inference_time_ms not stored in DB, will be 0 for historical results
-                
-                if task_type == "detect":
-                    if result.boxes_json:
-                        total_detections += len(result.boxes_json)
-                    if result.class_names_json:
-                        for class_name in result.class_names_json:
-                            class_counts[class_name] = class_counts.get(class_name, 0) + 1
-                    if result.scores_json:
-                        total_confidence += sum(result.scores_json)
-                        confidence_count += len(result.scores_json)
-                
-                elif task_type == "classify":
-                    total_classifications += 1
-                    if result.top_class:
-                        top_class_distribution[result.top_class] = top_class_distribution.get(result.top_class, 0) + 1
-                    if result.top_confidence:
-                        total_confidence += result.top_confidence
-                        confidence_count += 1
-                
-                elif task_type == "segment":
-                    if result.masks_json:
-                        total_masks += len(result.masks_json)
-                        for mask in result.masks_json:
-                            if 'class_name' in mask:
-                                class_name = mask['class_name']
-                                class_counts[class_name] = class_counts.get(class_name, 0) + 1
-                    if result.scores_json:
-                        total_confidence += sum(result.scores_json)
-                        confidence_count += len(result.scores_json)
-            
-            # Calculate processing time (wall-clock)
-            processing_time_ms = 0.0
-            if self.completed_at and self.created_at:
-                processing_time_ms = (self.completed_at - self.created_at).total_seconds() * 1000
+            stats_kwargs = None
+            if task_type == "detect" and self.results_parquet_path:
+                # The archive covers every frame; result rows may only be a sample
+                from app.services.result_archive_service import aggregate_detection_archive
+                try:
+                    stats_kwargs = aggregate_detection_archive(self.results_parquet_path)
+                except Exception as e:
+                    logger.warning(f"Failed to read result archive for job {self.id}, using result rows: {e}")
             
-            # Build final stats
-            avg_confidence = total_confidence / confidence_count if confidence_count > 0 else 0.0
+            if stats_kwargs is None:
+                # Unknown task types fall back to detection stats
+                stats_kwargs = _AGGREGATORS.get(task_type, _aggregate_detect)(results)
             
-            if task_type == "classify":
-                # Build top_classes_summary
-                top_classes_summary = [
-                    {"class": cls, "confidence": avg_confidence}
-                    for cls in sorted(top_class_distribution.keys(), 
-                                    key=lambda x: top_class_distribution[x], 
-                                    reverse=True)[:10]  # Top 10 classes
-                ]
-                
-                self.update_stats(
-                    replace=True,
-                    total_classifications=total_classifications,
-                    top_class_distribution=top_class_distribution,
-                    average_top_confidence=avg_confidence,
-                    top_classes_summary=top_classes_summary,
-                    inference_time_ms=total_inference_time,
-                    processing_time_ms=processing_time_ms
-                )
-            
-            elif task_type == "segment":
-                self.update_stats(
-                    replace=True,
-                    total_masks=total_masks,
-                    mask_count_per_class=class_counts,
-                    average_confidence=avg_confidence,
-                    inference_time_ms=total_inference_time,
-                    processing_time_ms=processing_time_ms
-                )
-            
-            else:  # detect
-                self.update_stats(
-                    replace=True,
-                    total_detections=total_detections,
-                    class_counts=class_counts,
-                    average_confidence=avg_confidence,
-                    inference_time_ms=total_inference_time,
-                    processing_time_ms=processing_time_ms
-                )
+            # Wall-clock processing time is the generated processing_time_ms column
+            self.update_stats(replace=True, **stats_kwargs, inference_time_ms=0.0)
         
         except Exception as e:
             logger.error(f"Failed to finalize stats for job {self.id}: {e}")
@@ -330,16 +459,12 @@ class PredictionJob(Base):
         Returns:
             True if session is inactive, False otherwise
         """
-        from app.config import settings
-        
         try:
-            source_metadata = self.source_metadata
-            if not source_metadata or not source_metadata.last_activity:
+            if not self.last_activity_at:
                 return False
             
-            last_activity_dt = datetime.fromisoformat(source_metadata.last_activity)
             timeout_minutes = settings.MANUAL_SESSION_TIMEOUT_MINUTES
-            elapsed_minutes = (datetime.now(timezone.utc) - last_activity_dt).total_seconds() / 60
+            elapsed_minutes = (datetime.now(timezone.utc) - self.last_activity_at).total_seconds() / 60
             
             return elapsed_minutes > timeout_minutes
         
@@ -358,3 +483,147 @@ class PredictionJob(Base):
     
     def __repr__(self):
         return f"<PredictionJob(id={self.id}, mode={self.mode}, status={self.status})>"
+
+
+# Parses summary_json.metadata.last_activity for the last_activity_at generated column.
+# Generated columns need an IMMUTABLE expression; pinning TimeZone makes the text cast
+# deterministic, and unparseable values become NULL instead of failing the write.
+# Mirrors migration 6a4b5c7d8e90 for databases created via metadata.create_all.
+LAST_ACTIVITY_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION prediction_job_last_activity(summary jsonb) RETURNS timestamptz AS $$
+BEGIN
+    RETURN (summary->'metadata'->>'last_activity')::timestamptz;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE SET TimeZone = 'UTC'
+""")
+
+event.listen(PredictionJob.__table__, "before_create", LAST_ACTIVITY_FUNCTION.execute_if(dialect="postgresql"))
+
+# Keeps campaigns.running_jobs_count / last_activity_at in sync with their jobs.
+# Mirrors migration 5d2e8f0a1b23 for databases created via metadata.create_all.
+CAMPAIGN_JOB_STATS_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION sync_campaign_job_stats() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.campaign_id IS NOT NULL
+       AND OLD.status IN ('pending', 'running') THEN
+        UPDATE campaigns SET running_jobs_count = running_jobs_count - 1
+        WHERE id = OLD.campaign_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.campaign_id IS NOT NULL THEN
+        UPDATE campaigns SET
+            running_jobs_count = running_jobs_count
+                + CASE WHEN NEW.status IN ('pending', 'running') THEN 1 ELSE 0 END,
+            last_activity_at = GREATEST(last_activity_at, COALESCE(NEW.completed_at, NEW.created_at))
+        WHERE id = NEW.campaign_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+CAMPAIGN_JOB_STATS_TRIGGER = DDL("""
+CREATE TRIGGER trg_prediction_jobs_campaign_stats
+AFTER INSERT OR DELETE OR UPDATE OF campaign_id, status, completed_at ON prediction_jobs
+FOR EACH ROW EXECUTE FUNCTION sync_campaign_job_stats()
+""")
+
+event.listen(PredictionJob.__table__, "after_create", CAMPAIGN_JOB_STATS_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(PredictionJob.__table__, "after_create", CAMPAIGN_JOB_STATS_TRIGGER.execute_if(dialect="postgresql"))
+
+# Incrementally maintains the job/prediction counters inside campaigns.summary_json.
+# Campaign.refresh_summary() does the full recomputation (class counts, confidence, ...).
+# Mirrors migrations 802b1c3d4e56, b1f2a3b4c567 and f5d6e7f8a901 for databases created via metadata.create_all.
+CAMPAIGN_SUMMARY_BUMP_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION bump_campaign_summary(
+    p_campaign_id integer, p_status text, p_mode text, p_model_id integer, p_summary jsonb, p_delta integer
+) RETURNS void AS $$
+DECLARE
+    status_key text := CASE p_status
+        WHEN 'completed' THEN 'completed_jobs'
+        WHEN 'running' THEN 'running_jobs'
+        WHEN 'pending' THEN 'running_jobs'
+        WHEN 'failed' THEN 'failed_jobs'
+    END;
+    task text;
+    predictions numeric := 0;
+    counters jsonb;
+BEGIN
+    IF p_campaign_id IS NULL THEN
+        RETURN;
+    END IF;
+    
+    counters := jsonb_build_object('total_jobs', p_delta, p_mode || '_jobs', p_delta);
+    IF status_key IS NOT NULL THEN
+        counters := counters || jsonb_build_object(status_key, p_delta);
+    END IF;
+    
+    -- Completed jobs contribute their prediction totals (same rules as calculate_campaign_stats)
+    IF p_status = 'completed' THEN
+        SELECT task_type INTO task FROM models WHERE id = p_model_id;
+        IF task = 'segment' THEN
+            predictions := CASE WHEN jsonb_typeof(p_summary->'total_masks') = 'number' THEN (p_summary->>'total_masks')::numeric ELSE 0 END;
+            counters := counters || jsonb_build_object('total_segmentations', p_delta * predictions);
+        ELSIF task IN ('detect', 'classify') THEN
+            predictions := CASE WHEN jsonb_typeof(p_summary->'total_predictions') = 'number' THEN (p_summary->>'total_predictions')::numeric ELSE 0 END
+                + CASE WHEN jsonb_typeof(p_summary->'total_detections') = 'number' THEN (p_summary->>'total_detections')::numeric ELSE 0 END;
+            counters := counters || jsonb_build_object(
+                CASE task WHEN 'detect' THEN 'total_detections' ELSE 'total_classifications' END,
+                p_delta * predictions
+            );
+        END IF;
+        counters := counters || jsonb_build_object('total_predictions', p_delta * predictions);
+    END IF;
+    
+    UPDATE campaigns c SET summary_json = COALESCE(c.summary_json, '{}'::jsonb) || (
+        SELECT jsonb_object_agg(key, COALESCE((c.summary_json->>key)::numeric, 0) + value::numeric)
+        FROM jsonb_each_text(counters)
+    )
+    WHERE c.id = p_campaign_id;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+CAMPAIGN_SUMMARY_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION sync_campaign_summary() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM bump_campaign_summary(OLD.campaign_id, OLD.status::text, OLD.mode::text, OLD.model_id, OLD.summary_json, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM bump_campaign_summary(NEW.campaign_id, NEW.status::text, NEW.mode::text, NEW.model_id, NEW.summary_json, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+CAMPAIGN_SUMMARY_TRIGGER = DDL("""
+CREATE TRIGGER trg_prediction_jobs_campaign_summary
+AFTER INSERT OR DELETE ON prediction_jobs
+FOR EACH ROW EXECUTE FUNCTION sync_campaign_summary()
+""")
+
+# Updates only fire when the counters can change, so progress writes never lock the campaign row.
+# summary_json and model_id only feed the counters of completed jobs.
+CAMPAIGN_SUMMARY_UPDATE_TRIGGER = DDL("""
+CREATE TRIGGER trg_prediction_jobs_campaign_summary_update
+AFTER UPDATE OF campaign_id, status, mode, model_id, summary_json ON prediction_jobs
+FOR EACH ROW
+WHEN (
+    OLD.status IS DISTINCT FROM NEW.status
+    OR OLD.campaign_id IS DISTINCT FROM NEW.campaign_id
+    OR OLD.mode IS DISTINCT FROM NEW.mode
+    OR (
+        NEW.status::text = 'completed'
+        AND (OLD.model_id IS DISTINCT FROM NEW.model_id OR OLD.summary_json IS DISTINCT FROM NEW.summary_json)
+    )
+)
+EXECUTE FUNCTION sync_campaign_summary()
+""")
+
+event.listen(PredictionJob.__table__, "after_create", CAMPAIGN_SUMMARY_BUMP_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(PredictionJob.__table__, "after_create", CAMPAIGN_SUMMARY_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(PredictionJob.__table__, "after_create", CAMPAIGN_SUMMARY_TRIGGER.execute_if(dialect="postgresql"))
+event.listen(PredictionJob.__table__, "after_create", CAMPAIGN_SUMMARY_UPDATE_TRIGGER.execute_if(dialect="postgresql"))
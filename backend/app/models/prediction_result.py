@@ -20,19 +20,19 @@ class PredictionResult(Base):
     task_type = Column(String(50), nullable=True, default="detect")  # detect, classify, segment
     
     # Detection fields
-    boxes_json = Column(JSON, default=list)  # [[x1, y1, x2, y2], ...]
-    scores_json = Column(JSON, default=list)  # [0.95, 0.87, ...]
-    classes_json = Column(JSON, default=list)  # [0, 1, 2, ...] class indices
-    class_names_json = Column(JSON, default=list)  # ["person", "car", ...] class names
+    boxes_json = Column(JSON, server_default='[]')  # [[x1, y1, x2, y2], ...]
+    scores_json = Column(JSON, server_default='[]')  # [0.95, 0.87, ...]
+    classes_json = Column(JSON, server_default='[]')  # [0, 1, 2, ...] class indices
+    class_names_json = Column(JSON, server_default='[]')  # ["person", "car", ...] class names
     
     # Classification fields
     top_class = Column(String(255), nullable=True)
     top_confidence = Column(Float, nullable=True)
-    top_classes_json = Column(JSON, default=list)  # ["class1", "class2", ...]
-    probabilities_json = Column(JSON, default=list)  # [0.95, 0.85, ...]
+    top_classes_json = Column(JSON, server_default='[]')  # ["class1", "class2", ...]
+    probabilities_json = Column(JSON, server_default='[]')  # [0.95, 0.85, ...]
     
     # Segmentation fields
-    masks_json = Column(JSON, default=list)  # [{"instance_id": 0, "class_id": 1, "mask_rle": "...", "bbox": [x1, y1, x2, y2]}, ...]
+    masks_json = Column(JSON, server_default='[]')  # [{"instance_id": 0, "class_id": 1, "mask_rle": "...", "bbox": [x1, y1, x2, y2]}, ...]
     
     # Per-result configuration (tracks inference params used for this specific result)
     config_json = Column(JSON, nullable=True, comment="Inference configuration used for this result")
@@ -4,7 +4,7 @@ Project Model
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Boolean
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.db import Base
+from app.db import Base, enum_values
 import enum
 
 
@@ -24,7 +24,7 @@ class Project(Base):
     name = Column(String(255), nullable=False, index=True)
     dataset_id = Column(Integer, ForeignKey("datasets.id"), nullable=True)
     task_type = Column(String(50), default="detect", nullable=False)
-    status = Column(Enum(ProjectStatus, values_callable=lambda obj: [e.value for e in obj]), default=ProjectStatus.CREATED.value, nullable=False)
+    status = Column(Enum(ProjectStatus, values_callable=enum_values), default=ProjectStatus.CREATED.value, nullable=False)
     is_system = Column(Boolean, default=False, nullable=False, index=True)
     creator_id = Column(Integer, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,12 +1,13 @@
 """
 Recognition Catalog Models - Face/Object recognition with CLIP embeddings
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Boolean, DDL, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from pathlib import Path
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 from app.db import Base
+from app.config import settings
 
 
 class RecognitionCatalog(Base):
@@ -18,8 +19,8 @@ class RecognitionCatalog(Base):
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     category = Column(String(100), nullable=False, index=True)  # e.g., "Office Faces", "VVIP Database"
-    image_count = Column(Integer, default=0)
-    label_count = Column(Integer, default=0)
+    image_count = Column(Integer, default=0)  # Maintained by trg_recognition_images_counters
+    label_count = Column(Integer, default=0)  # Maintained by trg_recognition_labels_counters
     creator_id = Column(Integer, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -36,7 +37,6 @@ class RecognitionCatalog(Base):
         Returns:
             Path object to the catalog directory
         """
-        from app.config import settings
         return Path(settings.DATA_DIR) / "recognition_catalogs" / str(self.id)
 
 
@@ -49,7 +49,7 @@ class RecognitionLabel(Base):
     catalog_id = Column(Integer, ForeignKey("recognition_catalogs.id", ondelete="CASCADE"), nullable=False, index=True)
     label_name = Column(String(255), nullable=False)  # e.g., "John Doe", "Safety Helmet"
     description = Column(Text, nullable=True)
-    image_count = Column(Integer, default=0)
+    image_count = Column(Integer, default=0)  # Maintained by trg_recognition_images_counters
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
@@ -72,17 +72,22 @@ class RecognitionImage(Base):
     label_id = Column(Integer, ForeignKey("recognition_labels.id", ondelete="CASCADE"), nullable=False, index=True)
     image_path = Column(String(512), nullable=False)  # Relative to DATA_DIR
     thumbnail_path = Column(String(512), nullable=True)  # Optional thumbnail
-    # CLIP ViT-B/32 produces 512-dimensional embeddings
-    embedding = Column(Vector(512), nullable=True)  # pgvector for fast similarity search
+    # CLIP ViT-B/32 produces 512-dimensional embeddings, stored as FP16 (halfvec, pgvector >= 0.7)
+    embedding = Column(HALFVEC(512), nullable=True)  # pgvector for fast similarity search
     is_processed = Column(Boolean, default=False)  # True when embedding generated
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     label = relationship("RecognitionLabel", back_populates="images")
     
-    # Index for vector similarity search (cosine distance)
+    # HNSW index for vector similarity search (cosine distance); no training step, unlike IVFFlat
     __table_args__ = (
-        Index('ix_recognition_images_embedding', 'embedding', postgresql_using='ivfflat', postgresql_ops={'embedding': 'vector_cosine_ops'}),
+        Index(
+            'ix_recognition_images_embedding', 'embedding',
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'halfvec_cosine_ops'}
+        ),
     )
 
 
@@ -105,3 +110,72 @@ class RecognitionJob(Base):
     # Relationships
     catalog = relationship("RecognitionCatalog")
     label = relationship("RecognitionLabel")
+
+
+# Keeps recognition_labels.image_count and recognition_catalogs.image_count / label_count
+# in sync with their rows. Mirrors migration 8c6d7e9f0a12 for databases created via
+# metadata.create_all.
+IMAGE_COUNTERS_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION update_catalog_counters() RETURNS trigger AS $$
+DECLARE
+    delta integer;
+    target_label integer;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        delta := 1;
+        target_label := NEW.label_id;
+    ELSE
+        delta := -1;
+        target_label := OLD.label_id;
+    END IF;
+    
+    -- A label deleted together with its images is gone already; its catalog is
+    -- adjusted by update_catalog_label_counters() instead.
+    WITH label AS (
+        UPDATE recognition_labels SET image_count = COALESCE(image_count, 0) + delta
+        WHERE id = target_label
+        RETURNING catalog_id
+    )
+    UPDATE recognition_catalogs c SET image_count = COALESCE(c.image_count, 0) + delta
+    FROM label
+    WHERE c.id = label.catalog_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+IMAGE_COUNTERS_TRIGGER = DDL("""
+CREATE TRIGGER trg_recognition_images_counters
+AFTER INSERT OR DELETE ON recognition_images
+FOR EACH ROW EXECUTE FUNCTION update_catalog_counters()
+""")
+
+LABEL_COUNTERS_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION update_catalog_label_counters() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE recognition_catalogs SET
+            label_count = COALESCE(label_count, 0) + 1,
+            image_count = COALESCE(image_count, 0) + COALESCE(NEW.image_count, 0)
+        WHERE id = NEW.catalog_id;
+    ELSE
+        UPDATE recognition_catalogs SET
+            label_count = COALESCE(label_count, 0) - 1,
+            image_count = COALESCE(image_count, 0) - COALESCE(OLD.image_count, 0)
+        WHERE id = OLD.catalog_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+LABEL_COUNTERS_TRIGGER = DDL("""
+CREATE TRIGGER trg_recognition_labels_counters
+AFTER INSERT OR DELETE ON recognition_labels
+FOR EACH ROW EXECUTE FUNCTION update_catalog_label_counters()
+""")
+
+event.listen(RecognitionImage.__table__, "after_create", IMAGE_COUNTERS_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(RecognitionImage.__table__, "after_create", IMAGE_COUNTERS_TRIGGER.execute_if(dialect="postgresql"))
+event.listen(RecognitionLabel.__table__, "after_create", LABEL_COUNTERS_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(RecognitionLabel.__table__, "after_create", LABEL_COUNTERS_TRIGGER.execute_if(dialect="postgresql"))
@@ -1,10 +1,11 @@
 """
 TrainingJob Model
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, JSON, Float
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Float, Index
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
-from app.db import Base
+from sqlalchemy.dialects.postgresql import JSONB
+from app.db import Base, enum_values
 import enum
 
 
@@ -24,12 +25,12 @@ class TrainingJob(Base):
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     model_id = Column(Integer, ForeignKey("models.id"), nullable=False)
-    status = Column(Enum(TrainingStatus, values_callable=lambda obj: [e.value for e in obj]), default=TrainingStatus.PENDING.value, nullable=False)
+    status = Column(Enum(TrainingStatus, values_callable=enum_values), default=TrainingStatus.PENDING.value, nullable=False)
     progress = Column(Float, default=0.0)  # 0.0 to 100.0
     current_epoch = Column(Integer, default=0)
     total_epochs = Column(Integer, default=100)
     logs_path = Column(String(512), nullable=True)
-    metrics_json = Column(JSON, default=dict)  # Current training metrics
+    metrics_json = Column(JSONB, default=dict, server_default='{}')  # Current training metrics
     error_message = Column(String(1024), nullable=True)
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
@@ -39,5 +40,16 @@ class TrainingJob(Base):
     project = relationship("Project", back_populates="training_jobs")
     model = relationship("Model", back_populates="training_jobs")
     
+    # Training job lists filter by project and sort newest first
+    __table_args__ = (
+        Index('ix_training_jobs_project_created', 'project_id', 'created_at'),
+        # Pending/running jobs only (startup recovery, queue polling)
+        Index(
+            'ix_training_jobs_active_created',
+            'created_at',
+            postgresql_where=text("status IN ('pending', 'running')")
+        ),
+    )
+    
     def __repr__(self):
         return f"<TrainingJob(id={self.id}, status={self.status}, progress={self.progress}%)>"
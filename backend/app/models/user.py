@@ -1,10 +1,10 @@
 """
 User Model
 """
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index, DDL, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.db import Base
+from app.db import Base, enum_check
 import enum
 
 
@@ -23,7 +23,7 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
-    role = Column(Enum(UserRole, values_callable=lambda obj: [e.value for e in obj]), default=UserRole.OPERATOR, nullable=False)
+    role = Column(String(16), default=UserRole.OPERATOR.value, nullable=False)  # UserRole value, see ck_users_role
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
@@ -41,5 +41,21 @@ class User(Base):
     api_key = relationship("ApiKey", back_populates="user", uselist=False, cascade="all, delete-orphan")
     recognition_catalogs = relationship("RecognitionCatalog", back_populates="creator")
     
+    # Trigram indexes so ILIKE '%term%' user search can use an index scan
+    __table_args__ = (
+        enum_check('role', UserRole, 'ck_users_role'),
+        Index('ix_users_email_trgm', 'email', postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}),
+        Index('ix_users_first_name_trgm', 'first_name', postgresql_using='gin', postgresql_ops={'first_name': 'gin_trgm_ops'}),
+        Index('ix_users_last_name_trgm', 'last_name', postgresql_using='gin', postgresql_ops={'last_name': 'gin_trgm_ops'}),
+    )
+    
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
+
+
+# gin_trgm_ops requires pg_trgm when the table is created via metadata.create_all
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
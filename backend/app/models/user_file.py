@@ -2,9 +2,9 @@
 User File Model
 Tracks all files uploaded by users for file management system.
 """
-from sqlalchemy import Column, Integer, String, BigInteger, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, BigInteger, Boolean, DateTime, ForeignKey, Index, DDL, event, text
+from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.db import Base
 
 
@@ -16,7 +16,7 @@ class UserFile(Base):
     __tablename__ = "user_files"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)  # covers lookups and the users cascade that include trashed files
     
     # File information
     file_path = Column(String, nullable=False)  # Full path relative to DATA_DIR
@@ -33,17 +33,43 @@ class UserFile(Base):
     deleted_at = Column(DateTime, nullable=True)
     
     # Timestamps
-    uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    uploaded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Set by trg_user_files_updated_at on every UPDATE
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=func.now(), nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="files")
     
     # Indexes for efficient queries
     __table_args__ = (
-        Index("ix_user_files_user_folder", "user_id", "folder_path"),
+        # Folder listings only ever show live files; trashed rows stay out of the index
+        Index(
+            "ix_user_files_user_folder_live", "user_id", "folder_path",
+            postgresql_where=text("is_deleted = false")
+        ),
         Index("ix_user_files_deleted_cleanup", "is_deleted", "deleted_at"),
     )
     
     def __repr__(self):
         return f"<UserFile(id={self.id}, user_id={self.user_id}, name='{self.file_name}', path='{self.folder_path}')>"
+
+
+# Stamps updated_at inside PostgreSQL on every row update.
+# Mirrors migration e8c9d0e1f234 for databases created via metadata.create_all.
+UPDATED_AT_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION set_user_files_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+UPDATED_AT_TRIGGER = DDL("""
+CREATE TRIGGER trg_user_files_updated_at
+BEFORE UPDATE ON user_files
+FOR EACH ROW EXECUTE FUNCTION set_user_files_updated_at()
+""")
+
+event.listen(UserFile.__table__, "after_create", UPDATED_AT_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(UserFile.__table__, "after_create", UPDATED_AT_TRIGGER.execute_if(dialect="postgresql"))
@@ -1,11 +1,12 @@
 """
 Workflow Models - Automation workflows for ATVISION
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Text, Boolean
+from typing import Dict, List, Optional
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Text, Boolean, Index, Computed, insert, select
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-from app.db import Base
+from sqlalchemy.sql import func, text
+from sqlalchemy.orm import relationship, Session, object_session, deferred
+from app.db import Base, enum_values, enum_check
 import enum
 
 
@@ -48,7 +49,7 @@ class Workflow(Base):
     is_active = Column(Boolean, nullable=False, default=True, server_default="true", index=True)
     is_template = Column(Boolean, nullable=False, default=False, server_default="false", index=True)
     trigger_type = Column(
-        Enum(WorkflowTriggerType, values_callable=lambda obj: [e.value for e in obj]),
+        Enum(WorkflowTriggerType, values_callable=enum_values),
         nullable=False,
         default=WorkflowTriggerType.MANUAL,
         server_default="manual",
@@ -79,9 +80,20 @@ class Workflow(Base):
     )
     
     @property
-    def last_execution(self):
-        """Get most recent execution."""
-        return self.executions[0] if self.executions else None
+    def last_execution(self) -> Optional["WorkflowExecution"]:
+        """Get most recent execution (one LIMIT 1 query unless executions are already loaded)."""
+        if 'executions' in self.__dict__:
+            return self.executions[0] if self.executions else None
+        
+        db = object_session(self)
+        if db is None:
+            return None
+        return db.execute(
+            select(WorkflowExecution)
+            .where(WorkflowExecution.workflow_id == self.id)
+            .order_by(WorkflowExecution.created_at.desc())
+            .limit(1)
+        ).scalars().first()
 
 
 class WorkflowExecution(Base):
@@ -92,14 +104,14 @@ class WorkflowExecution(Base):
     id = Column(Integer, primary_key=True, index=True)
     workflow_id = Column(Integer, ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False, index=True)
     status = Column(
-        Enum(WorkflowStatus, values_callable=lambda obj: [e.value for e in obj]),
+        String(16),  # WorkflowStatus value, see ck_workflow_executions_status
         nullable=False,
-        default=WorkflowStatus.PENDING,
+        default=WorkflowStatus.PENDING.value,
         server_default="pending",
         index=True
     )
     trigger_type = Column(
-        Enum(WorkflowTriggerType, values_callable=lambda obj: [e.value for e in obj]),
+        Enum(WorkflowTriggerType, values_callable=enum_values),
         nullable=False
     )
     trigger_data = Column(JSONB, nullable=False, default=dict, server_default='{}')  # Trigger-specific metadata
@@ -108,24 +120,35 @@ class WorkflowExecution(Base):
     error_message = Column(Text, nullable=True)
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    # Seconds from start to completion, generated by the database (NULL until both are set)
+    duration_s = Column(
+        Float,
+        Computed("(EXTRACT(EPOCH FROM (completed_at - started_at)))::double precision", persisted=True),
+        nullable=True
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     
     # Relationships
     workflow = relationship("Workflow", back_populates="executions")
+    # Must be loaded explicitly (selectinload); passive_deletes leaves step rows to the FK cascade.
     step_executions = relationship(
         "WorkflowStepExecution",
         back_populates="execution",
         cascade="all, delete-orphan",
-        order_by="WorkflowStepExecution.created_at"
+        order_by="(WorkflowStepExecution.created_at, WorkflowStepExecution.id)",  # id breaks ties between steps created in one INSERT
+        lazy="raise_on_sql",
+        passive_deletes=True
     )
     
-    @property
-    def duration(self):
-        """Calculate execution duration."""
-        if not self.started_at:
-            return None
-        end = self.completed_at or func.now()
-        return (end - self.started_at).total_seconds()
+    __table_args__ = (
+        enum_check('status', WorkflowStatus, 'ck_workflow_executions_status'),
+        # Pending/running executions only; finished history stays out of the index
+        Index(
+            'ix_workflow_executions_active_created',
+            'created_at',
+            postgresql_where=text("status IN ('pending', 'running')")
+        ),
+    )
 
 
 class WorkflowStepExecution(Base):
@@ -138,31 +161,61 @@ class WorkflowStepExecution(Base):
     node_id = Column(String(255), nullable=False, index=True)  # From workflow.nodes[].id
     node_type = Column(String(100), nullable=False)  # e.g., "train_model", "send_email"
     status = Column(
-        Enum(StepStatus, values_callable=lambda obj: [e.value for e in obj]),
+        String(16),  # StepStatus value, see ck_workflow_step_executions_status
         nullable=False,
-        default=StepStatus.PENDING,
+        default=StepStatus.PENDING.value,
         server_default="pending",
         index=True
     )
-    input_data = Column(JSONB, nullable=False, default=dict, server_default='{}')  # Node config + context
-    output_data = Column(JSONB, nullable=False, default=dict, server_default='{}')  # Results to pass to next nodes
+    # Payloads can be large and are only needed for step details, so they load on access
+    input_data = deferred(Column(JSONB, nullable=False, default=dict, server_default='{}'))  # Node config + context
+    output_data = deferred(Column(JSONB, nullable=False, default=dict, server_default='{}'))  # Results to pass to next nodes
     error_message = Column(Text, nullable=True)
     job_id = Column(Integer, nullable=True)  # Link to TrainingJob/DetectionJob/ExportJob
     job_type = Column(String(50), nullable=True)  # "training", "detection", "export"
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    # Seconds from start to completion, generated by the database (NULL until both are set)
+    duration_s = Column(
+        Float,
+        Computed("(EXTRACT(EPOCH FROM (completed_at - started_at)))::double precision", persisted=True),
+        nullable=True
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
     execution = relationship("WorkflowExecution", back_populates="step_executions")
     
-    @property
-    def duration(self):
-        """Calculate step duration."""
-        if not self.started_at:
-            return None
-        end = self.completed_at or func.now()
-        return (end - self.started_at).total_seconds()
+    __table_args__ = (
+        enum_check('status', StepStatus, 'ck_workflow_step_executions_status'),
+    )
+    
+    @classmethod
+    def create_pending(cls, db: Session, execution_id: int, nodes: List[Dict]) -> List["WorkflowStepExecution"]:
+        """
+        Create a pending step for every node of an execution in one multi-row INSERT.
+        
+        The rows are inserted but not committed; the caller owns the transaction.
+        
+        Args:
+            db: Database session
+            execution_id: Execution the steps belong to
+            nodes: Workflow nodes in execution order
+            
+        Returns:
+            Step executions in the same order as ``nodes``
+        """
+        if not nodes:
+            return []
+        
+        steps = db.scalars(
+            insert(cls).returning(cls, sort_by_parameter_order=True),
+            [
+                {"execution_id": execution_id, "node_id": node["id"], "node_type": node["type"]}
+                for node in nodes
+            ]
+        ).all()
+        return steps
 
 
 class WorkflowApiCall(Base):
@@ -171,7 +224,7 @@ class WorkflowApiCall(Base):
     __tablename__ = "workflow_api_calls"
     
     id = Column(Integer, primary_key=True, index=True)
-    workflow_id = Column(Integer, ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False, index=True)
+    workflow_id = Column(Integer, ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False)  # indexed by ix_workflow_api_calls_workflow_time
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     execution_id = Column(Integer, ForeignKey("workflow_executions.id", ondelete="SET NULL"), nullable=True)
     called_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -183,4 +236,21 @@ class WorkflowApiCall(Base):
     workflow = relationship("Workflow", back_populates="api_calls")
     user = relationship("User", foreign_keys=[user_id])
     execution = relationship("WorkflowExecution", foreign_keys=[execution_id])
-
+    
+    __table_args__ = (
+        Index('ix_workflow_api_calls_user_time', 'user_id', 'called_at'),
+        # Newest-first call history per workflow (Workflow.api_calls, time-window counts);
+        # status and timing are carried so call stats need no heap fetches
+        Index(
+            'ix_workflow_api_calls_workflow_time',
+            'workflow_id', text('called_at DESC'),
+            postgresql_include=['status_code', 'response_time_ms']
+        ),
+        # Append-only log (rows are never updated), so heap order follows called_at and a
+        # BRIN block-range summary serves time-range scans at a fraction of a B-tree's size
+        Index(
+            'ix_workflow_api_calls_called_brin', 'called_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ),
+    )
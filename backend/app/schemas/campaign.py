@@ -42,6 +42,11 @@ class CampaignResponse(BaseModel):
     running_jobs_count: int = 0
     
     model_config = {"from_attributes": True}
+    
+    @classmethod
+    def from_db(cls, obj: Any) -> "CampaignResponse":
+        """Build from a trusted ORM row without per-field validation (fields the row lacks keep their defaults)."""
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields if hasattr(obj, name)})
 
 
 class CampaignStatsResponse(BaseModel):
@@ -98,6 +103,11 @@ class CampaignExportResponse(BaseModel):
     completed_at: Optional[datetime]
     
     model_config = {"from_attributes": True}
+    
+    @classmethod
+    def from_db(cls, obj: Any) -> "CampaignExportResponse":
+        """Build from a trusted ORM row without per-field validation (fields the row lacks keep their defaults)."""
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields if hasattr(obj, name)})
 
 
 class CampaignListFilters(BaseModel):
@@ -3,14 +3,14 @@ Dataset Schemas
 """
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, Literal
 
 
 class DatasetCreate(BaseModel):
     """Schema for creating a new dataset."""
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
-    task_type: str = Field(default="detect", pattern="^(detect|segment|classify)$")
+    task_type: Literal["detect", "segment", "classify"] = "detect"
 
 
 class DatasetResponse(BaseModel):
@@ -37,8 +37,10 @@ class DatasetResponse(BaseModel):
         
         # If it's already a dict with string keys, return it
         if isinstance(v, dict):
-            # Ensure all keys are strings
-            return {str(k): str(v) for k, v in v.items()}
+            # JSONB rows almost always hold str -> str already; only copy when something needs converting
+            if all(type(key) is str and type(name) is str for key, name in v.items()):
+                return v
+            return {str(key): str(name) for key, name in v.items()}
         
         # If it's a list, convert to dict with indices as keys
         if isinstance(v, list):
@@ -80,9 +82,10 @@ class SegmentationPolygon(BaseModel):
     @classmethod
     def validate_points(cls, v: List[float]) -> List[float]:
         """Validate polygon points."""
-        if len(v) < 6:
+        count = len(v)
+        if count < 6:
             raise ValueError("Polygon must have at least 3 points (6 coordinates)")
-        if len(v) % 2 != 0:
+        if count % 2 != 0:
             raise ValueError("Points must have even number of coordinates (x,y pairs)")
         return v
 
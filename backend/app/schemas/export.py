@@ -2,7 +2,7 @@
 Export Job Schemas
 """
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List
+from typing import Any, Optional, List
 from datetime import datetime
 
 
@@ -21,10 +21,15 @@ class ExportJobResponse(BaseModel):
     prediction_job_id: int
     export_type: str
     status: str
-    progress: float
+    progress: int  # percent, 0-100
     file_path: Optional[str] = None
     options_json: Optional[dict] = None
     creator_id: int
     created_at: datetime
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
+
+    @classmethod
+    def from_db(cls, obj: Any) -> "ExportJobResponse":
+        """Build from a trusted ORM row without per-field validation (fields the row lacks keep their defaults)."""
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields if hasattr(obj, name)})
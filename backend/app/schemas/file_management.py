@@ -21,6 +21,11 @@ class FileItemResponse(BaseModel):
     deleted_at: Optional[datetime] = None
     
     model_config = {"from_attributes": True}
+    
+    @classmethod
+    def from_db(cls, obj: Any) -> "FileItemResponse":
+        """Build from a trusted ORM row without per-field validation (fields the row lacks keep their defaults)."""
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields if hasattr(obj, name)})
 
 
 class FolderTreeResponse(BaseModel):
@@ -2,9 +2,9 @@
 Model Schemas
 """
 from uuid import UUID
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 from app.models.model import ModelStatus
 
 
@@ -20,9 +20,9 @@ class BaseModelInfo(BaseModel):
 class ModelCreate(BaseModel):
     """Schema for creating a new trained model."""
     name: str = Field(..., min_length=1, max_length=255)
-    base_type: str = Field(..., pattern="^yolov8[nsmlx]$")
-    task_type: str = Field(..., pattern="^(detect|classify|segment)$")
-    inference_type: str = Field(default="yolo", pattern="^(yolo|sam3)$")
+    base_type: Literal["yolov8n", "yolov8s", "yolov8m", "yolov8l", "yolov8x"]
+    task_type: Literal["detect", "classify", "segment"]
+    inference_type: Literal["yolo", "sam3"] = "yolo"
     requires_prompts: bool = Field(default=False)
     project_id: int
 
@@ -51,15 +51,28 @@ class ModelResponse(BaseModel):
     status: ModelStatus
     metrics_json: Dict[str, Any]
     validation_error: Optional[str]
-    api_key: Optional[UUID]
+    api_key: Optional[UUID]  # pydantic-core writes UUIDs as strings in JSON mode
     created_at: datetime
     
-    @field_serializer('api_key')
-    def serialize_api_key(self, api_key: Optional[UUID], _info):
-        """Convert UUID to string for JSON serialization."""
-        return str(api_key) if api_key else None
+    @field_validator('tags', mode='before')
+    @classmethod
+    def join_tags(cls, tags: Any) -> Any:
+        """Tags are stored as an array; the API keeps the comma-separated form."""
+        return ",".join(tags) if isinstance(tags, list) else tags
     
     model_config = {"from_attributes": True}
+    
+    @classmethod
+    def from_db(cls, model: Any) -> "ModelResponse":
+        """
+        Build from a trusted Model row without per-field validation.
+        
+        model_construct skips validators, so the tags conversion done by
+        join_tags is applied here.
+        """
+        data = {name: getattr(model, name) for name in cls.model_fields}
+        data['tags'] = cls.join_tags(data['tags'])
+        return cls.model_construct(**data)
 
 
 class ModelDetail(ModelResponse):
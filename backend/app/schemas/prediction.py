@@ -2,13 +2,14 @@
 Prediction Schemas
 """
 import re
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Discriminator, Field, Tag, field_validator, ConfigDict
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Union, Literal
+from typing import Annotated, Optional, Dict, Any, List, Union, Literal
 from app.models.prediction_job import PredictionMode, PredictionStatus
 
 
 # ==================== SUMMARY JSON SCHEMA MODELS (v1) ====================
+# Only validated when a job summary section is parsed, so schemas build on first use (defer_build).
 
 class InitialConfig(BaseModel):
     """Initial configuration parameters for inference job (set at job creation)."""
@@ -21,7 +22,7 @@ class InitialConfig(BaseModel):
     skip_frames: Optional[int] = Field(default=None, ge=1, le=30, description="Process every Nth frame for video/RTSP")
     limit_frames: Optional[int] = Field(default=None, ge=1, description="Limit total frames processed")
     
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
 
 class ResultConfig(BaseModel):
@@ -33,7 +34,7 @@ class ResultConfig(BaseModel):
     prompts: Optional[List[Dict[str, Any]]] = Field(default=None, description="SAM3 prompts for segmentation")
     inference_type: Optional[str] = Field(default=None, description="Inference engine used (yolo, sam3)")
     
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
 
 class DetectionStats(BaseModel):
@@ -44,7 +45,7 @@ class DetectionStats(BaseModel):
     inference_time_ms: float = Field(default=0.0, ge=0.0, description="Total model inference time in milliseconds")
     processing_time_ms: float = Field(default=0.0, ge=0.0, description="Total wall-clock processing time in milliseconds")
     
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
 
 class ClassificationStats(BaseModel):
@@ -68,7 +69,7 @@ class ClassificationStats(BaseModel):
                 raise ValueError("Each item must have 'class' and 'confidence' keys")
         return v
     
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
 
 class SegmentationStats(BaseModel):
@@ -79,7 +80,7 @@ class SegmentationStats(BaseModel):
     inference_time_ms: float = Field(default=0.0, ge=0.0, description="Total model inference time in milliseconds")
     processing_time_ms: float = Field(default=0.0, ge=0.0, description="Total wall-clock processing time in milliseconds")
     
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
 
 class SourceMetadata(BaseModel):
@@ -99,65 +100,58 @@ class SourceMetadata(BaseModel):
     last_activity: Optional[str] = Field(default=None, description="ISO timestamp of last user activity (manual sessions)")
     inactive_since: Optional[str] = Field(default=None, description="ISO timestamp when session became inactive")
     
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
 
-# Union type for all stats variants
-SummaryStats = Union[DetectionStats, ClassificationStats, SegmentationStats]
-
-
-class SingleImageSummary(BaseModel):
-    """Summary schema for single image inference."""
-    config: InitialConfig
-    stats: SummaryStats
-    metadata: SourceMetadata = Field(default_factory=SourceMetadata)
+def _stats_variant(value: Any) -> Optional[str]:
+    """
+    Tag for a stats payload, read from the keys specific to each variant.
     
-    model_config = ConfigDict(extra="forbid")
-
-
-class BatchImageSummary(BaseModel):
-    """Summary schema for batch image inference."""
+    Stored summaries carry no explicit type field, so the union is dispatched
+    on key presence instead of trying every variant in turn. Anything that is
+    not a mapping or model gets no tag, which pydantic reports as a validation error.
+    """
+    if isinstance(value, BaseModel):
+        value = value.__dict__
+    elif not isinstance(value, dict):
+        return None
+    if 'total_classifications' in value or 'top_class_distribution' in value:
+        return 'classification'
+    if 'total_masks' in value or 'mask_count_per_class' in value:
+        return 'segmentation'
+    return 'detection'
+
+
+# Union type for all stats variants (tagged, validated against one variant only)
+SummaryStats = Annotated[
+    Union[
+        Annotated[DetectionStats, Tag('detection')],
+        Annotated[ClassificationStats, Tag('classification')],
+        Annotated[SegmentationStats, Tag('segmentation')],
+    ],
+    Discriminator(_stats_variant),
+]
+
+
+class JobSummary(BaseModel):
+    """Summary schema for image inference (single or batch); metadata is optional."""
     config: InitialConfig
     stats: SummaryStats
     metadata: SourceMetadata = Field(default_factory=SourceMetadata)
     
-    model_config = ConfigDict(extra="forbid")
-
-
-class VideoManualSummary(BaseModel):
-    """Summary schema for manual video capture (frame-by-frame)."""
-    config: InitialConfig
-    stats: SummaryStats
-    metadata: SourceMetadata
-    
-    model_config = ConfigDict(extra="forbid")
-
-
-class VideoContinuousSummary(BaseModel):
-    """Summary schema for continuous video processing."""
-    config: InitialConfig
-    stats: SummaryStats
-    metadata: SourceMetadata
-    
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
 
-class RTSPManualSummary(BaseModel):
-    """Summary schema for manual RTSP capture (preview mode)."""
-    config: InitialConfig
-    stats: SummaryStats
+class StreamJobSummary(JobSummary):
+    """Summary schema for video and RTSP processing; source metadata is required."""
     metadata: SourceMetadata
-    
-    model_config = ConfigDict(extra="forbid")
 
 
-class RTSPContinuousSummary(BaseModel):
-    """Summary schema for continuous RTSP processing."""
-    config: InitialConfig
-    stats: SummaryStats
-    metadata: SourceMetadata
-    
-    model_config = ConfigDict(extra="forbid")
+# The per-mode summaries share one schema each, so pydantic-core builds two
+# validator/serializer pairs instead of six.
+SingleImageSummary = BatchImageSummary = JobSummary
+VideoManualSummary = VideoContinuousSummary = StreamJobSummary
+RTSPManualSummary = RTSPContinuousSummary = StreamJobSummary
 
 
 # ==================== END SUMMARY JSON SCHEMA MODELS ====================
@@ -301,6 +295,7 @@ class PredictionJobResponse(BaseModel):
     creator_id: int
     created_at: datetime
     completed_at: Optional[datetime]
+    processing_time_ms: Optional[float] = None
     results_count: Optional[int] = None
     total_images: Optional[int] = None
     
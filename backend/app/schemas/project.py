@@ -3,7 +3,7 @@ Project Schemas
 """
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Literal
 from app.models.project import ProjectStatus
 from app.schemas.dataset import DatasetResponse
 from app.schemas.model import ModelResponse
@@ -13,7 +13,7 @@ class ProjectCreate(BaseModel):
     """Schema for creating a new project."""
     name: str = Field(..., min_length=1, max_length=255)
     dataset_id: Optional[int] = None
-    task_type: str = Field(default="detect", pattern="^(detect|segment|classify)$")
+    task_type: Literal["detect", "segment", "classify"] = "detect"
     is_system: bool = Field(default=False, description="System flag (cannot be set by users)")
 
 
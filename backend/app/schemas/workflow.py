@@ -156,6 +156,7 @@ class WorkflowExecutionResponse(BaseModel):
     error_message: Optional[str]
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
+    duration_s: Optional[float] = None
     created_at: datetime
     
     model_config = {"from_attributes": True}
@@ -175,6 +176,7 @@ class WorkflowStepExecutionResponse(BaseModel):
     job_type: Optional[str]
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
+    duration_s: Optional[float] = None
     created_at: datetime
     
     model_config = {"from_attributes": True}
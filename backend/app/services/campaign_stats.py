@@ -4,11 +4,43 @@ Campaign Statistics Service
 Calculates and caches aggregate statistics across all prediction jobs within a campaign.
 """
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from sqlalchemy import Numeric, case, func, select, true
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
 from app.models.campaign import Campaign
-from app.models.prediction_job import PredictionStatus, PredictionMode
+from app.models.prediction_job import PredictionJob, PredictionStatus, PredictionMode
+
+
+def _campaign_class_counts(campaign_id: int, db: Session) -> Dict[str, Any]:
+    """
+    Sum the class_counts of every job in a campaign inside PostgreSQL.
+    
+    Returns one jsonb object (class name -> total) instead of merging each
+    job's summary dict in Python; non-object class_counts and non-numeric
+    counts are ignored.
+    """
+    job_counts = PredictionJob.summary_json["class_counts"]
+    class_counts = func.jsonb_each(
+        case((func.jsonb_typeof(job_counts) == "object", job_counts), else_=func.jsonb_build_object())
+    ).table_valued("key", "value").lateral("class_counts")
+    
+    per_class = (
+        select(class_counts.c.key, func.sum(class_counts.c.value.cast(Numeric)).label("total"))
+        .select_from(PredictionJob)
+        .join(class_counts, true())
+        .where(
+            PredictionJob.campaign_id == campaign_id,
+            func.jsonb_typeof(class_counts.c.value) == "number"
+        )
+        .group_by(class_counts.c.key)
+        .subquery()
+    )
+    merged = db.execute(
+        select(func.jsonb_object_agg(per_class.c.key, per_class.c.total, type_=JSONB))
+    ).scalar()
+    return merged or {}
 
 
 def calculate_campaign_stats(campaign_id: int, db: Session) -> Dict[str, Any]:
@@ -110,11 +142,6 @@ def calculate_campaign_stats(campaign_id: int, db: Session) -> Dict[str, Any]:
             total_dets += summary.get("total_detections", 0)
             total_classifications += (summary.get("total_predictions", 0) + summary.get("total_detections", 0))
         
-        # Merge class counts
-        class_counts = summary.get("class_counts", {})
-        for class_name, count in class_counts.items():
-            stats["class_counts"][class_name] = stats["class_counts"].get(class_name, 0) + count
-        
         # Collect confidence values
         avg_conf = summary.get("average_confidence")
         if avg_conf is not None:
@@ -138,6 +165,9 @@ def calculate_campaign_stats(campaign_id: int, db: Session) -> Dict[str, Any]:
         stats["min_confidence"] = min(all_confidences)
         stats["max_confidence"] = max(all_confidences)
     
+    # Class distribution is merged by the database
+    stats["class_counts"] = _campaign_class_counts(campaign_id, db)
+    
     # Set total predictions results
     stats["total_predictions"] = total_dets
     stats["total_detections"] = total_detections
@@ -153,6 +183,11 @@ def calculate_campaign_stats(campaign_id: int, db: Session) -> Dict[str, Any]:
     return stats
 
 
+def _latest_job_id(campaign_id: int, db: Session) -> Optional[int]:
+    """Newest prediction job id in a campaign; the cached stats are keyed on it."""
+    return db.query(func.max(PredictionJob.id)).filter(PredictionJob.campaign_id == campaign_id).scalar()
+
+
 def cache_campaign_stats(campaign_id: int, db: Session) -> Dict[str, Any]:
     """
     Calculate campaign statistics and cache them in the campaign's summary_json field.
@@ -165,7 +200,10 @@ def cache_campaign_stats(campaign_id: int, db: Session) -> Dict[str, Any]:
     Returns:
         Dictionary containing cached statistics
     """
+    # Read before calculating so a job added meanwhile invalidates these stats
+    latest_job_id = _latest_job_id(campaign_id, db)
     stats = calculate_campaign_stats(campaign_id, db)
+    stats["latest_job_id"] = latest_job_id
     
     # Update campaign summary_json
     campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
@@ -186,6 +224,9 @@ def get_cached_stats(campaign_id: int, db: Session, max_age_minutes: int = 5) ->
     """
     Get cached campaign statistics if available and fresh, otherwise recalculate.
     
+    Cached stats are stale once they are older than max_age_minutes or a new
+    prediction job has been added to the campaign since they were calculated.
+    
     Args:
         campaign_id: Campaign ID to get stats for
         db: Database session
@@ -198,9 +239,9 @@ def get_cached_stats(campaign_id: int, db: Session, max_age_minutes: int = 5) ->
     if not campaign:
         return {}
     
-    # Check if cached stats exist and are recent
+    # Check if cached stats exist, are recent and cover the newest job
     cached_at_str = campaign.summary_json.get("cached_at")
-    if cached_at_str:
+    if cached_at_str and campaign.summary_json.get("latest_job_id") == _latest_job_id(campaign_id, db):
         try:
             cached_at = datetime.fromisoformat(cached_at_str)
             age_minutes = (datetime.utcnow() - cached_at).total_seconds() / 60
@@ -54,7 +54,7 @@ class ExportResultsExecutor(NodeExecutorBase):
                 prediction_job_id=prediction_job_id,
                 export_type=export_type,
                 status=ExportStatus.PENDING,
-                progress=0.0,
+                progress=0,
                 options_json={
                     "include_images": validated.include_images,
                     "include_metadata": validated.include_metadata
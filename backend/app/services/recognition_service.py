@@ -403,16 +403,36 @@ class RecognitionService:
             size: Thumbnail size (width, height)
         """
         try:
-            img = Image.open(image_path)
-            img.thumbnail(size, Image.Resampling.LANCZOS)
-            
-            # Create directory if needed
-            os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
-            
-            img.save(thumbnail_path, quality=85, optimize=True)
+            # Skip when an up-to-date thumbnail already exists
+            if (
+                os.path.exists(thumbnail_path)
+                and os.path.getmtime(thumbnail_path) >= os.path.getmtime(image_path)
+            ):
+                return
+            
+            with Image.open(image_path) as img:
+                # Let libjpeg downscale while decoding (no-op for non-JPEG formats)
+                img.draft("RGB", (size[0] * 2, size[1] * 2))
+                self.create_thumbnail_from_image(img, thumbnail_path, size)
             
         except Exception as e:
             print(f"⚠️  Failed to create thumbnail for {image_path}: {e}")
+    
+    def create_thumbnail_from_image(self, img: Image.Image, thumbnail_path: str, size: Tuple[int, int] = (256, 256)):
+        """
+        Create a thumbnail from an already opened image.
+        
+        Args:
+            img: Opened PIL image (resized in place)
+            thumbnail_path: Path to save thumbnail
+            size: Thumbnail size (width, height)
+        """
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+        
+        # Create directory if needed
+        os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
+        
+        img.save(thumbnail_path, quality=85, optimize=True)
 
 
 # Singleton instance
@@ -0,0 +1,115 @@
+"""
+Result Archive Service
+
+Columnar (Parquet) storage for per-frame detection results of long-running jobs.
+Video jobs only keep every 10th frame as PredictionResult rows; the archive
+holds every detection as packed arrays so job stats can be recomputed without
+loading or parsing JSON rows.
+"""
+from array import array
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    print("⚠️  pyarrow not available - detection result archives disabled")
+
+
+ARCHIVE_FILE_NAME = "results.parquet"
+
+
+class DetectionArchiveWriter:
+    """Accumulates detections column-wise (one entry per box) and writes them as one Parquet file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._frame_numbers = array('i')
+        self._boxes = array('f')  # x1, y1, x2, y2 per detection
+        self._scores = array('f')
+        self._class_ids = array('h')
+        self._class_names: List[str] = []
+
+    def append(
+        self,
+        frame_number: int,
+        boxes: List[List[float]],
+        scores: List[float],
+        classes: List[int],
+        class_names: List[str]
+    ) -> None:
+        """Add one frame's detections."""
+        if not boxes:
+            return
+
+        self._frame_numbers.extend([frame_number] * len(boxes))
+        for box in boxes:
+            self._boxes.extend(box[:4])
+        self._scores.extend(scores)
+        self._class_ids.extend(classes)
+        self._class_names.extend(class_names)
+
+    def write(self) -> str:
+        """
+        Write the accumulated detections to Parquet.
+
+        Returns:
+            Path of the written archive
+        """
+        boxes = np.frombuffer(self._boxes, dtype=np.float32).reshape(-1, 4)
+        table = pa.table({
+            "frame_number": pa.array(np.frombuffer(self._frame_numbers, dtype=np.int32)),
+            "x1": pa.array(boxes[:, 0]),
+            "y1": pa.array(boxes[:, 1]),
+            "x2": pa.array(boxes[:, 2]),
+            "y2": pa.array(boxes[:, 3]),
+            "score": pa.array(np.frombuffer(self._scores, dtype=np.float32)),
+            "class_id": pa.array(np.frombuffer(self._class_ids, dtype=np.int16)),
+            "class_name": pa.array(self._class_names, type=pa.string()).dictionary_encode(),
+        })
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, self.path, compression="zstd")
+        return str(self.path)
+
+
+def create_detection_archive_writer(prediction_dir: Path) -> Optional[DetectionArchiveWriter]:
+    """Return a writer for prediction_dir, or None when pyarrow is not installed."""
+    if not PYARROW_AVAILABLE:
+        return None
+    return DetectionArchiveWriter(Path(prediction_dir) / ARCHIVE_FILE_NAME)
+
+
+def aggregate_detection_archive(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Compute detection stats from an archive with Arrow compute kernels.
+
+    Args:
+        path: Archive path stored on the job
+
+    Returns:
+        Dict with total_detections, class_counts and average_confidence,
+        or None if the archive cannot be read
+    """
+    if not PYARROW_AVAILABLE or not Path(path).exists():
+        return None
+
+    table = pq.read_table(path, columns=["score", "class_name"])
+    total_detections = table.num_rows
+    if total_detections == 0:
+        return {"total_detections": 0, "class_counts": {}, "average_confidence": 0.0}
+
+    class_counts = pc.value_counts(table.column("class_name").cast(pa.string()))
+    return {
+        "total_detections": total_detections,
+        "class_counts": {
+            entry["values"]: entry["counts"] for entry in class_counts.to_pylist()
+        },
+        "average_confidence": pc.mean(table.column("score")).as_py(),
+    }
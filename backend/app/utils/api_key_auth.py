@@ -5,13 +5,14 @@ import secrets
 from typing import Optional
 from datetime import datetime, timezone
 from fastapi import Header, HTTPException, status, Depends
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 
 from app.db import get_db
 from app.models.user import User
 from app.models.api_key import ApiKey
-from app.utils.security import verify_password
+from app.utils.security import verify_password, hash_api_key
 
 
 def generate_api_key() -> tuple[str, str]:
@@ -65,15 +66,20 @@ async def get_user_from_api_key(
             headers={"WWW-Authenticate": "ApiKey"},
         )
     
-    # Query all API keys and check hashes (since we can't query by hash directly)
-    api_keys = db.query(ApiKey).all()
+    # HMAC digests are deterministic, so the key is found with one indexed lookup
+    key_hash = hash_api_key(x_api_key)
+    matched_api_key = ApiKey.by_key_hash(db, key_hash)
     
-    matched_api_key = None
-    for api_key_record in api_keys:
-        # Use verify_password since we hash API keys the same way as passwords
-        if verify_password(x_api_key, api_key_record.key_hash):
-            matched_api_key = api_key_record
-            break
+    if not matched_api_key:
+        # Legacy bcrypt-hashed keys: only the row with this key's display prefix can match
+        legacy_key = db.query(ApiKey).filter(
+            ApiKey.key_prefix == x_api_key[4:12],
+            ApiKey.key_hash.like("$2%")
+        ).first()
+        if legacy_key and await run_in_threadpool(verify_password, x_api_key, legacy_key.key_hash):
+            # Re-hash on first successful verify so later requests take the fast path
+            legacy_key.key_hash = key_hash
+            matched_api_key = legacy_key
     
     if not matched_api_key:
         raise HTTPException(
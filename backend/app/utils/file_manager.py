@@ -4,6 +4,7 @@ Handles file uploads, validation, and path management for workflows
 """
 import os
 import re
+import shutil
 from pathlib import Path
 from typing import List, Optional, Tuple
 from datetime import datetime
@@ -240,13 +241,30 @@ def delete_workflow_uploads(user_id: int, workflow_id: int) -> bool:
         if not upload_dir.exists():
             return True
         
-        # Delete all files in directory
-        for file_path in upload_dir.iterdir():
-            if file_path.is_file():
-                file_path.unlink()
+        # Delete every non-directory entry (files and symlinks; links are removed,
+        # not followed). scandir() reports the entry type from the directory listing
+        # (no stat per file), and unlinking relative to an open directory fd
+        # (unlinkat) skips re-resolving the full path each time.
+        if os.unlink in os.supports_dir_fd:
+            dir_fd = os.open(upload_dir, os.O_RDONLY)
+            try:
+                with os.scandir(dir_fd) as entries:
+                    for entry in entries:
+                        if not entry.is_dir(follow_symlinks=False):
+                            os.unlink(entry.name, dir_fd=dir_fd)
+            finally:
+                os.close(dir_fd)
+        else:
+            with os.scandir(upload_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        os.unlink(entry.path)
         
-        # Remove directory
-        upload_dir.rmdir()
+        # Remove directory; anything left over (e.g. subdirectories) goes through rmtree
+        try:
+            upload_dir.rmdir()
+        except OSError:
+            shutil.rmtree(upload_dir)
         
         logger.info(f"Deleted workflow uploads: {upload_dir}")
         return True
@@ -6,6 +6,7 @@ role-based access control (RBAC) across the ATVISION API.
 """
 from typing import List
 from fastapi import Depends, HTTPException, status
+from sqlalchemy import select, Select
 from sqlalchemy.orm import Session
 
 from app.models.user import User, UserRole
@@ -295,39 +296,52 @@ def check_project_team_access(
 # Query Helpers
 # ============================================================================
 
-def get_user_accessible_project_ids(user: User, db: Session) -> List[int]:
+def get_user_accessible_project_ids_query(user: User) -> Select:
     """
-    Get list of project IDs that user can access based on ownership and team membership.
+    Build a SELECT of project IDs that user can access.
     
-    For ADMIN: Returns all project IDs
-    For PROJECT_ADMIN: Returns owned project IDs
-    For OPERATOR: Returns project IDs where user is a team member
+    Use with ``column.in_(...)`` so the access check runs as a semi-join in
+    the database instead of binding a potentially large list of IDs.
+    
+    For ADMIN: Selects all project IDs
+    For PROJECT_ADMIN: Selects owned project IDs
+    For OPERATOR: Selects project IDs where user is a team member
     
     Args:
         user: Current user
-        db: Database session
         
     Returns:
-        List of project IDs user can access
+        SELECT statement yielding accessible project IDs
     """
     if user.role == UserRole.ADMIN:
         # Admin can access all projects
-        project_ids = db.query(Project.id).all()
-        return [p[0] for p in project_ids]
+        return select(Project.id)
     
     elif user.role == UserRole.PROJECT_ADMIN:
         # Project Admin can access their own projects
-        project_ids = db.query(Project.id).filter(
-            Project.creator_id == user.id
-        ).all()
-        return [p[0] for p in project_ids]
+        return select(Project.id).where(Project.creator_id == user.id)
     
     else:  # OPERATOR
         # Operator can access projects where they are team members
-        project_ids = db.query(ProjectMember.project_id).filter(
-            ProjectMember.user_id == user.id
-        ).all()
-        return [p[0] for p in project_ids]
+        return select(ProjectMember.project_id).where(ProjectMember.user_id == user.id)
+
+
+def get_user_accessible_project_ids(user: User, db: Session) -> List[int]:
+    """
+    Get list of project IDs that user can access based on ownership and team membership.
+    
+    For ADMIN: Returns all project IDs
+    For PROJECT_ADMIN: Returns owned project IDs
+    For OPERATOR: Returns project IDs where user is a team member
+    
+    Args:
+        user: Current user
+        db: Database session
+        
+    Returns:
+        List of project IDs user can access
+    """
+    return list(db.scalars(get_user_accessible_project_ids_query(user)))
 
 
 def filter_query_by_ownership(query, model_class, user: User):
@@ -1,8 +1,13 @@
 """
-Security Utilities - Password Hashing
+Security Utilities - Password and API Key Hashing
 """
+import hashlib
+import hmac
+
 import bcrypt
 
+from app.config import settings
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -52,3 +57,21 @@ def get_password_hash(password: str) -> str:
     
     # Return as string for database storage
     return hashed.decode('utf-8')
+
+
+def hash_api_key(api_key: str) -> str:
+    """
+    Hash an API key with HMAC-SHA256 keyed by the server secret.
+    
+    API keys are long random strings, so a slow password hash adds nothing;
+    a keyed SHA-256 is deterministic (indexable) and takes microseconds.
+    
+    Args:
+        api_key: The plain API key
+        
+    Returns:
+        64-character hex digest
+    """
+    secret = (settings.API_KEY_HMAC_SECRET or settings.SECRET_KEY).encode('utf-8')
+    return hmac.new(secret, api_key.encode('utf-8'), hashlib.sha256).hexdigest()
+
@@ -189,8 +189,6 @@ def safe_update_summary(
             logger.error(f"Unknown section '{section}' for job {job.id}")
             return False
         
-        from sqlalchemy.orm.attributes import flag_modified
-        flag_modified(job, "summary_json")
         return True
     
     except Exception as e:
@@ -3,7 +3,7 @@ campaign Cleanup Worker - Monitors and manages inactive video sessions
 """
 import threading
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from app.db import SessionLocal
 from app.models.prediction_job import PredictionJob as DetectionJob, PredictionStatus as DetectionStatus, PredictionMode as DetectionMode
@@ -59,56 +59,37 @@ class CampaignCleanupWorker:
         db = SessionLocal()
         
         try:
-            # Find all running manual video sessions
-            active_sessions = db.query(DetectionJob).filter(
-                DetectionJob.status == DetectionStatus.RUNNING,
-                DetectionJob.mode == DetectionMode.VIDEO
-            ).all()
-            
             now = datetime.now(timezone.utc)
             inactive_count = 0
             
-            for job in active_sessions:
-                # Skip if not a manual capture campaign
-                if not job.summary_json or job.summary_json.get("capture_mode") != "manual":
-                    continue
-                
-                # Check last activity time
-                last_activity_str = job.summary_json.get("last_activity")
-                if not last_activity_str:
-                    continue
+            # Running manual video sessions idle past the threshold; last_activity_at is the
+            # generated column over summary_json.metadata.last_activity
+            idle_sessions = db.query(DetectionJob).filter(
+                DetectionJob.status == DetectionStatus.RUNNING,
+                DetectionJob.mode == DetectionMode.VIDEO,
+                DetectionJob.summary_json["config"]["capture_mode"].astext == "manual",
+                DetectionJob.last_activity_at < now - timedelta(seconds=self.inactivity_threshold)
+            ).all()
+            
+            for job in idle_sessions:
+                inactive_duration = (now - job.last_activity_at).total_seconds()
                 
-                try:
-                    last_activity = datetime.fromisoformat(last_activity_str)
-                    
-                    # Calculate inactivity duration
-                    if last_activity.tzinfo is None:
-                        last_activity = last_activity.replace(tzinfo=timezone.utc)
-                    
-                    inactive_duration = (now - last_activity).total_seconds()
-                    
-                    # Mark as inactive if threshold exceeded
-                    if inactive_duration > self.inactivity_threshold:
-                        # Set inactive flag (don't auto-complete, let user decide)
-                        if not job.summary_json.get("inactive_warning_shown"):
-                            job.summary_json["inactive_warning_shown"] = True
-                            job.summary_json["inactive_since"] = now.isoformat()
-                            db.commit()
-                            inactive_count += 1
-                            print(f"⚠️  Marked video campaign #{job.id} as inactive (idle for {inactive_duration:.0f}s)")
-                        
-                        # Auto-complete after 1 hour of total inactivity
-                        if inactive_duration > 3600:
-                            job.status = DetectionStatus.COMPLETED.value
-                            job.completed_at = now
-                            job.summary_json["auto_completed"] = True
-                            job.summary_json["completion_reason"] = "Auto-completed due to prolonged inactivity (1 hour)"
-                            db.commit()
-                            print(f"✓ Auto-completed video campaign #{job.id} after 1 hour of inactivity")
+                # Set inactive flag (don't auto-complete, let user decide)
+                if not job.summary_json.get("inactive_warning_shown"):
+                    job.summary_json["inactive_warning_shown"] = True
+                    job.mark_inactive()
+                    db.commit()
+                    inactive_count += 1
+                    print(f"⚠️  Marked video campaign #{job.id} as inactive (idle for {inactive_duration:.0f}s)")
                 
-                except (ValueError, TypeError) as e:
-                    print(f"Error parsing last_activity for job {job.id}: {e}")
-                    continue
+                # Auto-complete after 1 hour of total inactivity
+                if inactive_duration > 3600:
+                    job.status = DetectionStatus.COMPLETED.value
+                    job.completed_at = now
+                    job.summary_json["auto_completed"] = True
+                    job.summary_json["completion_reason"] = "Auto-completed due to prolonged inactivity (1 hour)"
+                    db.commit()
+                    print(f"✓ Auto-completed video campaign #{job.id} after 1 hour of inactivity")
             
             if inactive_count > 0:
                 print(f"campaign cleanup: {inactive_count} campaign(s) marked inactive")
@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from PIL import Image
 from io import BytesIO
 import cv2
+from typing import Iterator, List, Optional, Tuple
 
 from app.db import SessionLocal
 from app.models.export_job import ExportJob, ExportStatus, ExportType
@@ -18,12 +19,44 @@ from app.models.prediction_result import PredictionResult
 from app.config import settings
 
 
+# Results loaded per query while exporting; bounds memory for large jobs
+RESULT_BATCH_SIZE = 1000
+
+
 class ExportWorker:
     """Worker for processing export jobs in background."""
     
     def __init__(self):
         self.active_jobs = {}  # job_id -> thread
     
+    def _result_batches(
+        self, db, prediction_job_id: int, result_ids: Optional[List[int]]
+    ) -> Tuple[int, Iterator[List[PredictionResult]]]:
+        """
+        Select the results to export and load them one batch at a time.
+        
+        Only the matching ids are read up front; each batch is a separate query,
+        so callers may commit between batches (a server-side cursor would not
+        survive the progress commits).
+        
+        Returns:
+            (total result count, iterator over result batches in id order)
+        """
+        query = db.query(PredictionResult.id).filter(
+            PredictionResult.prediction_job_id == prediction_job_id
+        )
+        if result_ids:
+            query = query.filter(PredictionResult.id.in_(result_ids))
+        ids = [row.id for row in query.order_by(PredictionResult.id)]
+        
+        def batches() -> Iterator[List[PredictionResult]]:
+            for start in range(0, len(ids), RESULT_BATCH_SIZE):
+                yield db.query(PredictionResult).filter(
+                    PredictionResult.id.in_(ids[start:start + RESULT_BATCH_SIZE])
+                ).order_by(PredictionResult.id).all()
+        
+        return len(ids), batches()
+    
     def start_export(
         self,
         export_job_id: int,
@@ -91,14 +124,9 @@ class ExportWorker:
         result_ids = options.get('result_ids')
         
         # Get results
-        query = db.query(PredictionResult).filter(
-            PredictionResult.prediction_job_id == prediction_job_id
-        )
-        if result_ids:
-            query = query.filter(PredictionResult.id.in_(result_ids))
-        results = query.all()
+        total, batches = self._result_batches(db, prediction_job_id, result_ids)
         
-        if not results:
+        if not total:
             raise ValueError("No results to export")
         
         # Create export directory
@@ -110,31 +138,33 @@ class ExportWorker:
         zip_path = export_dir / zip_filename
         
         with zipfile.ZipFile(zip_path, 'w') as zipf:
-            total = len(results)
-            for idx, result in enumerate(results):
-                # Load original image
-                image_path = Path(settings.predictions_dir) / str(prediction_job_id) / result.file_name
-                
-                if not image_path.exists():
-                    continue
-                
-                if annotated:
-                    # Draw bounding boxes
-                    img = cv2.imread(str(image_path))
-                    if img is not None:
-                        self._draw_boxes_cv2(img, result)
-                        
-                        # Save to buffer
-                        buffer = BytesIO()
-                        is_success, buffer_img = cv2.imencode(".jpg", img)
-                        if is_success:
-                            zipf.writestr(f"annotated_{result.file_name}", buffer.getvalue())
-                else:
-                    # Add original image
-                    zipf.write(image_path, arcname=result.file_name)
+            done = 0
+            for results in batches:
+                for result in results:
+                    # Load original image
+                    image_path = Path(settings.predictions_dir) / str(prediction_job_id) / result.file_name
+                    
+                    if not image_path.exists():
+                        continue
+                    
+                    if annotated:
+                        # Draw bounding boxes
+                        img = cv2.imread(str(image_path))
+                        if img is not None:
+                            self._draw_boxes_cv2(img, result)
+                    
+                            # Save to buffer
+                            buffer = BytesIO()
+                            is_success, buffer_img = cv2.imencode(".jpg", img)
+                            if is_success:
+                                zipf.writestr(f"annotated_{result.file_name}", buffer.getvalue())
+                    else:
+                        # Add original image
+                        zipf.write(image_path, arcname=result.file_name)
                 
-                # Update progress
-                export_job.progress = (idx + 1) / total * 100
+                # Update progress once per batch
+                done += len(results)
+                export_job.progress = done * 100 // total
                 db.commit()
         
         export_job.file_path = str(zip_path)
@@ -149,12 +179,7 @@ class ExportWorker:
             raise ValueError("Detection job not found")
         
         # Get results
-        query = db.query(PredictionResult).filter(
-            PredictionResult.prediction_job_id == prediction_job_id
-        )
-        if result_ids:
-            query = query.filter(PredictionResult.id.in_(result_ids))
-        results = query.all()
+        total, batches = self._result_batches(db, prediction_job_id, result_ids)
         
         # Build JSON structure
         data = {
@@ -167,24 +192,26 @@ class ExportWorker:
             "results": []
         }
         
-        total = len(results)
-        for idx, result in enumerate(results):
-            data["results"].append({
-                "id": result.id,
-                "file_name": result.file_name,
-                "frame_number": result.frame_number,
-                "detections": [
-                    {
-                        "class": result.class_names_json[i],
-                        "confidence": float(result.scores_json[i]),
-                        "box": result.boxes_json[i]
-                    }
-                    for i in range(len(result.boxes_json))
-                ]
-            })
+        done = 0
+        for results in batches:
+            for result in results:
+                data["results"].append({
+                    "id": result.id,
+                    "file_name": result.file_name,
+                    "frame_number": result.frame_number,
+                    "detections": [
+                        {
+                            "class": result.class_names_json[i],
+                            "confidence": float(result.scores_json[i]),
+                            "box": result.boxes_json[i]
+                        }
+                        for i in range(len(result.boxes_json))
+                    ]
+                })
             
-            # Update progress
-            export_job.progress = (idx + 1) / total * 100
+            # Update progress once per batch
+            done += len(results)
+            export_job.progress = done * 100 // total
             db.commit()
         
         # Save JSON
@@ -203,44 +230,46 @@ class ExportWorker:
         result_ids = options.get('result_ids')
         
         # Get results
-        query = db.query(PredictionResult).filter(
-            PredictionResult.prediction_job_id == prediction_job_id
-        )
-        if result_ids:
-            query = query.filter(PredictionResult.id.in_(result_ids))
-        results = query.all()
-        
-        # Build flat structure for CSV
-        rows = []
-        total = len(results)
-        
-        for idx, result in enumerate(results):
-            for i in range(len(result.boxes_json)):
-                box = result.boxes_json[i]
-                rows.append({
-                    'result_id': result.id,
-                    'file_name': result.file_name,
-                    'frame_number': result.frame_number,
-                    'class_name': result.class_names_json[i],
-                    'confidence': result.scores_json[i],
-                    'x1': box[0],
-                    'y1': box[1],
-                    'x2': box[2],
-                    'y2': box[3]
-                })
-            
-            # Update progress
-            export_job.progress = (idx + 1) / total * 100
-            db.commit()
+        total, batches = self._result_batches(db, prediction_job_id, result_ids)
         
-        # Create DataFrame and save
-        df = pd.DataFrame(rows)
         export_dir = Path(settings.predictions_dir) / "exports"
         export_dir.mkdir(exist_ok=True)
         csv_filename = f"detection_{prediction_job_id}_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         csv_path = export_dir / csv_filename
         
-        df.to_csv(csv_path, index=False)
+        # Write the CSV one batch at a time so rows never accumulate in memory
+        done = 0
+        header_written = False
+        for results in batches:
+            # Build flat structure for CSV
+            rows = []
+            for result in results:
+                for i in range(len(result.boxes_json)):
+                    box = result.boxes_json[i]
+                    rows.append({
+                        'result_id': result.id,
+                        'file_name': result.file_name,
+                        'frame_number': result.frame_number,
+                        'class_name': result.class_names_json[i],
+                        'confidence': result.scores_json[i],
+                        'x1': box[0],
+                        'y1': box[1],
+                        'x2': box[2],
+                        'y2': box[3]
+                    })
+            
+            if rows:
+                pd.DataFrame(rows).to_csv(csv_path, mode='a' if header_written else 'w', header=not header_written, index=False)
+                header_written = True
+            
+            # Update progress once per batch
+            done += len(results)
+            export_job.progress = done * 100 // total
+            db.commit()
+        
+        if not header_written:
+            # No detections: keep producing a (blank) CSV file as before
+            pd.DataFrame().to_csv(csv_path, index=False)
         export_job.file_path = str(csv_path)
     
     def _export_report_pdf(self, db, export_job: ExportJob, prediction_job_id: int, options: dict):
@@ -502,7 +531,7 @@ class ExportWorker:
                         print(f"Error processing image {result.file_name}: {e}")
             
             # Update progress
-            export_job.progress = (idx + 1) / total * 100
+            export_job.progress = (idx + 1) * 100 // total
             db.commit()
         
         # Build PDF
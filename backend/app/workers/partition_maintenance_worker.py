@@ -0,0 +1,75 @@
+"""
+Partition Maintenance Worker - Keeps monthly inference_api_calls partitions ahead of time
+"""
+import threading
+import time
+
+from sqlalchemy import text
+
+from app.db import SessionLocal
+
+
+class PartitionMaintenanceWorker:
+    """Worker for creating upcoming monthly partitions of inference_api_calls."""
+    
+    def __init__(self, check_interval: int = 86400, months_ahead: int = 3):  # 24 hours
+        """
+        Initialize partition maintenance worker.
+        
+        Args:
+            check_interval: How often to check partitions (seconds, default: 24 hours)
+            months_ahead: How many future months to keep partitions for
+        """
+        self.check_interval = check_interval
+        self.months_ahead = months_ahead
+        self._running = False
+        self._thread = None
+    
+    def start(self):
+        """Start the maintenance worker thread."""
+        if self._running:
+            print("Partition maintenance worker already running")
+            return
+        
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        print(f"✓ Partition maintenance worker started (check every {self.check_interval / 3600:.1f} hours)")
+    
+    def stop(self):
+        """Stop the maintenance worker thread."""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=5)
+        print("Partition maintenance worker stopped")
+    
+    def _run(self):
+        """Main worker loop."""
+        while self._running:
+            try:
+                self._ensure_partitions()
+            except Exception as e:
+                print(f"Error in partition maintenance worker: {e}")
+            
+            # Sleep for check interval
+            time.sleep(self.check_interval)
+    
+    def _ensure_partitions(self):
+        """Create the current and upcoming monthly partitions if missing."""
+        db = SessionLocal()
+        
+        try:
+            db.execute(
+                text("SELECT ensure_inference_api_calls_partitions(:months_ahead)"),
+                {"months_ahead": self.months_ahead}
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"Error during partition maintenance: {e}")
+        finally:
+            db.close()
+
+
+# Create global instance
+partition_maintenance_worker = PartitionMaintenanceWorker()
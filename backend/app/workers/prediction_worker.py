@@ -13,6 +13,7 @@ from app.models.prediction_job import PredictionJob, PredictionStatus
 from app.models.prediction_result import PredictionResult
 from app.services.yolo_service import yolo_service
 from app.services.sam3_service import sam3_service
+from app.services.result_archive_service import create_detection_archive_writer, aggregate_detection_archive
 from app.config import settings
 import time
 
@@ -208,8 +209,7 @@ class PredictionWorker:
                         top_class_distribution={result.top_class: 1} if result.top_class else {},
                         average_top_confidence=result.top_confidence or 0.0,
                         top_classes_summary=[{"class": result.top_class, "confidence": result.top_confidence or 0.0}] if result.top_class else [],
-                        inference_time_ms=result.inference_time_ms or 0.0,
-                        processing_time_ms=0.0
+                        inference_time_ms=result.inference_time_ms or 0.0
                     )
                 elif task_type == "segment":
                     job.update_stats(
@@ -217,8 +217,7 @@ class PredictionWorker:
                         total_masks=total_detections,
                         mask_count_per_class=class_counts,
                         average_confidence=avg_confidence,
-                        inference_time_ms=result.inference_time_ms or 0.0,
-                        processing_time_ms=0.0
+                        inference_time_ms=result.inference_time_ms or 0.0
                     )
                 else:  # detect
                     job.update_stats(
@@ -226,8 +225,7 @@ class PredictionWorker:
                         total_detections=total_detections,
                         class_counts=class_counts,
                         average_confidence=avg_confidence,
-                        inference_time_ms=result.inference_time_ms or 0.0,
-                        processing_time_ms=0.0
+                        inference_time_ms=result.inference_time_ms or 0.0
                     )
             except Exception as stats_err:
                 print(f"Failed to update stats, using fallback: {stats_err}")
@@ -428,6 +426,8 @@ class PredictionWorker:
             total_confidence = 0.0
             confidence_count = 0
             frames_processed = 0
+            # Every detection goes to the columnar archive; only every 10th frame becomes a result row
+            archive = create_detection_archive_writer(prediction_dir) if task_type == "detect" else None
             
             # Store every 10th result to reduce database load
             for frame_number, result, frame in yolo_service.detect_video(
@@ -476,6 +476,9 @@ class PredictionWorker:
                         )
                         db.add(prediction_result)
                     
+                    if archive:
+                        archive.append(frame_number, result.boxes, result.scores, result.classes, result.class_names)
+                    
                     # Aggregate stats for all frames
                     total_detections += len(result.boxes)
                     for class_name in result.class_names:
@@ -504,8 +507,7 @@ class PredictionWorker:
                             total_detections=total_detections,
                             class_counts=class_counts,
                             average_confidence=avg_conf,
-                            inference_time_ms=0.0,
-                            processing_time_ms=0.0
+                            inference_time_ms=0.0
                         )
                         job.update_metadata(
                             frames_processed=frames_processed,
@@ -524,6 +526,18 @@ class PredictionWorker:
             
             avg_confidence = total_confidence / confidence_count if confidence_count > 0 else 0
             
+            # Final detection stats come from the archive; the in-memory counters are the fallback
+            if archive:
+                try:
+                    job.results_parquet_path = archive.write()
+                    archive_stats = aggregate_detection_archive(job.results_parquet_path)
+                    if archive_stats is not None:
+                        total_detections = archive_stats["total_detections"]
+                        class_counts = archive_stats["class_counts"]
+                        avg_confidence = archive_stats["average_confidence"]
+                except Exception as archive_err:
+                    print(f"Failed to write result archive for video job {job_id}: {archive_err}")
+            
             # Use update_stats and update_metadata instead of direct dictionary assignment
             try:
                 job.update_stats(
@@ -531,8 +545,7 @@ class PredictionWorker:
                     total_detections=total_detections,
                     class_counts=class_counts,
                     average_confidence=avg_confidence,
-                    inference_time_ms=0.0,
-                    processing_time_ms=0.0
+                    inference_time_ms=0.0
                 )
                 job.update_metadata(
                     frames_processed=frames_processed
@@ -668,6 +681,7 @@ class PredictionWorker:
             
             # Get stop flag
             stop_flag = self._active_jobs[job_id]['stop_flag']
+            last_progress_write = 0.0
             
             # Process RTSP stream (using video detection with RTSP URL)
             print(f"Starting RTSP detection for job {job_id}, confidence={confidence}, skip_frames={skip_frames}")
@@ -763,27 +777,28 @@ class PredictionWorker:
                 if frames_processed % 5 == 0:
                     print(f"RTSP job {job_id}: Processed {frames_processed} frames, {total_detections} detections")
                 
-                # Commit frequently for RTSP (every 5 frames for faster UI updates)
+                # Commit results every 5 frames; the job row is rewritten at most once per interval
                 if frames_processed % 5 == 0:
-                    db.refresh(job)
-                    job.progress = frames_processed  # Store frame count for RTSP
-                    
-                    # Update stats and metadata incrementally (don't replace config)
-                    try:
-                        avg_conf = total_confidence / confidence_count if confidence_count > 0 else 0
-                        job.update_stats(
-                            replace=True,
-                            total_detections=total_detections,
-                            class_counts=class_counts,
-                            average_confidence=avg_conf,
-                            inference_time_ms=0.0,
-                            processing_time_ms=0.0
-                        )
-                        job.update_metadata(
-                            frames_processed=frames_processed
-                        )
-                    except Exception as update_err:
-                        print(f"Failed to update RTSP progress stats/metadata: {update_err}")
+                    if time.monotonic() - last_progress_write >= settings.RTSP_PROGRESS_INTERVAL_SECONDS:
+                        last_progress_write = time.monotonic()
+                        db.refresh(job)
+                        job.progress = frames_processed  # Store frame count for RTSP
+                        
+                        # Update stats and metadata incrementally (don't replace config)
+                        try:
+                            avg_conf = total_confidence / confidence_count if confidence_count > 0 else 0
+                            job.update_stats(
+                                replace=True,
+                                total_detections=total_detections,
+                                class_counts=class_counts,
+                                average_confidence=avg_conf,
+                                inference_time_ms=0.0
+                            )
+                            job.update_metadata(
+                                frames_processed=frames_processed
+                            )
+                        except Exception as update_err:
+                            print(f"Failed to update RTSP progress stats/metadata: {update_err}")
                     
                     db.commit()
             
@@ -804,8 +819,7 @@ class PredictionWorker:
                     total_detections=total_detections,
                     class_counts=class_counts,
                     average_confidence=avg_confidence,
-                    inference_time_ms=0.0,
-                    processing_time_ms=0.0
+                    inference_time_ms=0.0
                 )
                 job.update_metadata(
                     frames_processed=frames_processed
@@ -1057,8 +1071,7 @@ class PredictionWorker:
                     total_masks=total_masks,
                     mask_count_per_class={},
                     average_confidence=0.0,
-                    inference_time_ms=0.0,
-                    processing_time_ms=0.0
+                    inference_time_ms=0.0
                 )
             except Exception as stats_err:
                 print(f"Failed to update stats, using fallback: {stats_err}")
@@ -1200,8 +1213,7 @@ class PredictionWorker:
                                 total_masks=total_masks,
                                 mask_count_per_class={},
                                 average_confidence=0.0,
-                                inference_time_ms=0.0,
-                                processing_time_ms=0.0
+                                inference_time_ms=0.0
                             )
                             job.update_metadata(
                                 frames_processed=frames_processed,
@@ -1228,8 +1240,7 @@ class PredictionWorker:
                     total_masks=total_masks,
                     mask_count_per_class={},
                     average_confidence=0.0,
-                    inference_time_ms=0.0,
-                    processing_time_ms=0.0
+                    inference_time_ms=0.0
                 )
                 job.update_metadata(
                     frames_processed=frames_processed
@@ -1294,6 +1305,7 @@ class PredictionWorker:
             total_masks = 0
             stop_flag = self._active_jobs[job_id]['stop_flag']
             last_cleanup = time.time()
+            last_progress_write = 0.0
             
             while cap.isOpened():
                 if stop_flag.is_set():
@@ -1365,21 +1377,23 @@ class PredictionWorker:
                     frames_processed += 1
                     
                     if frames_processed % 10 == 0:
-                        # Update stats and metadata incrementally (don't replace config)
-                        try:
-                            job.update_stats(
-                                replace=True,
-                                total_masks=total_masks,
-                                mask_count_per_class={},
-                                average_confidence=0.0,
-                                inference_time_ms=0.0,
-                                processing_time_ms=0.0
-                            )
-                            job.update_metadata(
-                                frames_processed=frames_processed
-                            )
-                        except Exception as update_err:
-                            print(f"Failed to update SAM3 RTSP progress: {update_err}")
+                        # Results are committed every 10 frames; the job row at most once per interval
+                        if time.monotonic() - last_progress_write >= settings.RTSP_PROGRESS_INTERVAL_SECONDS:
+                            last_progress_write = time.monotonic()
+                            # Update stats and metadata incrementally (don't replace config)
+                            try:
+                                job.update_stats(
+                                    replace=True,
+                                    total_masks=total_masks,
+                                    mask_count_per_class={},
+                                    average_confidence=0.0,
+                                    inference_time_ms=0.0
+                                )
+                                job.update_metadata(
+                                    frames_processed=frames_processed
+                                )
+                            except Exception as update_err:
+                                print(f"Failed to update SAM3 RTSP progress: {update_err}")
                         
                         db.commit()
                 
@@ -1402,8 +1416,7 @@ class PredictionWorker:
                     total_masks=total_masks,
                     mask_count_per_class={},
                     average_confidence=0.0,
-                    inference_time_ms=0.0,
-                    processing_time_ms=0.0
+                    inference_time_ms=0.0
                 )
                 job.update_metadata(
                     frames_processed=frames_processed
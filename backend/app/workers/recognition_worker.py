@@ -8,7 +8,7 @@ from typing import List
 from pathlib import Path
 
 from app.db import SessionLocal
-from app.models.recognition import RecognitionJob, RecognitionImage, RecognitionLabel, RecognitionCatalog
+from app.models.recognition import RecognitionJob, RecognitionImage
 from app.services.recognition_service import get_recognition_service
 from app.config import settings
 
@@ -124,25 +124,6 @@ class RecognitionWorker:
             job.completed_at = datetime.now(timezone.utc)
             db.commit()
             
-            # Update label and catalog image counts
-            label = db.query(RecognitionLabel).filter(RecognitionLabel.id == label_id).first()
-            if label:
-                processed_count = db.query(RecognitionImage).filter(
-                    RecognitionImage.label_id == label_id,
-                    RecognitionImage.is_processed == True
-                ).count()
-                label.image_count = processed_count
-            
-            catalog = db.query(RecognitionCatalog).filter(RecognitionCatalog.id == catalog_id).first()
-            if catalog:
-                total_images = db.query(RecognitionImage).join(RecognitionLabel).filter(
-                    RecognitionLabel.catalog_id == catalog_id,
-                    RecognitionImage.is_processed == True
-                ).count()
-                catalog.image_count = total_images
-            
-            db.commit()
-            
             print(f"✅ Job {job_id} completed: {job.processed_images} processed, {job.failed_images} failed")
             
         except Exception as e:
@@ -179,12 +179,22 @@ class WorkflowWorker:
             
             logger.info(f"Executing workflow {workflow_id} with {total_steps} steps")
             
+            # Create every step record up front in a single round trip
+            step_executions = dict(zip(
+                execution_order,
+                WorkflowStepExecution.create_pending(
+                    db, execution_id, [engine.nodes[node_id] for node_id in execution_order]
+                )
+            ))
+            db.commit()
+            
             # Execute nodes in order
             for node_id in execution_order:
                 # Check for cancellation
                 db.refresh(execution)
                 if execution.status == WorkflowStatus.CANCELLED:
                     logger.info(f"Execution {execution_id} cancelled by user")
+                    self._skip_unreached_steps(db, execution_id)
                     break
                 
                 # Check timeout
@@ -198,23 +208,11 @@ class WorkflowWorker:
                     failed_nodes
                 )
                 
-                node = engine.nodes[node_id]
-                node_type = node['type']
-                
-                # Create step execution record
-                step_execution = WorkflowStepExecution(
-                    execution_id=execution_id,
-                    node_id=node_id,
-                    node_type=node_type,
-                    status=StepStatus.SKIPPED if should_skip else StepStatus.PENDING,
-                    input_data={},
-                    output_data={}
-                )
-                db.add(step_execution)
-                db.commit()
-                db.refresh(step_execution)
+                step_execution = step_executions[node_id]
                 
                 if should_skip:
+                    # Flushed with the next commit
+                    step_execution.status = StepStatus.SKIPPED
                     logger.info(f"Skipping node {node_id}: {skip_reason}")
                     completed_steps += 1
                     continue
@@ -244,7 +242,7 @@ class WorkflowWorker:
                     # For now, fail entire workflow on any node failure
                     raise
                 
-                # Update progress
+                # Update progress; the step's completion is flushed in the same transaction
                 progress = int((completed_steps / total_steps) * 100)
                 execution.progress = progress
                 execution.context = context_mgr.to_dict()
@@ -271,6 +269,7 @@ class WorkflowWorker:
                     execution.status = WorkflowStatus.FAILED
                     execution.error_message = str(e)
                     execution.completed_at = datetime.now(timezone.utc)
+                    self._skip_unreached_steps(db, execution_id)
                     db.commit()
             except Exception as commit_error:
                 logger.error(f"Failed to update execution status: {str(commit_error)}")
@@ -282,6 +281,19 @@ class WorkflowWorker:
             if execution_id in self._execution_contexts:
                 del self._execution_contexts[execution_id]
     
+    def _skip_unreached_steps(self, db: Session, execution_id: int) -> None:
+        """
+        Mark steps that were created up front but never started as skipped.
+        
+        Args:
+            db: Database session
+            execution_id: Execution ID
+        """
+        db.query(WorkflowStepExecution).filter(
+            WorkflowStepExecution.execution_id == execution_id,
+            WorkflowStepExecution.status == StepStatus.PENDING
+        ).update({WorkflowStepExecution.status: StepStatus.SKIPPED}, synchronize_session=False)
+    
     def _execute_node(
         self,
         db: Session,
@@ -323,7 +335,7 @@ class WorkflowWorker:
             step_execution.status = StepStatus.COMPLETED
             step_execution.output_data = {"status": "skipped"}
             step_execution.completed_at = datetime.now(timezone.utc)
-            db.commit()
+            # Committed together with the execution progress by the caller
             return
         
         # Execute node with full input data (includes _dependency_outputs)
@@ -346,11 +358,10 @@ class WorkflowWorker:
             # Wait for job completion
             self._wait_for_job_completion(db, job_id, job_type, step_execution)
         
-        # Update step execution
+        # Update step execution (committed together with the execution progress by the caller)
         step_execution.status = StepStatus.COMPLETED
         step_execution.output_data = output_data
         step_execution.completed_at = datetime.now(timezone.utc)
-        db.commit()
         
         # Merge output into context
         context_mgr.update(engine.merge_context(